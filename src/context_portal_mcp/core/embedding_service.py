@@ -3,6 +3,8 @@ from sentence_transformers import SentenceTransformer
 from typing import List, Optional
 import logging
 import threading
+
+import numpy as np
 from chromadb.utils import embedding_functions # Added for Chroma EmbeddingFunction
 
 log = logging.getLogger(__name__)
@@ -35,7 +37,7 @@ def _load_model(model_name: str = DEFAULT_MODEL_NAME) -> SentenceTransformer:
         raise RuntimeError(f"Model '{model_name}' could not be loaded.")
     return _model
 
-def get_embedding(text: str, model_name: str = DEFAULT_MODEL_NAME) -> List[float]:
+def get_embedding(text: str, model_name: str = DEFAULT_MODEL_NAME) -> np.ndarray:
     """
     Generates an embedding for the given text using the specified Sentence Transformer model.
     The model is loaded on the first call.
@@ -45,8 +47,11 @@ def get_embedding(text: str, model_name: str = DEFAULT_MODEL_NAME) -> List[float
         model_name: The name of the Sentence Transformer model to use.
 
     Returns:
-        A list of floats representing the embedding vector.
-        
+        A float32 NumPy array representing the embedding vector. Keeping the
+        model's native dtype avoids a list-of-Python-floats round trip (~6x
+        larger in memory) on the way into the vector store; call .tolist() if
+        JSON serialization is needed.
+
     Raises:
         RuntimeError: If the model cannot be loaded or embedding fails.
     """
@@ -54,12 +59,39 @@ def get_embedding(text: str, model_name: str = DEFAULT_MODEL_NAME) -> List[float
     try:
         log.debug(f"Generating embedding for text snippet (first 50 chars): '{text[:50]}...'")
         embedding = model.encode(text, convert_to_tensor=False) # Returns numpy array
-        # Ensure it's a standard list of floats for broader compatibility (e.g., JSON serialization)
-        return embedding.tolist() 
+        return np.ascontiguousarray(embedding, dtype=np.float32)
     except Exception as e:
         log.error(f"Failed to generate embedding for text: {e}", exc_info=True)
         raise RuntimeError(f"Embedding generation failed: {e}")
 
+def get_embeddings(texts: List[str], model_name: str = DEFAULT_MODEL_NAME) -> np.ndarray:
+    """
+    Generates embeddings for several texts in a single model.encode call.
+
+    Sentence Transformers batches the forward pass internally, so one call
+    over N texts is far cheaper than N get_embedding calls. Use this for the
+    batch logging handlers; single lookups should keep using get_embedding.
+
+    Args:
+        texts: The input texts to embed. Must be non-empty.
+        model_name: The name of the Sentence Transformer model to use.
+
+    Returns:
+        A 2D float32 NumPy array of shape (len(texts), dim), row i being the
+        embedding of texts[i].
+
+    Raises:
+        RuntimeError: If the model cannot be loaded or embedding fails.
+    """
+    model = _load_model(model_name)
+    try:
+        log.debug(f"Generating embeddings for {len(texts)} texts in one batch")
+        embeddings = model.encode(list(texts), convert_to_tensor=False)
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+    except Exception as e:
+        log.error(f"Failed to generate batch embeddings: {e}", exc_info=True)
+        raise RuntimeError(f"Batch embedding generation failed: {e}")
+
 def get_chroma_embedding_function(model_name: str = DEFAULT_MODEL_NAME) -> embedding_functions.SentenceTransformerEmbeddingFunction:
     """
     Returns a ChromaDB-compatible SentenceTransformerEmbeddingFunction instance
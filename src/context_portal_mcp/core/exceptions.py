@@ -13,7 +13,26 @@ class ConfigurationError(ContextPortalError):
     pass
 
 class ToolArgumentError(ContextPortalError):
-    """Exception raised for invalid MCP tool arguments."""
-    pass
+    """Exception raised for invalid MCP tool arguments.
+
+    Optionally carries the structured error list from a pydantic
+    ValidationError (``e.errors()``). Rendering the details is deferred to
+    ``__str__`` so the cost of formatting is only paid if the exception is
+    actually displayed or logged, not on every raise.
+    """
+
+    def __init__(self, message: str, errors: list = None):
+        super().__init__(message)
+        self.message = message
+        self.errors = errors
+
+    def __str__(self) -> str:
+        if not self.errors:
+            return self.message
+        details = "; ".join(
+            f"{'.'.join(str(loc) for loc in err.get('loc', ())) or '<root>'}: {err.get('msg', '')}"
+            for err in self.errors
+        )
+        return f"{self.message}: {details}"
 
 # Add more specific exceptions as needed
\ No newline at end of file
@@ -3,13 +3,17 @@
 import sqlite3
 import json
 import os
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from queue import Queue
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta, timezone
 
 from alembic.config import Config
 from alembic import command
+from pydantic import TypeAdapter
 import logging
 
 from ..core.config import get_database_path
@@ -20,10 +24,58 @@ import inspect # For getting the current file's path to find templates
 
 log = logging.getLogger(__name__)
 
+# Validates a whole result set of custom_data rows in one C-level call instead
+# of per-row models.CustomData(...) construction in the hot row loops.
+_CUSTOM_DATA_LIST_ADAPTER = TypeAdapter(List[models.CustomData])
+
 # --- Connection Handling ---
 
 _connections: Dict[str, sqlite3.Connection] = {}
 
+# One write lock per workspace. The shared per-workspace connection is opened
+# with check_same_thread=False and handlers run via asyncio.to_thread, so two
+# threads can otherwise interleave statements inside the same implicit
+# transaction -- corrupting the contiguous-id arithmetic around
+# last_insert_rowid() and each other's commit/rollback. Every function that
+# writes through the shared connection must hold this lock around its
+# statement+commit sequence, not just the batch writers.
+_write_locks: Dict[str, threading.Lock] = {}
+_write_locks_guard = threading.Lock()
+
+# Monotonic write counter per workspace, bumped on every write-lock release.
+# Read caches key on it (see mcp_handlers) so any write attempt orphans their
+# stale entries; bumping on failed writes too only over-invalidates.
+_write_versions: Dict[str, int] = {}
+
+class _WorkspaceWriteLock:
+    """Pairs a workspace's write lock with its write-version bump on release."""
+    __slots__ = ("_workspace_id", "_lock")
+
+    def __init__(self, workspace_id: str, lock: threading.Lock):
+        self._workspace_id = workspace_id
+        self._lock = lock
+
+    def __enter__(self) -> "_WorkspaceWriteLock":
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        _write_versions[self._workspace_id] = _write_versions.get(self._workspace_id, 0) + 1
+        self._lock.release()
+        return False
+
+def _get_write_lock(workspace_id: str) -> _WorkspaceWriteLock:
+    """Returns the write lock serializing writes on a workspace's shared connection."""
+    with _write_locks_guard:
+        lock = _write_locks.get(workspace_id)
+        if lock is None:
+            lock = _write_locks[workspace_id] = threading.Lock()
+    return _WorkspaceWriteLock(workspace_id, lock)
+
+def get_write_version(workspace_id: str) -> int:
+    """Returns the workspace's monotonic write counter (0 before any write)."""
+    return _write_versions.get(workspace_id, 0)
+
 def get_db_connection(workspace_id: str) -> sqlite3.Connection:
     """Gets or creates a database connection for the given workspace."""
     """Gets or creates a database connection for the given workspace."""
@@ -37,7 +89,15 @@ def get_db_connection(workspace_id: str) -> sqlite3.Connection:
     run_migrations(db_path, Path(workspace_id))
 
     try:
-        conn = sqlite3.connect(db_path, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+        # check_same_thread=False: handlers increasingly run DB work via
+        # asyncio.to_thread, so the shared connection must be usable from
+        # executor threads. CPython's sqlite3 links a serialized SQLite, which
+        # makes cross-thread use of one connection safe at the C level.
+        conn = sqlite3.connect(
+            db_path,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            check_same_thread=False
+        )
         conn.row_factory = sqlite3.Row # Access columns by name
         _connections[workspace_id] = conn
         return conn
@@ -46,11 +106,68 @@ def get_db_connection(workspace_id: str) -> sqlite3.Connection:
     except sqlite3.Error as e:
         raise DatabaseError(f"Failed to connect to database for {workspace_id} at {db_path}: {e}")
 
+# Pools of read-only connections (per workspace) used for concurrent SELECTs.
+# Under WAL mode SQLite supports multiple simultaneous readers, and sqlite3's
+# C-level statement stepping releases the GIL, so independent queries issued
+# from a thread pool genuinely overlap.
+_READER_POOL_SIZE = 4
+_reader_pools: Dict[str, Queue] = {}
+_reader_pools_lock = threading.Lock()
+
+def _get_reader_pool(workspace_id: str) -> Queue:
+    """Gets or creates the pool of read-only connections for the given workspace."""
+    pool = _reader_pools.get(workspace_id)
+    if pool is None:
+        with _reader_pools_lock:
+            pool = _reader_pools.get(workspace_id)
+            if pool is None:
+                db_path = get_database_path(workspace_id)
+                pool = Queue()
+                try:
+                    for _ in range(_READER_POOL_SIZE):
+                        conn = sqlite3.connect(
+                            f"file:{db_path.as_posix()}?mode=ro",
+                            uri=True,
+                            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+                            check_same_thread=False
+                        )
+                        conn.row_factory = sqlite3.Row
+                        pool.put(conn)
+                except sqlite3.Error as e:
+                    while not pool.empty():
+                        pool.get_nowait().close()
+                    raise DatabaseError(f"Failed to open read-only connections for {workspace_id}: {e}")
+                _reader_pools[workspace_id] = pool
+    return pool
+
+def _run_readonly_query(workspace_id: str, sql: str, params: Tuple) -> List[sqlite3.Row]:
+    """Executes a SELECT on a pooled read-only connection and returns all rows."""
+    pool = _get_reader_pool(workspace_id)
+    conn = pool.get()
+    try:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+    finally:
+        pool.put(conn)
+
+def _close_reader_pool(workspace_id: str):
+    """Closes and discards all read-only connections for the given workspace."""
+    with _reader_pools_lock:
+        pool = _reader_pools.pop(workspace_id, None)
+    if pool is not None:
+        while not pool.empty():
+            pool.get_nowait().close()
+
 def close_db_connection(workspace_id: str):
     """Closes the database connection for the given workspace, if open."""
     if workspace_id in _connections:
         _connections[workspace_id].close()
         del _connections[workspace_id]
+    _close_reader_pool(workspace_id)
 
 def close_all_connections():
     """Closes all active database connections."""
@@ -167,6 +284,30 @@ def run_migrations(db_path: Path, project_root_dir: Path):
 
 # --- Helper functions for history ---
 
+class _LazyJSONDict(dict):
+    """Dict whose 'content' value is decoded from its JSON string on first access.
+
+    History rows are often inspected only for metadata (version/timestamp);
+    deferring the json.loads of 'content' avoids paying for the parse unless
+    the caller actually reads it.
+    """
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if key == "content" and isinstance(value, (str, bytes)):
+            value = json.loads(value)
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def copy(self):
+        self["content"]  # Materialize so plain-dict copies carry the decoded content
+        return dict(self)
+
 def _get_latest_context_version(cursor: sqlite3.Cursor, table_name: str) -> int:
     """Retrieves the latest version number from a history table."""
     try:
@@ -226,55 +367,56 @@ def update_product_context(workspace_id: str, update_args: models.UpdateContextA
     """Updates the product context using either full content or a patch."""
     conn = get_db_connection(workspace_id)
     cursor = None # Initialize cursor for finally block
-    try:
-        cursor = conn.cursor()
-        # Fetch current content to log to history
-        cursor.execute("SELECT content FROM product_context WHERE id = 1")
-        current_row = cursor.fetchone()
-        if not current_row:
-            raise DatabaseError("Product context row not found for updating (cannot log history).")
-        current_content_dict = json.loads(current_row['content'])
-
-        # Determine new content
-        new_final_content = {}
-        if update_args.content is not None:
-            new_final_content = update_args.content
-        elif update_args.patch_content is not None:
-            # Apply patch to a copy of current_content_dict for the new state
-            new_final_content = current_content_dict.copy()
-            # Iterate over patch_content to handle __DELETE__ sentinel
-            for key, value in update_args.patch_content.items():
-                if value == "__DELETE__":
-                    new_final_content.pop(key, None)  # Remove key, do nothing if key not found
-                else:
-                    new_final_content[key] = value
-        else:
-            # This case should be prevented by Pydantic model validation, but handle defensively
-            raise ValueError("No content or patch_content provided for update.")
-
-        # Log previous version to history
-        latest_version = _get_latest_context_version(cursor, "product_context_history")
-        new_version = latest_version + 1
-        _add_context_history_entry(
-            cursor,
-            "product_context_history",
-            new_version,
-            current_content_dict, # Log the content *before* the update
-            "update_product_context" # Basic change source
-        )
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            # Fetch current content to log to history
+            cursor.execute("SELECT content FROM product_context WHERE id = 1")
+            current_row = cursor.fetchone()
+            if not current_row:
+                raise DatabaseError("Product context row not found for updating (cannot log history).")
+            current_content_dict = json.loads(current_row['content'])
+
+            # Determine new content
+            new_final_content = {}
+            if update_args.content is not None:
+                new_final_content = update_args.content
+            elif update_args.patch_content is not None:
+                # Apply patch to a copy of current_content_dict for the new state
+                new_final_content = current_content_dict.copy()
+                # Iterate over patch_content to handle __DELETE__ sentinel
+                for key, value in update_args.patch_content.items():
+                    if value == "__DELETE__":
+                        new_final_content.pop(key, None)  # Remove key, do nothing if key not found
+                    else:
+                        new_final_content[key] = value
+            else:
+                # This case should be prevented by Pydantic model validation, but handle defensively
+                raise ValueError("No content or patch_content provided for update.")
+
+            # Log previous version to history
+            latest_version = _get_latest_context_version(cursor, "product_context_history")
+            new_version = latest_version + 1
+            _add_context_history_entry(
+                cursor,
+                "product_context_history",
+                new_version,
+                current_content_dict, # Log the content *before* the update
+                "update_product_context" # Basic change source
+            )
 
-        # Update the main product_context table
-        new_content_json = json.dumps(new_final_content)
-        cursor.execute("UPDATE product_context SET content = ? WHERE id = 1", (new_content_json,))
+            # Update the main product_context table
+            new_content_json = json.dumps(new_final_content)
+            cursor.execute("UPDATE product_context SET content = ? WHERE id = 1", (new_content_json,))
 
-        conn.commit()
-        # No need to check rowcount here as history is logged regardless of content identity
-    except (sqlite3.Error, TypeError, json.JSONDecodeError, DatabaseError) as e: # Added DatabaseError
-        conn.rollback()
-        raise DatabaseError(f"Failed to update product_context: {e}")
-    finally:
-        if cursor:
-            cursor.close()
+            conn.commit()
+            # No need to check rowcount here as history is logged regardless of content identity
+        except (sqlite3.Error, TypeError, json.JSONDecodeError, DatabaseError) as e: # Added DatabaseError
+            conn.rollback()
+            raise DatabaseError(f"Failed to update product_context: {e}")
+        finally:
+            if cursor:
+                cursor.close()
 
 def get_active_context(workspace_id: str) -> models.ActiveContext:
     """Retrieves the active context."""
@@ -299,53 +441,54 @@ def update_active_context(workspace_id: str, update_args: models.UpdateContextAr
     """Updates the active context using either full content or a patch."""
     conn = get_db_connection(workspace_id)
     cursor = None # Initialize cursor for finally block
-    try:
-        cursor = conn.cursor()
-        # Fetch current content to log to history
-        cursor.execute("SELECT content FROM active_context WHERE id = 1")
-        current_row = cursor.fetchone()
-        if not current_row:
-            raise DatabaseError("Active context row not found for updating (cannot log history).")
-        current_content_dict = json.loads(current_row['content'])
-
-        # Determine new content
-        new_final_content = {}
-        if update_args.content is not None:
-            new_final_content = update_args.content
-        elif update_args.patch_content is not None:
-            new_final_content = current_content_dict.copy()
-            # Iterate over patch_content to handle __DELETE__ sentinel
-            for key, value in update_args.patch_content.items():
-                if value == "__DELETE__":
-                    new_final_content.pop(key, None)  # Remove key, do nothing if key not found
-                else:
-                    new_final_content[key] = value
-        else:
-            # This case should be prevented by Pydantic model validation, but handle defensively
-            raise ValueError("No content or patch_content provided for update.")
-
-        # Log previous version to history
-        latest_version = _get_latest_context_version(cursor, "active_context_history")
-        new_version = latest_version + 1
-        _add_context_history_entry(
-            cursor,
-            "active_context_history",
-            new_version,
-            current_content_dict, # Log the content *before* the update
-            "update_active_context" # Basic change source
-        )
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            # Fetch current content to log to history
+            cursor.execute("SELECT content FROM active_context WHERE id = 1")
+            current_row = cursor.fetchone()
+            if not current_row:
+                raise DatabaseError("Active context row not found for updating (cannot log history).")
+            current_content_dict = json.loads(current_row['content'])
+
+            # Determine new content
+            new_final_content = {}
+            if update_args.content is not None:
+                new_final_content = update_args.content
+            elif update_args.patch_content is not None:
+                new_final_content = current_content_dict.copy()
+                # Iterate over patch_content to handle __DELETE__ sentinel
+                for key, value in update_args.patch_content.items():
+                    if value == "__DELETE__":
+                        new_final_content.pop(key, None)  # Remove key, do nothing if key not found
+                    else:
+                        new_final_content[key] = value
+            else:
+                # This case should be prevented by Pydantic model validation, but handle defensively
+                raise ValueError("No content or patch_content provided for update.")
+
+            # Log previous version to history
+            latest_version = _get_latest_context_version(cursor, "active_context_history")
+            new_version = latest_version + 1
+            _add_context_history_entry(
+                cursor,
+                "active_context_history",
+                new_version,
+                current_content_dict, # Log the content *before* the update
+                "update_active_context" # Basic change source
+            )
 
-        # Update the main active_context table
-        new_content_json = json.dumps(new_final_content)
-        cursor.execute("UPDATE active_context SET content = ? WHERE id = 1", (new_content_json,))
+            # Update the main active_context table
+            new_content_json = json.dumps(new_final_content)
+            cursor.execute("UPDATE active_context SET content = ? WHERE id = 1", (new_content_json,))
 
-        conn.commit()
-    except (sqlite3.Error, TypeError, json.JSONDecodeError, DatabaseError) as e: # Added DatabaseError
-        conn.rollback()
-        raise DatabaseError(f"Failed to update active context: {e}")
-    finally:
-        if cursor:
-            cursor.close()
+            conn.commit()
+        except (sqlite3.Error, TypeError, json.JSONDecodeError, DatabaseError) as e: # Added DatabaseError
+            conn.rollback()
+            raise DatabaseError(f"Failed to update active context: {e}")
+        finally:
+            if cursor:
+                cursor.close()
 
 # --- Add more CRUD functions for other models (ActiveContext, Decision, etc.) --- # Example: log_decision
 def log_decision(workspace_id: str, decision_data: models.Decision) -> models.Decision:
@@ -364,20 +507,64 @@ def log_decision(workspace_id: str, decision_data: models.Decision) -> models.De
         decision_data.implementation_details,
         tags_json
     )
-    try:
-        cursor = conn.cursor()
-        cursor.execute(sql, params)
-        decision_id = cursor.lastrowid
-        conn.commit()
-        # Return the full decision object including the new ID
-        decision_data.id = decision_id
-        return decision_data
-    except sqlite3.Error as e:
-        conn.rollback()
-        raise DatabaseError(f"Failed to log decision: {e}")
-    finally:
-        if cursor:
-            cursor.close()
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            decision_id = cursor.lastrowid
+            conn.commit()
+            # Return the full decision object including the new ID
+            decision_data.id = decision_id
+            return decision_data
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to log decision: {e}")
+        finally:
+            if cursor:
+                cursor.close()
+
+def log_decisions_many(workspace_id: str, decisions: List[models.Decision]) -> List[models.Decision]:
+    """
+    Logs multiple decisions with one executemany under a single transaction,
+    paying one commit/fsync for the whole batch instead of one per row.
+    """
+    if not decisions:
+        return []
+    conn = get_db_connection(workspace_id)
+    cursor = None # Initialize cursor for finally block
+    sql = """
+        INSERT INTO decisions (timestamp, summary, rationale, implementation_details, tags)
+        VALUES (?, ?, ?, ?, ?)
+    """
+    rows = [
+        (
+            d.timestamp,
+            d.summary,
+            d.rationale,
+            d.implementation_details,
+            json.dumps(d.tags) if d.tags is not None else None
+        )
+        for d in decisions
+    ]
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            cursor.executemany(sql, rows)
+            # executemany does not expose per-row ids; within this transaction the
+            # batch occupies a contiguous id range ending at last_insert_rowid().
+            cursor.execute("SELECT last_insert_rowid()")
+            last_id = cursor.fetchone()[0]
+            conn.commit()
+            first_id = last_id - len(decisions) + 1
+            for offset, decision in enumerate(decisions):
+                decision.id = first_id + offset
+            return decisions
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to log decision batch: {e}")
+        finally:
+            if cursor:
+                cursor.close()
 
 def get_decisions(
     workspace_id: str,
@@ -501,18 +688,19 @@ def delete_decision_by_id(workspace_id: str, decision_id: int) -> bool:
     conn = get_db_connection(workspace_id)
     cursor = None # Initialize cursor for finally block
     sql = "DELETE FROM decisions WHERE id = ?"
-    try:
-        cursor = conn.cursor()
-        cursor.execute(sql, (decision_id,))
-        # The FTS table 'decisions_fts' should be updated automatically by its AFTER DELETE trigger.
-        conn.commit()
-        return cursor.rowcount > 0
-    except sqlite3.Error as e:
-        conn.rollback()
-        raise DatabaseError(f"Failed to delete decision with ID {decision_id}: {e}")
-    finally:
-        if cursor:
-            cursor.close()
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            cursor.execute(sql, (decision_id,))
+            # The FTS table 'decisions_fts' should be updated automatically by its AFTER DELETE trigger.
+            conn.commit()
+            return cursor.rowcount > 0
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to delete decision with ID {decision_id}: {e}")
+        finally:
+            if cursor:
+                cursor.close()
 
 def log_progress(workspace_id: str, progress_data: models.ProgressEntry) -> models.ProgressEntry:
     """Logs a new progress entry."""
@@ -528,20 +716,53 @@ def log_progress(workspace_id: str, progress_data: models.ProgressEntry) -> mode
         progress_data.description,
         progress_data.parent_id
     )
-    try:
-        cursor = conn.cursor()
-        cursor.execute(sql, params)
-        progress_id = cursor.lastrowid
-        conn.commit()
-        progress_data.id = progress_id
-        return progress_data
-    except sqlite3.Error as e:
-        conn.rollback()
-        # Consider checking for foreign key constraint errors if parent_id is invalid
-        raise DatabaseError(f"Failed to log progress entry: {e}")
-    finally:
-        if cursor:
-            cursor.close()
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            progress_id = cursor.lastrowid
+            conn.commit()
+            progress_data.id = progress_id
+            return progress_data
+        except sqlite3.Error as e:
+            conn.rollback()
+            # Consider checking for foreign key constraint errors if parent_id is invalid
+            raise DatabaseError(f"Failed to log progress entry: {e}")
+        finally:
+            if cursor:
+                cursor.close()
+
+def log_progress_many(workspace_id: str, entries: List[models.ProgressEntry]) -> List[models.ProgressEntry]:
+    """
+    Logs multiple progress entries with one executemany under a single
+    transaction; see log_decisions_many for the id-assignment approach.
+    """
+    if not entries:
+        return []
+    conn = get_db_connection(workspace_id)
+    cursor = None # Initialize cursor for finally block
+    sql = """
+        INSERT INTO progress_entries (timestamp, status, description, parent_id)
+        VALUES (?, ?, ?, ?)
+    """
+    rows = [(e.timestamp, e.status, e.description, e.parent_id) for e in entries]
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            cursor.executemany(sql, rows)
+            cursor.execute("SELECT last_insert_rowid()")
+            last_id = cursor.fetchone()[0]
+            conn.commit()
+            first_id = last_id - len(entries) + 1
+            for offset, entry in enumerate(entries):
+                entry.id = first_id + offset
+            return entries
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to log progress entry batch: {e}")
+        finally:
+            if cursor:
+                cursor.close()
 
 def get_progress(
     workspace_id: str,
@@ -632,17 +853,18 @@ def update_progress_entry(workspace_id: str, update_args: models.UpdateProgressA
     params_list.append(update_args.progress_id)
     params = tuple(params_list)
 
-    try:
-        cursor = conn.cursor()
-        cursor.execute(sql, params)
-        conn.commit()
-        return cursor.rowcount > 0 # Return True if one row was updated
-    except sqlite3.Error as e:
-        conn.rollback()
-        raise DatabaseError(f"Failed to update progress entry with ID {update_args.progress_id}: {e}")
-    finally:
-        if cursor:
-            cursor.close()
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            conn.commit()
+            return cursor.rowcount > 0 # Return True if one row was updated
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to update progress entry with ID {update_args.progress_id}: {e}")
+        finally:
+            if cursor:
+                cursor.close()
 
 def delete_progress_entry_by_id(workspace_id: str, progress_id: int) -> bool:
     """
@@ -653,17 +875,18 @@ def delete_progress_entry_by_id(workspace_id: str, progress_id: int) -> bool:
     conn = get_db_connection(workspace_id)
     cursor = None # Initialize cursor for finally block
     sql = "DELETE FROM progress_entries WHERE id = ?"
-    try:
-        cursor = conn.cursor()
-        cursor.execute(sql, (progress_id,))
-        conn.commit()
-        return cursor.rowcount > 0 # Return True if one row was deleted
-    except sqlite3.Error as e:
-        conn.rollback()
-        raise DatabaseError(f"Failed to delete progress entry with ID {progress_id}: {e}")
-    finally:
-        if cursor:
-            cursor.close()
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            cursor.execute(sql, (progress_id,))
+            conn.commit()
+            return cursor.rowcount > 0 # Return True if one row was deleted
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to delete progress entry with ID {progress_id}: {e}")
+        finally:
+            if cursor:
+                cursor.close()
 
 def log_system_pattern(workspace_id: str, pattern_data: models.SystemPattern) -> models.SystemPattern:
     """Logs or updates a system pattern. Uses INSERT OR REPLACE based on unique name."""
@@ -682,26 +905,69 @@ def log_system_pattern(workspace_id: str, pattern_data: models.SystemPattern) ->
         pattern_data.description,
         tags_json
     )
-    try:
-        cursor = conn.cursor()
-        cursor.execute(sql, params)
-        # We might not get the correct lastrowid if it replaced,
-        # so we need to query back to get the ID if needed.
-        # For now, just commit and assume success or handle error.
-        # If returning the model with ID is critical, add a SELECT query here.
-        conn.commit()
-        # Query back to get the ID (optional, adds overhead)
-        cursor.execute("SELECT id FROM system_patterns WHERE name = ?", (pattern_data.name,))
-        row = cursor.fetchone()
-        if row:
-            pattern_data.id = row['id']
-        return pattern_data # Return original data, possibly updated with ID
-    except sqlite3.Error as e:
-        conn.rollback()
-        raise DatabaseError(f"Failed to log system pattern '{pattern_data.name}': {e}")
-    finally:
-        if cursor:
-            cursor.close()
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            # We might not get the correct lastrowid if it replaced,
+            # so we need to query back to get the ID if needed.
+            # For now, just commit and assume success or handle error.
+            # If returning the model with ID is critical, add a SELECT query here.
+            conn.commit()
+            # Query back to get the ID (optional, adds overhead)
+            cursor.execute("SELECT id FROM system_patterns WHERE name = ?", (pattern_data.name,))
+            row = cursor.fetchone()
+            if row:
+                pattern_data.id = row['id']
+            return pattern_data # Return original data, possibly updated with ID
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to log system pattern '{pattern_data.name}': {e}")
+        finally:
+            if cursor:
+                cursor.close()
+
+def log_system_patterns_many(workspace_id: str, patterns: List[models.SystemPattern]) -> List[models.SystemPattern]:
+    """
+    Logs or updates multiple system patterns with one executemany under a
+    single transaction. INSERT OR REPLACE may overwrite rows keyed by the
+    unique name, so ids are queried back per name after the commit rather
+    than derived from last_insert_rowid().
+    """
+    if not patterns:
+        return []
+    conn = get_db_connection(workspace_id)
+    cursor = None # Initialize cursor for finally block
+    sql = """
+        INSERT OR REPLACE INTO system_patterns (timestamp, name, description, tags)
+        VALUES (?, ?, ?, ?)
+    """
+    with _get_write_lock(workspace_id):
+        try:
+            rows = [
+                (
+                    p.timestamp,
+                    p.name,
+                    p.description,
+                    json.dumps(p.tags) if p.tags is not None else None
+                )
+                for p in patterns
+            ]
+            cursor = conn.cursor()
+            cursor.executemany(sql, rows)
+            conn.commit()
+            for pattern in patterns:
+                cursor.execute("SELECT id FROM system_patterns WHERE name = ?", (pattern.name,))
+                row = cursor.fetchone()
+                if row:
+                    pattern.id = row['id']
+            return patterns
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to log system pattern batch: {e}")
+        finally:
+            if cursor:
+                cursor.close()
 
 def get_system_patterns(
     workspace_id: str,
@@ -762,17 +1028,71 @@ def delete_system_pattern_by_id(workspace_id: str, pattern_id: int) -> bool:
     cursor = None # Initialize cursor for finally block
     sql = "DELETE FROM system_patterns WHERE id = ?"
     # Note: System patterns do not currently have an FTS table, so no trigger concerns here.
-    try:
-        cursor = conn.cursor()
-        cursor.execute(sql, (pattern_id,))
-        conn.commit()
-        return cursor.rowcount > 0
-    except sqlite3.Error as e:
-        conn.rollback()
-        raise DatabaseError(f"Failed to delete system pattern with ID {pattern_id}: {e}")
-    finally:
-        if cursor:
-            cursor.close()
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            cursor.execute(sql, (pattern_id,))
+            conn.commit()
+            return cursor.rowcount > 0
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to delete system pattern with ID {pattern_id}: {e}")
+        finally:
+            if cursor:
+                cursor.close()
+
+# Tables addressable by the bulk ID delete below. Only types whose single
+# deletes also remove a vector-store embedding are listed.
+_ID_DELETE_TABLES = {
+    "decision": "decisions",
+    "system_pattern": "system_patterns",
+}
+
+def delete_items_by_ids(workspace_id: str, item_type: str, ids: List[int]) -> List[int]:
+    """
+    Deletes several items of one type in a single DELETE ... WHERE id IN
+    statement instead of one transaction per ID. Returns the IDs that
+    actually existed (and were deleted); callers use them to clean up the
+    matching embeddings. Raises ValueError for unsupported item types.
+    """
+    table = _ID_DELETE_TABLES.get(item_type)
+    if table is None:
+        raise ValueError(f"Unsupported item_type for bulk delete: {item_type}")
+    conn = get_db_connection(workspace_id)
+    cursor = None
+    placeholders = ",".join("?" * len(ids))
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT id FROM {table} WHERE id IN ({placeholders})", ids)
+            found_ids = [row["id"] for row in cursor.fetchall()]
+            if found_ids:
+                # FTS shadow tables (decisions_fts) are maintained by their
+                # AFTER DELETE triggers, same as the single-item path.
+                cursor.execute(f"DELETE FROM {table} WHERE id IN ({placeholders})", ids)
+                conn.commit()
+            return found_ids
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to bulk delete {item_type} items: {e}")
+        finally:
+            if cursor:
+                cursor.close()
+
+# Custom-data values can be KB-sized JSON blobs, so their (de)serialization
+# uses orjson's Rust encoder when it is installed; the stdlib json module is
+# the drop-in fallback and nothing else depends on orjson being present.
+# orjson's encode errors subclass TypeError, so existing except clauses hold.
+try:
+    import orjson
+
+    def _value_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    _value_loads = orjson.loads
+except ImportError:
+    _value_dumps = json.dumps
+    _value_loads = json.loads
 
 def log_custom_data(workspace_id: str, data: models.CustomData) -> models.CustomData:
     """Logs or updates a custom data entry. Uses INSERT OR REPLACE based on unique (category, key)."""
@@ -782,34 +1102,130 @@ def log_custom_data(workspace_id: str, data: models.CustomData) -> models.Custom
         INSERT OR REPLACE INTO custom_data (timestamp, category, key, value, metadata, cache_score)
         VALUES (?, ?, ?, ?, ?, ?)
     """
-    try:
-        cursor = conn.cursor()
-        # Ensure value is serialized to JSON string
-        value_json = json.dumps(data.value)
-        # Serialize metadata to JSON string if present
-        metadata_json = json.dumps(data.metadata) if data.metadata is not None else None
-        params = (
-            data.timestamp,
-            data.category,
-            data.key,
-            value_json,
-            metadata_json,
-            data.cache_score
-        )
-        cursor.execute(sql, params)
-        conn.commit()
-        # Query back to get ID if needed (similar to log_system_pattern)
-        cursor.execute("SELECT id FROM custom_data WHERE category = ? AND key = ?", (data.category, data.key))
-        row = cursor.fetchone()
-        if row:
-            data.id = row['id']
-        return data
-    except (sqlite3.Error, TypeError) as e: # TypeError for json.dumps
-        conn.rollback()
-        raise DatabaseError(f"Failed to log custom data for '{data.category}/{data.key}': {e}")
-    finally:
-        if cursor:
-            cursor.close()
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            # Ensure value is serialized to JSON string
+            value_json = _value_dumps(data.value)
+            # Serialize metadata to JSON string if present
+            metadata_json = _value_dumps(data.metadata) if data.metadata is not None else None
+            params = (
+                data.timestamp,
+                data.category,
+                data.key,
+                value_json,
+                metadata_json,
+                data.cache_score
+            )
+            cursor.execute(sql, params)
+            conn.commit()
+            # Query back to get ID if needed (similar to log_system_pattern)
+            cursor.execute("SELECT id FROM custom_data WHERE category = ? AND key = ?", (data.category, data.key))
+            row = cursor.fetchone()
+            if row:
+                data.id = row['id']
+            return data
+        except (sqlite3.Error, TypeError) as e: # TypeError for json.dumps
+            conn.rollback()
+            raise DatabaseError(f"Failed to log custom data for '{data.category}/{data.key}': {e}")
+        finally:
+            if cursor:
+                cursor.close()
+
+def log_custom_data_many(workspace_id: str, entries: List[models.CustomData]) -> List[models.CustomData]:
+    """
+    Logs or updates multiple custom data entries with one executemany under a
+    single transaction. INSERT OR REPLACE may overwrite rows, so ids are
+    queried back per (category, key) after the commit rather than derived
+    from last_insert_rowid().
+    """
+    if not entries:
+        return []
+    conn = get_db_connection(workspace_id)
+    cursor = None # Initialize cursor for finally block
+    sql = """
+        INSERT OR REPLACE INTO custom_data (timestamp, category, key, value, metadata, cache_score)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+    with _get_write_lock(workspace_id):
+        try:
+            rows = [
+                (
+                    e.timestamp,
+                    e.category,
+                    e.key,
+                    _value_dumps(e.value),
+                    _value_dumps(e.metadata) if e.metadata is not None else None,
+                    e.cache_score
+                )
+                for e in entries
+            ]
+            cursor = conn.cursor()
+            cursor.executemany(sql, rows)
+            conn.commit()
+            for entry in entries:
+                cursor.execute("SELECT id FROM custom_data WHERE category = ? AND key = ?", (entry.category, entry.key))
+                row = cursor.fetchone()
+                if row:
+                    entry.id = row['id']
+            return entries
+        except (sqlite3.Error, TypeError) as e: # TypeError for json.dumps
+            conn.rollback()
+            raise DatabaseError(f"Failed to log custom data batch: {e}")
+        finally:
+            if cursor:
+                cursor.close()
+
+def prepare_custom_data_bulk_import(workspace_id: str) -> Tuple[List[str], int]:
+    """
+    Drops non-unique indexes on custom_data and relaxes fsync ahead of a bulk
+    import. Returns (create_index_sql, previous_synchronous_level) to hand to
+    finish_custom_data_bulk_import. Rebuilding an index over the full table
+    afterwards is a bottom-up B-tree build, which is cheaper than maintaining
+    the index incrementally across thousands of inserts. Unique indexes are
+    left in place — INSERT OR REPLACE depends on them.
+    """
+    conn = get_db_connection(workspace_id)
+    cursor = None # Initialize cursor for finally block
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            cursor.execute("PRAGMA synchronous")
+            previous_synchronous = cursor.fetchone()[0]
+            cursor.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'custom_data' "
+                "AND sql IS NOT NULL AND sql NOT LIKE 'CREATE UNIQUE%'"
+            )
+            rows = cursor.fetchall()
+            for row in rows:
+                cursor.execute(f"DROP INDEX IF EXISTS {row['name']}")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            conn.commit()
+            return [row['sql'] for row in rows], previous_synchronous
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to prepare custom data bulk import: {e}")
+        finally:
+            if cursor:
+                cursor.close()
+
+def finish_custom_data_bulk_import(workspace_id: str, index_sql: List[str], previous_synchronous: int) -> None:
+    """Recreates the indexes dropped by prepare_custom_data_bulk_import and restores fsync."""
+    conn = get_db_connection(workspace_id)
+    cursor = None # Initialize cursor for finally block
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            for stmt in index_sql:
+                cursor.execute(stmt.replace("CREATE INDEX", "CREATE INDEX IF NOT EXISTS", 1))
+            cursor.execute(f"PRAGMA synchronous={int(previous_synchronous)}")
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to finish custom data bulk import: {e}")
+        finally:
+            if cursor:
+                cursor.close()
 
 def get_custom_data(
     workspace_id: str,
@@ -843,53 +1259,266 @@ def get_custom_data(
         cursor = conn.cursor()
         cursor.execute(sql, params)
         rows = cursor.fetchall()
-        custom_data_list = []
+        raw_entries = []
         for row in rows:
             try:
-                # Deserialize value from JSON string
-                value_data = json.loads(row['value'])
-                # Deserialize metadata from JSON string if present
-                metadata_data = json.loads(row['metadata']) if row['metadata'] else None
-                custom_data_list.append(
-                    models.CustomData(
-                        id=row['id'],
-                        timestamp=row['timestamp'],
-                        category=row['category'],
-                        key=row['key'],
-                        value=value_data,
-                        metadata=metadata_data,
-                        cache_score=row['cache_score']
-                    )
-                )
+                raw_entries.append({
+                    "id": row['id'],
+                    "timestamp": row['timestamp'],
+                    "category": row['category'],
+                    "key": row['key'],
+                    "value": _value_loads(row['value']),
+                    "metadata": _value_loads(row['metadata']) if row['metadata'] else None,
+                    "cache_score": row['cache_score']
+                })
             except json.JSONDecodeError as e:
                 # Log or handle error for specific row if JSON is invalid
                 print(f"Warning: Failed to decode JSON for custom_data id={row['id']}: {e}") # Replace with proper logging
                 continue # Skip this row
-        return custom_data_list
+        # Validate the whole batch in one call rather than per-row construction
+        return _CUSTOM_DATA_LIST_ADAPTER.validate_python(raw_entries)
     except sqlite3.Error as e:
         raise DatabaseError(f"Failed to retrieve custom data: {e}")
     finally:
         if cursor:
             cursor.close()
 
+def stream_custom_data_ordered(workspace_id: str):
+    """
+    Yields CustomData rows ordered by category then key, one at a time.
+    Lets callers (e.g. markdown export) group by category with
+    itertools.groupby and process arbitrarily large datasets with bounded
+    memory, instead of materializing every row up front via get_custom_data.
+    Rows with undecodable JSON values are skipped with a warning, matching
+    get_custom_data.
+    """
+    conn = get_db_connection(workspace_id)
+    cursor = None # Initialize cursor for finally block
+    sql = "SELECT id, timestamp, category, key, value, metadata, cache_score FROM custom_data ORDER BY category ASC, key ASC"
+    try:
+        cursor = conn.cursor()
+        cursor.execute(sql)
+        for row in cursor:
+            try:
+                yield models.CustomData(
+                    id=row['id'],
+                    timestamp=row['timestamp'],
+                    category=row['category'],
+                    key=row['key'],
+                    value=_value_loads(row['value']),
+                    metadata=_value_loads(row['metadata']) if row['metadata'] else None,
+                    cache_score=row['cache_score']
+                )
+            except json.JSONDecodeError as e:
+                log.warning("Failed to decode JSON for custom_data id=%s: %s", row['id'], e)
+                continue # Skip this row
+    except sqlite3.Error as e:
+        raise DatabaseError(f"Failed to stream custom data: {e}")
+    finally:
+        if cursor:
+            cursor.close()
+
 def delete_custom_data(workspace_id: str, category: str, key: str) -> bool:
     """Deletes a specific custom data entry by category and key. Returns True if deleted, False otherwise."""
     conn = get_db_connection(workspace_id)
     cursor = None # Initialize cursor for finally block
     sql = "DELETE FROM custom_data WHERE category = ? AND key = ?"
     params = (category, key)
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            conn.commit()
+            return cursor.rowcount > 0 # Return True if one row was deleted
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to delete custom data for '{category}/{key}': {e}")
+        finally:
+            if cursor:
+                cursor.close()
+
+# Item types whose rows carry a tags column, mapped to their tables.
+TAGGED_ITEM_TABLES = {"decision": "decisions", "system_pattern": "system_patterns"}
+
+def get_item_ids_by_tags(
+    workspace_id: str,
+    item_types: List[str],
+    tags_filter_include_all: Optional[List[str]] = None,
+    tags_filter_include_any: Optional[List[str]] = None
+) -> Dict[str, List[int]]:
+    """
+    Returns the ids of items whose tags satisfy the given filters, per item
+    type. Tag matching is exact list membership, mirroring the Python-side
+    filtering in get_decisions. Item types without a tags column are ignored.
+    """
+    conn = get_db_connection(workspace_id)
+    cursor = None # Initialize cursor for finally block
+    results: Dict[str, List[int]] = {}
     try:
         cursor = conn.cursor()
-        cursor.execute(sql, params)
-        conn.commit()
-        return cursor.rowcount > 0 # Return True if one row was deleted
+        for item_type in item_types:
+            table = TAGGED_ITEM_TABLES.get(item_type)
+            if table is None:
+                continue
+            cursor.execute(f"SELECT id, tags FROM {table} WHERE tags IS NOT NULL")
+            ids: List[int] = []
+            for row in cursor.fetchall():
+                tags = json.loads(row['tags']) if row['tags'] else None
+                if not tags:
+                    continue
+                if tags_filter_include_all and not all(tag in tags for tag in tags_filter_include_all):
+                    continue
+                if tags_filter_include_any and not any(tag in tags for tag in tags_filter_include_any):
+                    continue
+                ids.append(row['id'])
+            results[item_type] = ids
+        return results
+    except (sqlite3.Error, json.JSONDecodeError) as e:
+        raise DatabaseError(f"Failed to resolve item ids by tags: {e}")
+    finally:
+        if cursor:
+            cursor.close()
+
+def get_items_by_ids(workspace_id: str, item_type: str, item_ids: List[int]) -> Dict[int, Any]:
+    """
+    Fetches multiple items of one type in a single query using WHERE id IN (...).
+    Returns a dict mapping item id to its pydantic model so callers can
+    re-hydrate a result list in one pass. Supports the item types stored in
+    the vector store: 'decision', 'progress_entry', 'system_pattern' and
+    'custom_data'. Unknown types raise ValueError.
+    """
+    if not item_ids:
+        return {}
+    conn = get_db_connection(workspace_id)
+    cursor = None # Initialize cursor for finally block
+    placeholders = ",".join("?" * len(item_ids))
+    if item_type == "decision":
+        sql = f"SELECT id, timestamp, summary, rationale, implementation_details, tags FROM decisions WHERE id IN ({placeholders})"
+    elif item_type == "progress_entry":
+        sql = f"SELECT id, timestamp, status, description, parent_id FROM progress_entries WHERE id IN ({placeholders})"
+    elif item_type == "system_pattern":
+        sql = f"SELECT id, timestamp, name, description, tags FROM system_patterns WHERE id IN ({placeholders})"
+    elif item_type == "custom_data":
+        sql = f"SELECT id, timestamp, category, key, value, metadata, cache_score FROM custom_data WHERE id IN ({placeholders})"
+    else:
+        raise ValueError(f"Unsupported item type for batched lookup: '{item_type}'")
+    try:
+        cursor = conn.cursor()
+        cursor.execute(sql, tuple(item_ids))
+        rows = cursor.fetchall()
+        items: Dict[int, Any] = {}
+        for row in rows:
+            if item_type == "decision":
+                item = models.Decision(
+                    id=row['id'],
+                    timestamp=row['timestamp'],
+                    summary=row['summary'],
+                    rationale=row['rationale'],
+                    implementation_details=row['implementation_details'],
+                    tags=json.loads(row['tags']) if row['tags'] else None
+                )
+            elif item_type == "progress_entry":
+                item = models.ProgressEntry(
+                    id=row['id'],
+                    timestamp=row['timestamp'],
+                    status=row['status'],
+                    description=row['description'],
+                    parent_id=row['parent_id']
+                )
+            elif item_type == "system_pattern":
+                item = models.SystemPattern(
+                    id=row['id'],
+                    timestamp=row['timestamp'],
+                    name=row['name'],
+                    description=row['description'],
+                    tags=json.loads(row['tags']) if row['tags'] else None
+                )
+            else: # custom_data
+                item = models.CustomData(
+                    id=row['id'],
+                    timestamp=row['timestamp'],
+                    category=row['category'],
+                    key=row['key'],
+                    value=_value_loads(row['value']),
+                    metadata=_value_loads(row['metadata']) if row['metadata'] else None,
+                    cache_score=row['cache_score']
+                )
+            items[item.id] = item
+        return items
+    except (sqlite3.Error, json.JSONDecodeError) as e:
+        raise DatabaseError(f"Failed batched lookup of {item_type} items: {e}")
+    finally:
+        if cursor:
+            cursor.close()
+
+def get_cached_embedding(workspace_id: str, text_hash: bytes, model: str) -> Optional[bytes]:
+    """Returns the cached embedding blob for a (text_hash, model) pair, or None."""
+    conn = get_db_connection(workspace_id)
+    cursor = None # Initialize cursor for finally block
+    sql = "SELECT vector FROM embedding_cache WHERE text_hash = ? AND model = ?"
+    try:
+        cursor = conn.cursor()
+        cursor.execute(sql, (text_hash, model))
+        row = cursor.fetchone()
+        return row["vector"] if row is not None else None
+    except sqlite3.Error as e:
+        raise DatabaseError(f"Failed to get cached embedding: {e}")
+    finally:
+        if cursor:
+            cursor.close()
+
+def store_cached_embedding(workspace_id: str, text_hash: bytes, model: str, vector: bytes) -> None:
+    """Stores a computed embedding blob; existing entries are left untouched."""
+    conn = get_db_connection(workspace_id)
+    cursor = None # Initialize cursor for finally block
+    sql = "INSERT OR IGNORE INTO embedding_cache (text_hash, model, vector) VALUES (?, ?, ?)"
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            cursor.execute(sql, (text_hash, model, vector))
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to store cached embedding: {e}")
+        finally:
+            if cursor:
+                cursor.close()
+
+def get_import_file_state(workspace_id: str, path: str) -> Optional[Tuple[int, int, bytes]]:
+    """Returns (mtime_ns, size, hash) recorded for an imported file, or None."""
+    conn = get_db_connection(workspace_id)
+    cursor = None # Initialize cursor for finally block
+    sql = "SELECT mtime_ns, size, hash FROM custom_data_import_state WHERE path = ?"
+    try:
+        cursor = conn.cursor()
+        cursor.execute(sql, (path,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return (row["mtime_ns"], row["size"], row["hash"])
     except sqlite3.Error as e:
-        conn.rollback()
-        raise DatabaseError(f"Failed to delete custom data for '{category}/{key}': {e}")
+        raise DatabaseError(f"Failed to get import state for '{path}': {e}")
     finally:
         if cursor:
             cursor.close()
 
+def upsert_import_file_state(workspace_id: str, path: str, mtime_ns: int, size: int, file_hash: bytes) -> None:
+    """Records (mtime_ns, size, hash) for an imported file, replacing any prior row."""
+    conn = get_db_connection(workspace_id)
+    cursor = None # Initialize cursor for finally block
+    sql = "INSERT OR REPLACE INTO custom_data_import_state (path, mtime_ns, size, hash) VALUES (?, ?, ?, ?)"
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            cursor.execute(sql, (path, mtime_ns, size, file_hash))
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to record import state for '{path}': {e}")
+        finally:
+            if cursor:
+                cursor.close()
+
 def log_context_link(workspace_id: str, link_data: models.ContextLink) -> models.ContextLink:
     """Logs a new context link."""
     conn = get_db_connection(workspace_id)
@@ -907,28 +1536,29 @@ def log_context_link(workspace_id: str, link_data: models.ContextLink) -> models
     params = (
         workspace_id, # Storing workspace_id explicitly in the table
         link_data.source_item_type,
-        str(link_data.source_item_id), # Ensure IDs are stored as text
+        link_data.source_item_id, # Already coerced to text by the ContextLink model validator
         link_data.target_item_type,
-        str(link_data.target_item_id), # Ensure IDs are stored as text
+        link_data.target_item_id, # Already coerced to text by the ContextLink model validator
         link_data.relationship_type,
         link_data.description,
         link_data.timestamp # Pydantic model ensures this is set
     )
-    try:
-        cursor = conn.cursor()
-        cursor.execute(sql, params)
-        link_id = cursor.lastrowid
-        conn.commit()
-        link_data.id = link_id
-        # The timestamp from the DB default might be slightly different if we didn't pass it,
-        # but since our Pydantic model sets it, what we have in link_data.timestamp is accurate.
-        return link_data
-    except sqlite3.Error as e:
-        conn.rollback()
-        raise DatabaseError(f"Failed to log context link: {e}")
-    finally:
-        if cursor:
-            cursor.close()
+    with _get_write_lock(workspace_id):
+        try:
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            link_id = cursor.lastrowid
+            conn.commit()
+            link_data.id = link_id
+            # The timestamp from the DB default might be slightly different if we didn't pass it,
+            # but since our Pydantic model sets it, what we have in link_data.timestamp is accurate.
+            return link_data
+        except sqlite3.Error as e:
+            conn.rollback()
+            raise DatabaseError(f"Failed to log context link: {e}")
+        finally:
+            if cursor:
+                cursor.close()
 
 def get_context_links(
     workspace_id: str,
@@ -1044,8 +1674,8 @@ def search_project_glossary_fts(workspace_id: str, query_term: str, limit: Optio
         glossary_entries = []
         for row in rows:
             try:
-                value_data = json.loads(row['value'])
-                metadata_data = json.loads(row['metadata']) if row['metadata'] else None
+                value_data = _value_loads(row['value'])
+                metadata_data = _value_loads(row['metadata']) if row['metadata'] else None
                 glossary_entries.append(
                     models.CustomData(
                         id=row['id'],
@@ -1101,26 +1731,23 @@ def search_custom_data_value_fts(
         cursor = conn.cursor()
         cursor.execute(sql, tuple(params_list))
         rows = cursor.fetchall()
-        results = []
+        raw_entries = []
         for row in rows:
             try:
-                value_data = json.loads(row['value'])
-                metadata_data = json.loads(row['metadata']) if row['metadata'] else None
-                results.append(
-                    models.CustomData(
-                        id=row['id'],
-                        timestamp=row['timestamp'],
-                        category=row['category'],
-                        key=row['key'],
-                        value=value_data,
-                        metadata=metadata_data,
-                        cache_score=row['cache_score']
-                    )
-                )
+                raw_entries.append({
+                    "id": row['id'],
+                    "timestamp": row['timestamp'],
+                    "category": row['category'],
+                    "key": row['key'],
+                    "value": _value_loads(row['value']),
+                    "metadata": _value_loads(row['metadata']) if row['metadata'] else None,
+                    "cache_score": row['cache_score']
+                })
             except json.JSONDecodeError as e:
                 print(f"Warning: Failed to decode JSON for custom_data id={row['id']} (search_custom_data_value_fts): {e}")
                 continue
-        return results
+        # Validate the whole batch in one call rather than per-row construction
+        return _CUSTOM_DATA_LIST_ADAPTER.validate_python(raw_entries)
     except sqlite3.Error as e:
         raise DatabaseError(f"Failed FTS search on custom_data for term '{query_term}': {e}")
     finally:
@@ -1180,14 +1807,15 @@ def get_item_history(
         rows = cursor.fetchall()
         history_entries = []
         for row in rows:
-            content_dict = json.loads(row['content'])
-            history_entries.append({
+            # 'content' stays a raw JSON string until first access; callers that
+            # only look at version/timestamp never pay for the parse.
+            history_entries.append(_LazyJSONDict({
                 "id": row['id'],
                 "timestamp": row['timestamp'], # Already datetime object
                 "version": row['version'],
-                "content": content_dict,
+                "content": row['content'],
                 "change_source": row['change_source']
-            })
+            }))
             # Or if using Pydantic models:
             # history_entries.append(history_model(id=row['id'], timestamp=row['timestamp'], ...))
         return history_entries
@@ -1205,9 +1833,12 @@ def get_recent_activity_summary_data(
 ) -> Dict[str, Any]:
     """
     Retrieves a summary of recent activity across various ConPort items.
+
+    The per-type queries target disjoint tables and are independent, so they
+    are issued concurrently on pooled read-only connections.
     """
-    conn = get_db_connection(workspace_id)
-    cursor = None # Initialize cursor for finally block
+    # Ensure the database exists and migrations have run before opening readers
+    get_db_connection(workspace_id)
     summary_results: Dict[str, Any] = {
         "recent_decisions": [],
         "recent_progress_entries": [],
@@ -1230,120 +1861,90 @@ def get_recent_activity_summary_data(
 
     summary_results["summary_period_start"] = start_datetime.isoformat()
 
-    try:
-        cursor = conn.cursor()
-        # Recent Decisions
-        cursor.execute(
+    # Per-section (SQL, row -> model) pairs; each targets a disjoint table
+    section_queries = {
+        "recent_decisions": (
             """
             SELECT id, timestamp, summary, rationale, implementation_details, tags
             FROM decisions WHERE timestamp >= ? ORDER BY timestamp DESC LIMIT ?
             """,
-            (start_datetime, limit_per_type)
-        )
-        rows = cursor.fetchall()
-        summary_results["recent_decisions"] = [
-            models.Decision(
+            lambda row: models.Decision(
                 id=row['id'], timestamp=row['timestamp'], summary=row['summary'],
                 rationale=row['rationale'], implementation_details=row['implementation_details'],
                 tags=json.loads(row['tags']) if row['tags'] else None
-            ).model_dump(mode='json') for row in rows
-        ]
-
-        # Recent Progress Entries
-        cursor.execute(
+            )
+        ),
+        "recent_progress_entries": (
             """
             SELECT id, timestamp, status, description, parent_id
             FROM progress_entries WHERE timestamp >= ? ORDER BY timestamp DESC LIMIT ?
             """,
-            (start_datetime, limit_per_type)
-        )
-        rows = cursor.fetchall()
-        summary_results["recent_progress_entries"] = [
-            models.ProgressEntry(
+            lambda row: models.ProgressEntry(
                 id=row['id'], timestamp=row['timestamp'], status=row['status'],
                 description=row['description'], parent_id=row['parent_id']
-            ).model_dump(mode='json') for row in rows
-        ]
-
-        # Recent Product Context Updates (from history)
-        cursor.execute(
+            )
+        ),
+        "recent_product_context_updates": (
             """
             SELECT id, timestamp, version, content, change_source
             FROM product_context_history WHERE timestamp >= ? ORDER BY timestamp DESC LIMIT ?
             """,
-            (start_datetime, limit_per_type)
-        )
-        rows = cursor.fetchall()
-        summary_results["recent_product_context_updates"] = [
-            models.ProductContextHistory(
+            lambda row: models.ProductContextHistory(
                 id=row['id'], timestamp=row['timestamp'], version=row['version'],
                 content=json.loads(row['content']), change_source=row['change_source']
-            ).model_dump(mode='json') for row in rows
-        ]
-
-        # Recent Active Context Updates (from history)
-        cursor.execute(
+            )
+        ),
+        "recent_active_context_updates": (
             """
             SELECT id, timestamp, version, content, change_source
             FROM active_context_history WHERE timestamp >= ? ORDER BY timestamp DESC LIMIT ?
             """,
-            (start_datetime, limit_per_type)
-        )
-        rows = cursor.fetchall()
-        summary_results["recent_active_context_updates"] = [
-            models.ActiveContextHistory(
+            lambda row: models.ActiveContextHistory(
                 id=row['id'], timestamp=row['timestamp'], version=row['version'],
                 content=json.loads(row['content']), change_source=row['change_source']
-            ).model_dump(mode='json') for row in rows
-        ]
-
-        # Recent Links Created
-        cursor.execute(
+            )
+        ),
+        "recent_links_created": (
             """
             SELECT id, timestamp, source_item_type, source_item_id, target_item_type, target_item_id, relationship_type, description
             FROM context_links WHERE timestamp >= ? ORDER BY timestamp DESC LIMIT ?
             """,
-            (start_datetime, limit_per_type)
-        )
-        rows = cursor.fetchall()
-        summary_results["recent_links_created"] = [
-            models.ContextLink(
+            lambda row: models.ContextLink(
                 id=row['id'], timestamp=row['timestamp'], source_item_type=row['source_item_type'],
                 source_item_id=row['source_item_id'], target_item_type=row['target_item_type'],
                 target_item_id=row['target_item_id'], relationship_type=row['relationship_type'],
                 description=row['description']
-            ).model_dump(mode='json') for row in rows
-        ]
-
-        # Recent System Patterns
-        cursor.execute(
+            )
+        ),
+        "recent_system_patterns": (
             """
             SELECT id, timestamp, name, description, tags
             FROM system_patterns WHERE timestamp >= ? ORDER BY timestamp DESC LIMIT ?
             """,
-            (start_datetime, limit_per_type)
-        )
-        rows = cursor.fetchall()
-        summary_results["recent_system_patterns"] = [
-            models.SystemPattern(
+            lambda row: models.SystemPattern(
                 id=row['id'], timestamp=row['timestamp'], name=row['name'],
                 description=row['description'], tags=json.loads(row['tags']) if row['tags'] else None
-            ).model_dump(mode='json') for row in rows
-        ]
+            )
+        ),
+    }
 
-        # Note about missing timestamps (removed as all now have timestamps)
-        # summary_results["notes"].append(
-        #     "General Custom Data entries are not included in this summary "
-        #     "as they currently do not have creation/update timestamps in the database."
-        # )
+    params = (start_datetime, limit_per_type)
+    try:
+        with ThreadPoolExecutor(max_workers=_READER_POOL_SIZE) as executor:
+            futures = {
+                key: executor.submit(_run_readonly_query, workspace_id, sql, params)
+                for key, (sql, _) in section_queries.items()
+            }
+            for key, future in futures.items():
+                row_to_model = section_queries[key][1]
+                summary_results[key] = [
+                    row_to_model(row).model_dump(mode='json') for row in future.result()
+                ]
 
         return summary_results
 
     except (sqlite3.Error, json.JSONDecodeError) as e:
         raise DatabaseError(f"Failed to retrieve recent activity summary: {e}")
-    finally:
-        if cursor:
-            cursor.close()
 
 def get_custom_data_with_cache_hints(workspace_id: str) -> List[models.CustomData]:
     """Query custom data with cache_hint metadata"""
@@ -1363,8 +1964,8 @@ def get_custom_data_with_cache_hints(workspace_id: str) -> List[models.CustomDat
                 timestamp=row['timestamp'],
                 category=row['category'],
                 key=row['key'],
-                value=json.loads(row['value']),
-                metadata=json.loads(row['metadata']) if row['metadata'] else None,
+                value=_value_loads(row['value']),
+                metadata=_value_loads(row['metadata']) if row['metadata'] else None,
                 cache_score=row['cache_score']
             )
             for row in cursor.fetchall()
@@ -1488,6 +2089,42 @@ def get_last_modified_time(item_type: str, workspace_id: str) -> datetime:
         if cursor:
             cursor.close()
 
+def get_last_modified_times(workspace_id: str) -> Dict[str, datetime]:
+    """
+    Returns the last modification times of the three stable-prefix inputs
+    (product_context, system_patterns, custom_data_cached) in one query,
+    instead of three get_last_modified_time round-trips. Missing data and
+    errors map to the epoch, matching get_last_modified_time.
+    """
+    conn = get_db_connection(workspace_id)
+    cursor = None
+    keys = ("product_context", "system_patterns", "custom_data_cached")
+    sql = """
+        SELECT
+            (SELECT MAX(timestamp) FROM product_context_history),
+            (SELECT MAX(timestamp) FROM system_patterns),
+            (SELECT MAX(timestamp) FROM custom_data
+               WHERE JSON_EXTRACT(metadata, '$.cache_hint') = true)
+    """
+    try:
+        cursor = conn.cursor()
+        cursor.execute(sql)
+        row = cursor.fetchone()
+        results = {}
+        for index, key in enumerate(keys):
+            value = row[index] if row else None
+            if value:
+                results[key] = value if isinstance(value, datetime) else datetime.fromisoformat(value)
+            else:
+                results[key] = datetime.fromtimestamp(0)
+        return results
+    except sqlite3.Error as e:
+        log.error(f"Failed to get last modified times: {e}")
+        return {key: datetime.fromtimestamp(0) for key in keys}
+    finally:
+        if cursor:
+            cursor.close()
+
 def get_hash_timestamp(hash_value: str) -> datetime:
     """Extract timestamp from hash (placeholder implementation)"""
     # This is a placeholder implementation since the hash doesn't contain timestamp info
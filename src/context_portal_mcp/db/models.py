@@ -1,6 +1,6 @@
 """Pydantic models for data validation and structure, mirroring the database schema."""
 
-from pydantic import BaseModel, Field, Json, model_validator
+from pydantic import BaseModel, Field, Json, field_validator, model_validator
 from typing import Optional, Dict, Any, List, Annotated
 from datetime import datetime, timezone
 
@@ -13,6 +13,23 @@ class BaseContextModel(BaseModel):
 
 # --- Table Models ---
 
+class ToJsonDictMixin:
+    """
+    Fast-path serialization for DB-loaded models whose fields are already
+    JSON-native apart from the timestamp.
+    """
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        """
+        Shallow-copies __dict__ and stringifies the timestamp, skipping
+        pydantic's per-field serializer walk. Matches model_dump(mode='json')
+        for instances built from database rows.
+        """
+        d = self.__dict__.copy()
+        if d.get("timestamp") is not None:
+            d["timestamp"] = d["timestamp"].isoformat()
+        return d
+
 class ProductContext(BaseContextModel):
     """Model for the product_context table."""
     pass # Inherits structure from BaseContextModel
@@ -21,7 +38,7 @@ class ActiveContext(BaseContextModel):
     """Model for the active_context table."""
     pass # Inherits structure from BaseContextModel
 
-class Decision(BaseModel):
+class Decision(ToJsonDictMixin, BaseModel):
     """Model for the decisions table."""
     id: Optional[int] = None # Auto-incremented by DB
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -30,7 +47,7 @@ class Decision(BaseModel):
     implementation_details: Optional[str] = None
     tags: Optional[List[str]] = Field(None, description="Optional tags for categorization")
 
-class ProgressEntry(BaseModel):
+class ProgressEntry(ToJsonDictMixin, BaseModel):
     """Model for the progress_entries table."""
     id: Optional[int] = None # Auto-incremented by DB
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -38,7 +55,7 @@ class ProgressEntry(BaseModel):
     description: str
     parent_id: Optional[int] = None # For subtasks
 
-class SystemPattern(BaseModel):
+class SystemPattern(ToJsonDictMixin, BaseModel):
     """Model for the system_patterns table."""
     id: Optional[int] = None # Auto-incremented by DB
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc)) # Added timestamp
@@ -46,7 +63,7 @@ class SystemPattern(BaseModel):
     description: Optional[str] = None
     tags: Optional[List[str]] = Field(None, description="Optional tags for categorization")
 
-class CustomData(BaseModel):
+class CustomData(ToJsonDictMixin, BaseModel):
     """Model for the custom_data table."""
     id: Optional[int] = None # Auto-incremented by DB
     timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc)) # Added timestamp
@@ -270,6 +287,13 @@ class ContextLink(BaseModel):
     relationship_type: str = Field(..., description="Nature of the link (e.g., 'implements', 'related_to')")
     description: Optional[str] = Field(None, description="Optional description for the link itself")
 
+    @field_validator("source_item_id", "target_item_id", mode="before")
+    @classmethod
+    def coerce_item_id_to_str(cls, v: Any) -> Any:
+        # IDs may arrive as ints (e.g. decision IDs); coerce once here so the DB
+        # layer can store them as TEXT without per-write str() calls.
+        return str(v) if v is not None else v
+
 class LinkConportItemsArgs(BaseArgs):
     """Arguments for creating a link between two ConPort items."""
     source_item_type: str = Field(..., description="Type of the source item")
@@ -296,6 +320,27 @@ class BatchLogItemsArgs(BaseArgs):
     item_type: str = Field(..., description="Type of items to log (e.g., 'decision', 'progress_entry', 'system_pattern', 'custom_data')")
     items: List[Dict[str, Any]] = Field(..., description="A list of dictionaries, each representing the arguments for a single item log.")
 
+class BatchDeleteByIdsArgs(BaseArgs):
+    """Arguments for deleting multiple items of the same type by ID."""
+    item_type: str = Field(..., description="Type of items to delete (e.g., 'decision', 'system_pattern')")
+    ids: List[int] = Field(..., min_length=1, description="IDs of the items to delete.")
+
+class LogDecisionsBatchArgs(BaseArgs):
+    """Arguments for logging multiple decisions in a single transaction."""
+    items: List[Dict[str, Any]] = Field(..., description="A list of dictionaries, each holding the fields of one 'log_decision' call (without workspace_id).")
+
+class LogProgressBatchArgs(BaseArgs):
+    """Arguments for logging multiple progress entries in a single transaction."""
+    items: List[Dict[str, Any]] = Field(..., description="A list of dictionaries, each holding the fields of one 'log_progress' call (without workspace_id).")
+
+class LogCustomDataBatchArgs(BaseArgs):
+    """Arguments for logging multiple custom data entries in a single transaction."""
+    items: List[Dict[str, Any]] = Field(..., description="A list of dictionaries, each holding the fields of one 'log_custom_data' call (without workspace_id).")
+
+class LogSystemPatternsBatchArgs(BaseArgs):
+    """Arguments for logging multiple system patterns in a single transaction."""
+    items: List[Dict[str, Any]] = Field(..., description="A list of dictionaries, each holding the fields of one 'log_system_pattern' call (without workspace_id).")
+
 # --- Context History Tool Args ---
 
 class GetItemHistoryArgs(BaseArgs):
@@ -433,6 +478,11 @@ TOOL_ARG_MODELS = {
     "link_conport_items": LinkConportItemsArgs,
     "get_linked_items": GetLinkedItemsArgs,
     "batch_log_items": BatchLogItemsArgs,
+    "batch_delete_by_ids": BatchDeleteByIdsArgs,
+    "log_decisions_batch": LogDecisionsBatchArgs,
+    "log_progress_batch": LogProgressBatchArgs,
+    "log_custom_data_batch": LogCustomDataBatchArgs,
+    "log_system_patterns_batch": LogSystemPatternsBatchArgs,
     "get_item_history": GetItemHistoryArgs,
     "get_conport_schema": GetConportSchemaArgs,
     "get_recent_activity_summary": GetRecentActivitySummaryArgs,
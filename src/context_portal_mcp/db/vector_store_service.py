@@ -1,23 +1,190 @@
 # src/context_portal_mcp/db/vector_store_service.py
+import asyncio
 import chromadb
 from chromadb.config import Settings as ChromaSettings
-from typing import List, Dict, Optional, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Any, Tuple, Union, Callable
+import functools
+import hashlib
 import logging
+import threading
 import os
 import shutil # For deleting workspace vector store
+import time
+
+import numpy as np
 
 from ..core import embedding_service # Use our embedding service
 
 log = logging.getLogger(__name__)
 
-# Global cache for ChromaDB clients per workspace_id to avoid reinitialization
-_chroma_clients: Dict[str, chromadb.PersistentClient] = {}
+class _LRUCache:
+    """
+    Small bounded LRU mapping with an eviction callback. Keeps the module
+    dependency-free (no cachetools) while capping how many ChromaDB clients
+    — each holding open SQLite file handles and in-memory HNSW indices —
+    a long-lived multi-workspace process can accumulate.
+    """
+    def __init__(self, maxsize: int, on_evict: Optional[Callable[[str, Any], None]] = None):
+        self._data: OrderedDict = OrderedDict()
+        self._maxsize = maxsize
+        self._on_evict = on_evict
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __getitem__(self, key):
+        value = self._data[key]
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            evicted_key, evicted_value = self._data.popitem(last=False)
+            log.info("Evicting least-recently-used cache entry '%s'.", evicted_key)
+            if self._on_evict:
+                self._on_evict(evicted_key, evicted_value)
+
+    def get(self, key, default=None):
+        if key in self._data:
+            return self[key]
+        return default
+
+    def pop(self, key, default=None):
+        return self._data.pop(key, default)
+
+# Collections are cached per workspace; entries are dropped alongside their
+# client when it is evicted or invalidated.
 _chroma_collections: Dict[str, Dict[str, chromadb.Collection]] = {} # workspace_id -> {collection_name: Collection}
 
+def _on_client_evicted(workspace_id: str, client: chromadb.PersistentClient):
+    """Releases resources held by an evicted ChromaDB client."""
+    _bump_client_cache_generation()
+    _chroma_collections.pop(workspace_id, None)
+    try:
+        # Stop Chroma's internal system to close SQLite handles and free the
+        # HNSW index memory. Internal API, so tolerate its absence.
+        client._system.stop()
+    except AttributeError:
+        log.debug("ChromaDB client for workspace '%s' exposes no _system.stop(); relying on GC.", workspace_id)
+    except Exception as e:
+        log.warning("Error while stopping evicted ChromaDB client for workspace '%s': %s", workspace_id, e)
+
+# Maximum number of workspaces with live ChromaDB clients. Beyond this, the
+# least-recently-used client is stopped and dropped; it is transparently
+# reopened on next access.
+_CLIENT_CACHE_MAXSIZE = 32
+
+# Global LRU-bounded cache for ChromaDB clients per workspace_id to avoid reinitialization
+_chroma_clients = _LRUCache(_CLIENT_CACHE_MAXSIZE, on_evict=_on_client_evicted)
+# Guards misses against the shared LRU: without it two threads can both miss
+# and construct duplicate PersistentClients (the loser leaking handles with
+# no _on_client_evicted stop), and __setitem__'s eviction loop would mutate
+# the shared OrderedDict unsynchronized. The thread-local fast path in
+# get_chroma_client keeps steady-state lookups off this lock.
+_chroma_clients_lock = threading.Lock()
+
+# Per-thread client handles so the steady-state lookup touches no shared
+# state. Each thread keeps its own {workspace_id: client} dict stamped with
+# the generation it was filled at; any eviction or invalidation bumps the
+# generation, expiring every thread's handles at once.
+_tls = threading.local()
+_client_cache_generation = 0
+
+def _bump_client_cache_generation():
+    global _client_cache_generation
+    _client_cache_generation += 1
+
+def invalidate_workspace(workspace_id: str):
+    """
+    Drops any cached ChromaDB client and collections for a workspace,
+    releasing file handles and index memory. Safe to call for workspaces
+    that were never loaded.
+    """
+    client = _chroma_clients.pop(workspace_id)
+    if client is not None:
+        log.info("Invalidating cached ChromaDB client for workspace '%s'.", workspace_id)
+        _on_client_evicted(workspace_id, client)
+    else:
+        _chroma_collections.pop(workspace_id, None)
+    for key in [k for k in _collection_counts if k[0] == workspace_id]:
+        _collection_counts.pop(key, None)
+        _collection_count_ops.pop(key, None)
+
 DEFAULT_COLLECTION_NAME = "conport_semantic_store"
 
+# Shared Chroma embedding-function wrapper, built once per process. Uses the
+# double-check locking pattern (as in embedding_service._load_model) so
+# concurrent collection misses don't construct duplicate wrappers.
+_chroma_ef = None
+_chroma_ef_lock = threading.Lock()
+
+def _get_chroma_ef():
+    global _chroma_ef
+    if _chroma_ef is None:
+        with _chroma_ef_lock:
+            if _chroma_ef is None:
+                _chroma_ef = embedding_service.get_chroma_embedding_function()
+    return _chroma_ef
+
+# Cached document counts per (workspace_id, collection_name), adjusted on
+# every upsert/delete so status checks avoid Chroma's COUNT(*) scan. Upserts
+# that overwrite existing ids overcount, so the cache is reconciled against a
+# real count() after _COUNT_RECONCILE_OPS mutations.
+_collection_counts: Dict[Tuple[str, str], int] = {}
+_collection_count_ops: Dict[Tuple[str, str], int] = {}
+_COUNT_RECONCILE_OPS = 1000
+
+def _adjust_collection_count(workspace_id: str, collection_name: str, delta: int):
+    """Applies a mutation delta to the cached count, if one exists yet."""
+    key = (workspace_id, collection_name)
+    if key in _collection_counts:
+        _collection_counts[key] += delta
+        _collection_count_ops[key] = _collection_count_ops.get(key, 0) + 1
+
+def get_collection_count(workspace_id: str, collection_name: str = DEFAULT_COLLECTION_NAME) -> int:
+    """
+    Returns the number of documents in a collection. The first call (and a
+    periodic reconciliation pass) runs Chroma's real count(); in between,
+    the cached value is served in O(1) and kept current by the upsert and
+    delete paths.
+    """
+    key = (workspace_id, collection_name)
+    if key not in _collection_counts or _collection_count_ops.get(key, 0) >= _COUNT_RECONCILE_OPS:
+        collection = get_or_create_collection(workspace_id, collection_name)
+        _collection_counts[key] = collection.count()
+        _collection_count_ops[key] = 0
+    return _collection_counts[key]
+
+# Embedding vectors may arrive either as plain Python lists (e.g. from JSON)
+# or as NumPy arrays straight from the embedding model.
+Vector = Union[List[float], np.ndarray]
+
+def _as_float32(vector: Vector) -> np.ndarray:
+    """
+    Normalizes a vector to a contiguous float32 ndarray. A 384-dim list of
+    Python floats costs ~9KB and forces Chroma to iterate per element; the
+    float32 array is ~1.5KB and passes through as a buffer. No copy is made
+    if the input is already contiguous float32.
+    """
+    return np.ascontiguousarray(vector, dtype=np.float32)
+
+# Number of documents sent to ChromaDB per upsert() call in batched ingest.
+# Each upsert() is a SQLite transaction underneath, so batching turns O(N)
+# commits into O(N/B) for bulk syncs.
+UPSERT_BATCH_SIZE = 1000
+
+@functools.lru_cache(maxsize=64)
 def _get_vector_store_path(workspace_id: str) -> str:
-    """Determines the path for the vector store for a given workspace."""
+    """
+    Determines the path for the vector store for a given workspace.
+    Memoized per process: the directories (and any scratch seeding) are
+    created on the first call for a workspace; later calls skip the
+    makedirs syscalls entirely.
+    """
     # IMPORTANT: Ensure workspace_id is a safe path component.
     # This path should be inside the .conport directory for the workspace.
     # Example: /path/to/workspace/.conport/vector_store
@@ -32,7 +199,7 @@ def _get_vector_store_path(workspace_id: str) -> str:
     # For this example, let's assume workspace_id is a directory path.
     # A more robust solution would use a central config for data paths.
     if not os.path.isdir(workspace_id):
-        log.warning(f"Workspace path '{workspace_id}' does not exist or is not a directory. Vector store path may be invalid.")
+        log.warning("Workspace path '%s' does not exist or is not a directory. Vector store path may be invalid.", workspace_id)
         # Or raise error, depending on how workspace_id is managed.
     
     # Path as per design doc: context_portal/[workspace_id]/vector_store/
@@ -61,42 +228,231 @@ def _get_vector_store_path(workspace_id: str) -> str:
 
     vector_db_path = os.path.join(context_portal_base_dir, "conport_vector_data") # No leading dot, and inside context_portal
     os.makedirs(vector_db_path, exist_ok=True)
-    log.info(f"Vector store path set to: {vector_db_path}")
+
+    # Opt-in fast-scratch mode: when CONPORT_VECTOR_SCRATCH_DIR is set
+    # (e.g. to local SSD while the workspace lives on a network volume),
+    # Chroma persists to scratch so per-commit WAL fsyncs hit fast storage.
+    # flush_workspace_vector_store() copies scratch back to the workspace.
+    scratch_path = _scratch_vector_store_path(workspace_id)
+    if scratch_path is not None:
+        if not os.path.exists(scratch_path):
+            if os.listdir(vector_db_path):
+                # Seed scratch from an existing durable store so prior data
+                # stays visible.
+                shutil.copytree(vector_db_path, scratch_path)
+                log.info("Seeded scratch vector store at '%s' from '%s'.", scratch_path, vector_db_path)
+            else:
+                os.makedirs(scratch_path, exist_ok=True)
+        log.info("Vector store path set to scratch: %s (durable: %s)", scratch_path, vector_db_path)
+        return scratch_path
+
+    log.info("Vector store path set to: %s", vector_db_path)
     return vector_db_path
 
+def _scratch_vector_store_path(workspace_id: str) -> Optional[str]:
+    """
+    Returns the scratch-side persistence path for a workspace when
+    CONPORT_VECTOR_SCRATCH_DIR is set, else None. The workspace path is
+    folded into a short digest so scratch directories stay flat and unique.
+    """
+    scratch_root = os.environ.get("CONPORT_VECTOR_SCRATCH_DIR")
+    if not scratch_root:
+        return None
+    workspace_key = hashlib.blake2b(os.path.abspath(workspace_id).encode("utf-8"), digest_size=8).hexdigest()
+    return os.path.join(scratch_root, f"conport_{workspace_key}", "conport_vector_data")
+
+def flush_workspace_vector_store(workspace_id: str):
+    """
+    Copies the scratch-side vector store back to the durable workspace
+    location. The cached client is stopped first so SQLite files are
+    quiescent, then the durable directory is swapped in via a sibling
+    copy + rename to avoid readers seeing a half-written store. No-op when
+    scratch mode is not configured.
+    """
+    scratch_path = _scratch_vector_store_path(workspace_id)
+    if scratch_path is None or not os.path.exists(scratch_path):
+        log.debug("No scratch vector store for workspace '%s'; nothing to flush.", workspace_id)
+        return
+    durable_path = os.path.join(workspace_id, "context_portal", "conport_vector_data")
+    staging_path = durable_path + ".flush_tmp"
+    log.info("Flushing scratch vector store '%s' to '%s'.", scratch_path, durable_path)
+    try:
+        # Stop the cached client so the scratch SQLite/WAL files are settled.
+        invalidate_workspace(workspace_id)
+        if os.path.exists(staging_path):
+            shutil.rmtree(staging_path)
+        shutil.copytree(scratch_path, staging_path)
+        if os.path.exists(durable_path):
+            shutil.rmtree(durable_path)
+        os.rename(staging_path, durable_path)
+        log.info("Flushed vector store for workspace '%s' to durable storage.", workspace_id)
+    except Exception as e:
+        log.error("Failed to flush scratch vector store for workspace '%s': %s", workspace_id, e, exc_info=True)
+        raise
+
+
+# PRAGMAs applied to Chroma's backing SQLite while bulk-ingesting embeddings.
+# synchronous=OFF removes the per-commit fsync that dominates cold ingest;
+# the rest keep temp structures and page cache in memory.
+_BULK_INGEST_PRAGMAS = (
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-262144",
+)
+
+# PRAGMAs restoring safe defaults once bulk ingest is finished.
+_FINALIZE_BULK_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA wal_checkpoint(TRUNCATE)",
+)
 
-def get_chroma_client(workspace_id: str) -> chromadb.PersistentClient:
+def _execute_sysdb_pragmas(client: chromadb.PersistentClient, pragmas) -> bool:
+    """
+    Best-effort execution of PRAGMAs against Chroma's internal SQLite connection.
+    Reaches into client internals, so survive AttributeError across Chroma
+    refactors rather than failing the caller.
+    """
+    try:
+        conn = client._server._sysdb._conn_pool.connect()
+    except AttributeError:
+        try:
+            conn = client._sysdb._conn_pool.connect()
+        except AttributeError:
+            log.info(
+                "Could not reach Chroma's internal SQLite connection (chromadb %s); "
+                "skipping PRAGMA tuning.", chromadb.__version__
+            )
+            return False
+    try:
+        for pragma in pragmas:
+            conn.execute(pragma)
+        return True
+    except Exception as e:
+        log.warning("Failed to apply PRAGMAs to Chroma's backing SQLite: %s", e)
+        return False
+
+def get_chroma_client(workspace_id: str, bulk_mode: bool = False) -> chromadb.PersistentClient:
     """
     Gets or initializes a persistent ChromaDB client for the given workspace_id.
     Clients are cached globally.
+
+    With bulk_mode=True the backing SQLite is tuned for bulk ingest
+    (synchronous=OFF etc.); call finalize_bulk_mode() afterwards to restore
+    safe defaults and checkpoint the WAL.
     """
-    if workspace_id not in _chroma_clients:
-        vector_store_path = _get_vector_store_path(workspace_id)
-        log.info(f"Initializing ChromaDB client for workspace '{workspace_id}' at path: {vector_store_path}")
-        try:
-            # Settings for on-disk persistence.
-            # allow_reset=True can be useful during development if schema changes.
-            client = chromadb.PersistentClient(path=vector_store_path, settings=ChromaSettings(allow_reset=True, anonymized_telemetry=False))
-            _chroma_clients[workspace_id] = client
-        except Exception as e:
-            log.error(f"Failed to initialize ChromaDB client for workspace '{workspace_id}': {e}", exc_info=True)
-            raise
-    return _chroma_clients[workspace_id]
+    # Fast path: a thread-local handle from the current generation avoids
+    # touching the shared LRU (and its move-to-end mutation) entirely.
+    if not bulk_mode and getattr(_tls, 'generation', -1) == _client_cache_generation:
+        tls_client = _tls.clients.get(workspace_id)
+        if tls_client is not None:
+            return tls_client
+
+    # Thread-local miss: take the cache lock for the shared-LRU access, so
+    # concurrent misses construct one client (double-check pattern, as in
+    # _get_chroma_ef) and the LRU's move-to-end/eviction mutations are
+    # serialized.
+    with _chroma_clients_lock:
+        client = _chroma_clients.get(workspace_id)
+        if client is None:
+            vector_store_path = _get_vector_store_path(workspace_id)
+            log.info("Initializing ChromaDB client for workspace '%s' at path: %s", workspace_id, vector_store_path)
+            try:
+                # Settings for on-disk persistence.
+                # allow_reset=True can be useful during development if schema changes.
+                client = chromadb.PersistentClient(path=vector_store_path, settings=ChromaSettings(allow_reset=True, anonymized_telemetry=False))
+                _chroma_clients[workspace_id] = client
+            except Exception as e:
+                log.error("Failed to initialize ChromaDB client for workspace '%s': %s", workspace_id, e, exc_info=True)
+                raise
+    if bulk_mode:
+        if _execute_sysdb_pragmas(client, _BULK_INGEST_PRAGMAS):
+            log.info("Applied bulk-ingest PRAGMAs to vector store for workspace '%s'.", workspace_id)
+    if getattr(_tls, 'generation', -1) != _client_cache_generation:
+        _tls.clients = {}
+        _tls.generation = _client_cache_generation
+    _tls.clients[workspace_id] = client
+    return client
+
+def finalize_bulk_mode(workspace_id: str):
+    """
+    Restores safe SQLite defaults after a bulk ingest started with
+    get_chroma_client(..., bulk_mode=True) and truncates the WAL.
+    """
+    client = _chroma_clients.get(workspace_id)
+    if client is None:
+        log.debug("No cached ChromaDB client for workspace '%s'; nothing to finalize.", workspace_id)
+        return
+    if _execute_sysdb_pragmas(client, _FINALIZE_BULK_PRAGMAS):
+        log.info("Restored safe SQLite defaults on vector store for workspace '%s'.", workspace_id)
+
+# HNSW settings applied when a collection is first created. ConPort's
+# workload is write-heavy with shallow top_k=5 reads, so moderate M and
+# construction_ef keep per-insert graph-build cost down, search_ef=50 is
+# ample for top_k=5, and batch_size/sync_threshold let Chroma buffer inserts
+# in its WAL and fold them into the graph in the background.
+DEFAULT_HNSW_CONFIG = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 16,
+    "hnsw:construction_ef": 100,
+    "hnsw:search_ef": 50,
+    "hnsw:batch_size": 1000,
+    "hnsw:sync_threshold": 10000,
+}
+
+def _build_collection_schema() -> Optional[Any]:
+    """
+    Builds a Chroma Schema keeping inverted indexes only on the two metadata
+    keys ConPort actually filters by (conport_item_type/conport_item_id) and
+    disabling document FTS. Everything else Chroma would index by default is
+    pure write amplification for our workload. Returns None when the
+    installed chromadb predates the Schema API (or its shape has changed),
+    in which case collection defaults are used.
+    """
+    schema_cls = getattr(chromadb, "Schema", None)
+    if schema_cls is None:
+        log.debug("chromadb %s has no Schema API; using default collection indexes.", chromadb.__version__)
+        return None
+    try:
+        from chromadb.api.types import FtsIndexConfig, StringInvertedIndexConfig
+
+        schema = schema_cls()
+        # ConPort never runs full-text or regex queries over stored documents.
+        schema.delete_index(config=FtsIndexConfig(), key="$document")
+        # Drop the blanket per-value inverted indexes, then re-enable them
+        # only for the keys used in 'where' filters.
+        schema.delete_index(config=StringInvertedIndexConfig())
+        schema.create_index(config=StringInvertedIndexConfig(), key="conport_item_type")
+        schema.create_index(config=StringInvertedIndexConfig(), key="conport_item_id")
+        return schema
+    except Exception as e:
+        # Schema is a young API; fall back to defaults rather than failing
+        # collection creation over an index-tuning optimization.
+        log.info("Could not build custom collection schema on chromadb %s: %s; using defaults.", chromadb.__version__, e)
+        return None
 
-def get_or_create_collection(workspace_id: str, collection_name: str = DEFAULT_COLLECTION_NAME) -> chromadb.Collection:
+def get_or_create_collection(
+    workspace_id: str,
+    collection_name: str = DEFAULT_COLLECTION_NAME,
+    hnsw_config: Optional[Dict[str, Any]] = None
+) -> chromadb.Collection:
     """
     Gets or creates a ChromaDB collection for the given workspace_id and collection_name.
     Collections are cached globally.
+
+    hnsw_config entries override DEFAULT_HNSW_CONFIG in the collection
+    metadata (e.g. {"hnsw:search_ef": 200} for recall-heavy use). HNSW
+    settings only take effect when the collection is first created.
     """
     if workspace_id not in _chroma_collections:
         _chroma_collections[workspace_id] = {}
     
     if collection_name not in _chroma_collections[workspace_id]:
         client = get_chroma_client(workspace_id)
-        log.info(f"Getting or creating ChromaDB collection '{collection_name}' for workspace '{workspace_id}'.")
+        log.info("Getting or creating ChromaDB collection '%s' for workspace '%s'.", collection_name, workspace_id)
         try:
-            # Get the embedding function from our service to ensure consistency
-            chroma_ef = embedding_service.get_chroma_embedding_function()
+            # Get the shared embedding function to ensure consistency
+            chroma_ef = _get_chroma_ef()
             
             # When providing pre-calculated embeddings (as we do in upsert_item_embedding),
             # ChromaDB does not strictly need an embedding_function at the collection level
@@ -106,22 +462,290 @@ def get_or_create_collection(workspace_id: str, collection_name: str = DEFAULT_C
             # might re-embed or compare based on text, setting it is safer for consistency.
             # Also, get_or_create_collection requires it if the collection *might* be created
             # and needs to know how to handle future text additions.
-            collection = client.get_or_create_collection(
-                name=collection_name,
-                embedding_function=chroma_ef
-            )
+            collection_metadata = dict(DEFAULT_HNSW_CONFIG)
+            if hnsw_config:
+                collection_metadata.update(hnsw_config)
+
+            schema = _build_collection_schema()
+            if schema is not None:
+                collection = client.get_or_create_collection(
+                    name=collection_name,
+                    embedding_function=chroma_ef,
+                    metadata=collection_metadata,
+                    schema=schema
+                )
+            else:
+                collection = client.get_or_create_collection(
+                    name=collection_name,
+                    embedding_function=chroma_ef,
+                    metadata=collection_metadata
+                )
             _chroma_collections[workspace_id][collection_name] = collection
         except Exception as e:
-            log.error(f"Failed to get or create ChromaDB collection '{collection_name}' for workspace '{workspace_id}': {e}", exc_info=True)
+            log.error("Failed to get or create ChromaDB collection '%s' for workspace '%s': %s", collection_name, workspace_id, e, exc_info=True)
             raise
             
     return _chroma_collections[workspace_id][collection_name]
 
+def warmup_workspaces(
+    workspace_ids: List[str],
+    collection_name: str = DEFAULT_COLLECTION_NAME,
+    max_workers: int = 4
+):
+    """
+    Pre-initializes ChromaDB clients and collections for known workspaces so
+    the first real query does not pay the cold-start cost (opening SQLite,
+    loading HNSW index files). Intended for server boot with the list of
+    workspaces from config. Failures are logged per workspace rather than
+    aborting the warmup.
+    """
+    if not workspace_ids:
+        return
+
+    def _warm(workspace_id: str):
+        try:
+            get_or_create_collection(workspace_id, collection_name)
+        except Exception as e:
+            log.warning("Warmup failed for workspace '%s': %s", workspace_id, e)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_warm, workspace_ids))
+    log.info("Warmed up vector stores for %s workspaces.", len(workspace_ids))
+
+def build_metadata(item_type: str, item_id: Any, **extra: Any) -> Dict[str, Any]:
+    """
+    Builds an upsert-ready metadata dict with the canonical ConPort keys
+    stamped and list values flattened Chroma-style. Metadata built this way
+    passes through _prepare_chroma_metadata untouched, so bulk callers avoid
+    a second dict allocation per item.
+    """
+    metadata = {
+        key: ", ".join(map(str, value)) if isinstance(value, list) else value
+        for key, value in extra.items()
+    }
+    metadata['conport_item_type'] = item_type
+    metadata['conport_item_id'] = str(item_id)
+    return metadata
+
+def _prepare_chroma_metadata(item_type: str, item_id: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Ensures metadata is suitable for ChromaDB (str, int, float, bool, or None).
+    Converts any list values to strings and stamps the ConPort identifiers.
+    Metadata that is already canonical (both conport_* keys present, no list
+    values — e.g. from build_metadata) is returned as-is without copying.
+    """
+    if (metadata.get('conport_item_type') == item_type
+            and metadata.get('conport_item_id') == str(item_id)
+            and not any(isinstance(value, list) for value in metadata.values())):
+        return metadata
+
+    final_metadata = {}
+    for key, value in metadata.items():
+        if isinstance(value, list):
+            final_metadata[key] = ", ".join(map(str, value))
+        else:
+            final_metadata[key] = value
+
+    # Add item_type and item_id to metadata if not already present, for easier filtering.
+    final_metadata['conport_item_type'] = item_type
+    final_metadata['conport_item_id'] = str(item_id)
+    return final_metadata
+
+def compute_content_hash(text: str) -> str:
+    """
+    Returns a 128-bit blake2b hex digest of the embeddable text. Callers put
+    this in item metadata as 'content_hash' so incremental syncs can skip
+    items whose text has not changed.
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+def _fetch_existing_hashes(collection: chromadb.Collection, doc_ids: List[str]) -> Dict[str, str]:
+    """Fetches the stored content_hash for each doc_id in one collection.get call."""
+    try:
+        existing = collection.get(ids=doc_ids, include=['metadatas'])
+    except Exception as e:
+        # Dedup is an optimization; on failure fall back to upserting everything.
+        log.warning("Could not fetch existing metadata for dedup pre-check: %s", e)
+        return {}
+    hashes: Dict[str, str] = {}
+    for doc_id, metadata in zip(existing.get('ids') or [], existing.get('metadatas') or []):
+        if metadata and metadata.get('content_hash'):
+            hashes[doc_id] = metadata['content_hash']
+    return hashes
+
+def needs_reembed(
+    workspace_id: str,
+    item_type: str,
+    item_id: str,
+    content_hash: str,
+    collection_name: str = DEFAULT_COLLECTION_NAME
+) -> bool:
+    """
+    Returns True if the stored embedding for this item is missing or was
+    computed from different text (by content_hash). Callers can use this
+    before running the embedding model at all, which is where most of the
+    incremental-sync savings come from.
+    """
+    collection = get_or_create_collection(workspace_id, collection_name)
+    doc_id = f"{item_type}_{item_id}"
+    return _fetch_existing_hashes(collection, [doc_id]).get(doc_id) != content_hash
+
+def _filter_unchanged(
+    collection: chromadb.Collection,
+    ids: List[str],
+    embeddings: np.ndarray,
+    metadatas: List[Dict[str, Any]]
+) -> Tuple[List[str], np.ndarray, List[Dict[str, Any]]]:
+    """
+    Drops items whose stored content_hash matches the incoming one. Items
+    without a content_hash in their metadata are always kept.
+    """
+    if not any(metadata.get('content_hash') for metadata in metadatas):
+        return ids, embeddings, metadatas
+    existing_hashes = _fetch_existing_hashes(collection, ids)
+    if not existing_hashes:
+        return ids, embeddings, metadatas
+    kept = [
+        i for i, (doc_id, metadata) in enumerate(zip(ids, metadatas))
+        if not metadata.get('content_hash') or existing_hashes.get(doc_id) != metadata['content_hash']
+    ]
+    if len(kept) < len(ids):
+        log.info("Skipping %s of %s embeddings with unchanged content_hash.", len(ids) - len(kept), len(ids))
+    return [ids[i] for i in kept], embeddings[kept], [metadatas[i] for i in kept]
+
+def _build_upsert_columns(
+    items: List[Tuple[str, str, Vector, Dict[str, Any]]]
+) -> Tuple[List[str], np.ndarray, List[Dict[str, Any]]]:
+    """
+    Builds the parallel ids/embeddings/metadatas columns Chroma's upsert
+    expects. Embeddings are stacked into one contiguous (B, D) float32
+    array so Chroma can take them as a buffer instead of rebuilding a
+    contiguous block from B separate vectors.
+
+    Item fields are staged column-wise (item_types/item_ids/extras) so each
+    pass touches one homogeneous list at a time; per-item metadata dicts are
+    only materialized at the Chroma-call boundary, since list-of-dicts is
+    what its API takes today. If Chroma grows a columnar metadata API the
+    columns can be passed through without touching callers.
+    """
+    item_types = [item[0] for item in items]
+    item_ids = [item[1] for item in items]
+    extras = [item[3] for item in items]
+
+    ids = [f"{item_type}_{item_id}" for item_type, item_id in zip(item_types, item_ids)]
+    embeddings = np.stack([_as_float32(item[2]) for item in items])
+    metadatas = [
+        _prepare_chroma_metadata(item_type, item_id, extra)
+        for item_type, item_id, extra in zip(item_types, item_ids, extras)
+    ]
+    return ids, embeddings, metadatas
+
+def upsert_items_batch(
+    workspace_id: str,
+    items: List[Tuple[str, str, Vector, Dict[str, Any]]], # (item_type, item_id, vector, metadata)
+    collection_name: str = DEFAULT_COLLECTION_NAME,
+    batch_size: int = UPSERT_BATCH_SIZE
+):
+    """
+    Adds or updates multiple embeddings in ChromaDB with one upsert() per batch.
+    Each item is an (item_type, item_id, vector, metadata) tuple; document IDs
+    follow the usual f"{item_type}_{item_id}" convention. Batching amortizes
+    Chroma's per-upsert transaction/fsync cost during bulk syncs.
+    """
+    if not items:
+        return
+    collection = get_or_create_collection(workspace_id, collection_name)
+    ids, embeddings, metadatas = _build_upsert_columns(items)
+    ids, embeddings, metadatas = _filter_unchanged(collection, ids, embeddings, metadatas)
+    if not ids:
+        log.info("All %s embeddings unchanged by content_hash; nothing to upsert.", len(items))
+        return
+
+    for start in range(0, len(ids), batch_size):
+        end = min(start + batch_size, len(ids))
+        try:
+            collection.upsert(
+                ids=ids[start:end],
+                embeddings=embeddings[start:end],
+                metadatas=metadatas[start:end]
+            )
+            log.debug("Upserted embedding batch [%s:%s] into collection '%s' for workspace '%s'.", start, end, collection_name, workspace_id)
+        except Exception as e:
+            log.error("Failed to upsert embedding batch [%s:%s] (ids %s...): %s", start, end, ids[start:end][:5], e, exc_info=True)
+            raise
+    _adjust_collection_count(workspace_id, collection_name, len(ids))
+    log.info("Successfully upserted %s embeddings into collection '%s'.", len(ids), collection_name)
+
+async def aupsert_items(
+    workspace_id: str,
+    items: List[Tuple[str, str, Vector, Dict[str, Any]]], # (item_type, item_id, vector, metadata)
+    collection_name: str = DEFAULT_COLLECTION_NAME,
+    batch_size: int = UPSERT_BATCH_SIZE,
+    concurrency: int = 2
+):
+    """
+    Async variant of upsert_items_batch: schedules the per-batch upserts
+    concurrently via asyncio.to_thread, bounded by a semaphore. This overlaps
+    Python-side list/metadata construction with Chroma's SQLite commits.
+    Concurrency is kept low (2-4) to avoid SQLite write-lock contention.
+    """
+    if not items:
+        return
+    collection = get_or_create_collection(workspace_id, collection_name)
+    ids, embeddings, metadatas = _build_upsert_columns(items)
+    ids, embeddings, metadatas = await asyncio.to_thread(_filter_unchanged, collection, ids, embeddings, metadatas)
+    if not ids:
+        log.info("All %s embeddings unchanged by content_hash; nothing to upsert.", len(items))
+        return
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _upsert_slice(start: int, end: int):
+        async with semaphore:
+            slice_start_time = time.monotonic()
+            try:
+                await asyncio.to_thread(
+                    collection.upsert,
+                    ids=ids[start:end],
+                    embeddings=embeddings[start:end],
+                    metadatas=metadatas[start:end]
+                )
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(
+                        "Upserted embedding batch [%s:%s] into collection '%s' in %.3fs.",
+                        start, end, collection_name, time.monotonic() - slice_start_time
+                    )
+            except Exception as e:
+                log.error("Failed to upsert embedding batch [%s:%s] (ids %s...): %s", start, end, ids[start:end][:5], e, exc_info=True)
+                raise
+
+    await asyncio.gather(*(
+        _upsert_slice(start, min(start + batch_size, len(ids)))
+        for start in range(0, len(ids), batch_size)
+    ))
+    _adjust_collection_count(workspace_id, collection_name, len(ids))
+    log.info("Successfully upserted %s embeddings into collection '%s' (async).", len(ids), collection_name)
+
+def upsert_items_concurrent(
+    workspace_id: str,
+    items: List[Tuple[str, str, Vector, Dict[str, Any]]],
+    collection_name: str = DEFAULT_COLLECTION_NAME,
+    batch_size: int = UPSERT_BATCH_SIZE,
+    concurrency: int = 2
+):
+    """Sync wrapper around aupsert_items for callers without an event loop."""
+    asyncio.run(aupsert_items(
+        workspace_id,
+        items,
+        collection_name=collection_name,
+        batch_size=batch_size,
+        concurrency=concurrency
+    ))
+
 def upsert_item_embedding(
     workspace_id: str,
     item_type: str,
     item_id: str, # This is the original ConPort item's ID (e.g., decision_id, custom_data primary key)
-    vector: List[float],
+    vector: Vector,
     metadata: Dict[str, Any], # Should include original_field, category, tags, timestamps etc.
     collection_name: str = DEFAULT_COLLECTION_NAME
 ):
@@ -131,75 +755,200 @@ def upsert_item_embedding(
     If the item has multiple embeddable fields, this assumes one primary vector per item,
     or that the caller manages separate calls for separate field embeddings with distinct doc_ids.
     Design doc: "ChromaDB documents will use an ID like itemType_itemId" - implies one vector per item.
+    Thin wrapper over upsert_items_batch for single items.
     """
-    collection = get_or_create_collection(workspace_id, collection_name)
-    doc_id = f"{item_type}_{item_id}"
-    
-    # Ensure metadata is suitable for ChromaDB (str, int, float, bool, or None)
-    # Convert any list values to strings.
-    final_metadata = {}
-    for key, value in metadata.items():
-        if isinstance(value, list):
-            final_metadata[key] = ", ".join(map(str, value))
-        else:
-            final_metadata[key] = value
-    
-    # Add item_type and item_id to metadata if not already present, for easier filtering.
-    final_metadata['conport_item_type'] = item_type
-    final_metadata['conport_item_id'] = str(item_id)
+    log.debug("Upserting embedding for doc_id '%s_%s' in collection '%s' for workspace '%s'.", item_type, item_id, collection_name, workspace_id)
+    upsert_items_batch(
+        workspace_id,
+        [(item_type, item_id, vector, metadata)],
+        collection_name=collection_name
+    )
+
+@functools.lru_cache(maxsize=256)
+def _normalize_filters_cached(frozen_items: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+    """Rebuilds the canonical filter dict for a frozen key/value tuple."""
+    return dict(frozen_items)
 
-    log.debug(f"Upserting embedding for doc_id '{doc_id}' in collection '{collection_name}' for workspace '{workspace_id}'.")
+def _normalize_filters(filters: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Returns a canonical, cached dict for simple flat filters. ConPort issues
+    the same handful of filter shapes (e.g. {"conport_item_type": X}) at high
+    rates, so reusing one dict object per shape avoids re-allocating and
+    re-validating it on every query. Filters with unhashable values (nested
+    $and/$or shapes) pass through unchanged.
+    """
+    if not filters:
+        return None
     try:
-        collection.upsert(
-            ids=[doc_id],
-            embeddings=[vector],
-            metadatas=[final_metadata]
-        )
-        log.info(f"Successfully upserted embedding for doc_id '{doc_id}'.")
-    except Exception as e:
-        log.error(f"Failed to upsert embedding for doc_id '{doc_id}': {e}", exc_info=True)
-        # Decide on error handling: raise, or return status
-        raise
+        return _normalize_filters_cached(tuple(sorted(filters.items())))
+    except TypeError:
+        return filters
 
-def query_vector_store(
+def _exact_rerank_order(candidate_embeddings, query_vector: np.ndarray, top_k: int) -> Optional[np.ndarray]:
+    """
+    Returns the indices of the top_k candidates by exact cosine similarity,
+    best first, or None if the embeddings are unusable. One BLAS
+    matrix-vector product over a contiguous float32 matrix scores every
+    candidate at once.
+    """
+    if candidate_embeddings is None or len(candidate_embeddings) == 0:
+        return None
+    matrix = np.ascontiguousarray(candidate_embeddings, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1)
+    query_norm = float(np.linalg.norm(query_vector))
+    if query_norm == 0.0 or not np.all(norms > 0.0):
+        return None
+    scores = (matrix @ query_vector) / (norms * query_norm)
+    if len(scores) <= top_k:
+        return np.argsort(-scores, kind='stable')
+    # argpartition narrows to the top_k first so the full sort is O(K log K).
+    top = np.argpartition(-scores, top_k - 1)[:top_k]
+    return top[np.argsort(-scores[top], kind='stable')]
+
+def query_vector_store_batch(
     workspace_id: str,
-    query_vector: List[float],
+    query_vectors: List[Vector],
     top_k: int = 5,
     filters: Optional[Dict[str, Any]] = None, # ChromaDB 'where' clause
-    collection_name: str = DEFAULT_COLLECTION_NAME
-) -> List[Dict[str, Any]]:
+    collection_name: str = DEFAULT_COLLECTION_NAME,
+    include_documents: bool = False,
+    rerank_overfetch: int = 0
+) -> List[List[Dict[str, Any]]]:
     """
-    Queries the ChromaDB collection for similar embeddings.
+    Queries the ChromaDB collection with multiple query vectors in a single
+    call, returning one result list per query vector. Passing all vectors at
+    once amortizes the per-call HNSW setup and filter compilation that a
+    query-per-vector loop would pay N times.
+
+    Document blobs are the largest part of a result payload and ConPort
+    resolves hits through metadata, so they are only fetched (and surfaced
+    as 'document_text') when include_documents=True.
+
+    With rerank_overfetch > 1, top_k * rerank_overfetch candidates are
+    fetched with their embeddings and re-scored by exact cosine similarity
+    (one BLAS matrix-vector product per query), then trimmed back to top_k.
+    This recovers recall the approximate HNSW search (search_ef=50) may give
+    up, at the cost of a larger candidate fetch.
     """
     collection = get_or_create_collection(workspace_id, collection_name)
-    log.debug(f"Querying collection '{collection_name}' in workspace '{workspace_id}' with top_k={top_k}, filters={filters}.")
+    filters = _normalize_filters(filters)
+    log.debug("Querying collection '%s' in workspace '%s' with %s vectors, top_k=%s, filters=%s.", collection_name, workspace_id, len(query_vectors), top_k, filters)
+    rerank = rerank_overfetch > 1
+    fetch_k = top_k * rerank_overfetch if rerank else top_k
+    include = ['metadatas', 'distances']
+    if include_documents:
+        include.append('documents')
+    if rerank:
+        include.append('embeddings')
     try:
+        query_matrix = np.asarray(query_vectors, dtype=np.float32)
         results = collection.query(
-            query_embeddings=[query_vector],
-            n_results=top_k,
-            where=filters if filters else None, # Pass None if no filters
-            include=['metadatas', 'distances', 'documents'] # 'documents' if text was stored, 'embeddings' if needed
+            query_embeddings=query_matrix,
+            n_results=fetch_k,
+            where=filters, # None when no filters
+            include=include
         )
         # Process results:
         # results is a QueryResult object. Example:
         # QueryResult(ids=[['id1', 'id2']], embeddings=None, documents=[['doc1', 'doc2']], metadatas=[[{'key': 'val1'}, {'key': 'val2'}]], distances=[[0.1, 0.2]])
         # We are interested in metadatas and distances primarily to identify original items.
-        
-        processed_results = []
-        if results and results.get('ids') and results.get('ids')[0]:
-            for i, doc_id in enumerate(results['ids'][0]):
+        # The outer lists are parallel to query_vectors.
+
+        all_ids = results.get('ids') if results else None
+        all_distances = results.get('distances') if results else None
+        all_metadatas = results.get('metadatas') if results else None
+        all_documents = results.get('documents') if results and include_documents else None
+        all_embeddings = results.get('embeddings') if results and rerank else None
+
+        per_query_results: List[List[Dict[str, Any]]] = []
+        for q in range(len(query_vectors)):
+            processed_results = []
+            query_ids = all_ids[q] if all_ids and q < len(all_ids) else []
+            order = range(len(query_ids))
+            if rerank and query_ids:
+                candidate_embeddings = all_embeddings[q] if all_embeddings is not None and q < len(all_embeddings) else None
+                exact_order = _exact_rerank_order(candidate_embeddings, query_matrix[q], top_k)
+                if exact_order is not None:
+                    order = exact_order
+                else:
+                    order = range(min(top_k, len(query_ids)))
+            for i in order:
+                doc_id = query_ids[i]
                 entry = {
                     "chroma_doc_id": doc_id,
-                    "distance": results['distances'][0][i] if results.get('distances') and results['distances'][0] else None,
-                    "metadata": results['metadatas'][0][i] if results.get('metadatas') and results['metadatas'][0] else None,
-                    # "document_text": results['documents'][0][i] if results.get('documents') and results['documents'][0] else None, # If text was stored
+                    "distance": all_distances[q][i] if all_distances and all_distances[q] else None,
+                    "metadata": all_metadatas[q][i] if all_metadatas and all_metadatas[q] else None,
                 }
+                if include_documents:
+                    entry["document_text"] = all_documents[q][i] if all_documents and all_documents[q] else None
                 processed_results.append(entry)
-        
-        log.info(f"Vector store query returned {len(processed_results)} results.")
-        return processed_results
+            per_query_results.append(processed_results)
+
+        log.info("Vector store batch query returned results for %s queries.", len(per_query_results))
+        return per_query_results
+    except Exception as e:
+        log.error("Failed to query vector store: %s", e, exc_info=True)
+        raise
+
+def query_vector_store(
+    workspace_id: str,
+    query_vector: Vector,
+    top_k: int = 5,
+    filters: Optional[Dict[str, Any]] = None, # ChromaDB 'where' clause
+    collection_name: str = DEFAULT_COLLECTION_NAME,
+    include_documents: bool = False,
+    rerank_overfetch: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    Queries the ChromaDB collection for similar embeddings.
+    Thin wrapper over query_vector_store_batch for a single query vector.
+    """
+    return query_vector_store_batch(
+        workspace_id,
+        [query_vector],
+        top_k=top_k,
+        filters=filters,
+        collection_name=collection_name,
+        include_documents=include_documents,
+        rerank_overfetch=rerank_overfetch
+    )[0]
+
+# Page size for filter-based deletes; bounds how many ids are materialized
+# per round-trip when clearing out a whole category or item type.
+DELETE_BATCH_SIZE = 10000
+
+def delete_items_by_filter(
+    workspace_id: str,
+    filters: Dict[str, Any], # ChromaDB 'where' clause
+    limit: int = DELETE_BATCH_SIZE,
+    collection_name: str = DEFAULT_COLLECTION_NAME
+) -> int:
+    """
+    Deletes all embeddings matching a metadata filter, paging through matches
+    in batches of `limit`. One get+delete round-trip per batch replaces the
+    N single-id deletes a caller loop would otherwise issue. Returns the
+    total number of documents deleted.
+    """
+    collection = get_or_create_collection(workspace_id, collection_name)
+    log.debug("Deleting embeddings matching %s from collection '%s' for workspace '%s'.", filters, collection_name, workspace_id)
+    total_deleted = 0
+    try:
+        while True:
+            # collection.delete(where=...) returns no count, so page ids
+            # explicitly to know when the filter is exhausted.
+            matched = collection.get(where=filters, limit=limit, include=[])
+            matched_ids = matched.get('ids') or []
+            if not matched_ids:
+                break
+            collection.delete(ids=matched_ids)
+            total_deleted += len(matched_ids)
+            if len(matched_ids) < limit:
+                break
+        _adjust_collection_count(workspace_id, collection_name, -total_deleted)
+        log.info("Deleted %s embeddings matching %s from collection '%s'.", total_deleted, filters, collection_name)
+        return total_deleted
     except Exception as e:
-        log.error(f"Failed to query vector store: {e}", exc_info=True)
+        log.error("Failed to delete embeddings matching %s: %s", filters, e, exc_info=True)
         raise
 
 def delete_item_embedding(
@@ -210,18 +959,40 @@ def delete_item_embedding(
 ):
     """
     Deletes an embedding from ChromaDB based on its ConPort item_type and item_id.
+    Thin wrapper over delete_items_by_filter.
     """
-    collection = get_or_create_collection(workspace_id, collection_name)
-    doc_id = f"{item_type}_{item_id}"
-    log.debug(f"Attempting to delete embedding for doc_id '{doc_id}' from collection '{collection_name}' for workspace '{workspace_id}'.")
-    try:
-        collection.delete(ids=[doc_id])
-        log.info(f"Successfully deleted embedding for doc_id '{doc_id}' (if it existed).")
-    except Exception as e:
-        # ChromaDB might not error if ID doesn't exist, check its behavior.
-        # For now, log error and re-raise.
-        log.error(f"Failed to delete embedding for doc_id '{doc_id}': {e}", exc_info=True)
-        raise
+    log.debug("Attempting to delete embedding for doc_id '%s_%s' from collection '%s' for workspace '%s'.", item_type, item_id, collection_name, workspace_id)
+    delete_items_by_filter(
+        workspace_id,
+        filters={"$and": [
+            {"conport_item_type": item_type},
+            {"conport_item_id": str(item_id)},
+        ]},
+        collection_name=collection_name
+    )
+
+def delete_item_embeddings(
+    workspace_id: str,
+    item_type: str,
+    item_ids: List[str],
+    collection_name: str = DEFAULT_COLLECTION_NAME
+):
+    """
+    Deletes the embeddings of several ConPort items of one type in a single
+    filtered delete ($in over conport_item_id) instead of one round-trip per
+    item. Thin wrapper over delete_items_by_filter.
+    """
+    if not item_ids:
+        return
+    log.debug("Attempting to delete %s '%s' embeddings from collection '%s' for workspace '%s'.", len(item_ids), item_type, collection_name, workspace_id)
+    delete_items_by_filter(
+        workspace_id,
+        filters={"$and": [
+            {"conport_item_type": item_type},
+            {"conport_item_id": {"$in": [str(item_id) for item_id in item_ids]}},
+        ]},
+        collection_name=collection_name
+    )
 
 def delete_workspace_vector_store(workspace_id: str):
     """
@@ -230,21 +1001,19 @@ def delete_workspace_vector_store(workspace_id: str):
     """
     vector_store_path = _get_vector_store_path(workspace_id)
     if os.path.exists(vector_store_path):
-        log.warning(f"Deleting entire vector store for workspace '{workspace_id}' at path: {vector_store_path}")
+        log.warning("Deleting entire vector store for workspace '%s' at path: %s", workspace_id, vector_store_path)
         try:
-            # Clear caches if client/collections were loaded
-            if workspace_id in _chroma_clients:
-                del _chroma_clients[workspace_id]
-            if workspace_id in _chroma_collections:
-                del _chroma_collections[workspace_id]
-            
+            # Stop and evict any cached client/collections so file handles are
+            # released before the directory is removed.
+            invalidate_workspace(workspace_id)
+
             shutil.rmtree(vector_store_path)
-            log.info(f"Successfully deleted vector store for workspace '{workspace_id}'.")
+            log.info("Successfully deleted vector store for workspace '%s'.", workspace_id)
         except Exception as e:
-            log.error(f"Failed to delete vector store for workspace '{workspace_id}': {e}", exc_info=True)
+            log.error("Failed to delete vector store for workspace '%s': %s", workspace_id, e, exc_info=True)
             raise
     else:
-        log.info(f"No vector store found at '{vector_store_path}' for workspace '{workspace_id}', nothing to delete.")
+        log.info("No vector store found at '%s' for workspace '%s', nothing to delete.", vector_store_path, workspace_id)
 
 
 if __name__ == '__main__':
@@ -264,14 +1033,14 @@ if __name__ == '__main__':
     # Test workspace - use a temporary directory for testing
     import tempfile
     test_workspace_dir = tempfile.mkdtemp(prefix="conport_test_ws_")
-    log.info(f"Using temporary test workspace: {test_workspace_dir}")
+    log.info("Using temporary test workspace: %s", test_workspace_dir)
 
     try:
         log.info("--- Testing ChromaDB Service ---")
 
         # Test get_or_create_collection
         collection = get_or_create_collection(test_workspace_dir, "my_test_collection")
-        log.info(f"Got/Created collection: {collection.name}, count: {collection.count()}")
+        log.info("Got/Created collection: %s, count: %s", collection.name, collection.count())
         assert collection.name == "my_test_collection"
 
         # Test upsert
@@ -283,22 +1052,22 @@ if __name__ == '__main__':
         metadata_2 = {"category": "secrets", "timestamp_created": "2023-01-02T11:00:00Z"}
         upsert_item_embedding(test_workspace_dir, "custom_data", "api_key_service_x", mock_vector_2, metadata_2, collection_name="my_test_collection")
         
-        log.info(f"Collection count after upserts: {collection.count()}")
+        log.info("Collection count after upserts: %s", collection.count())
         assert collection.count() == 2
 
         # Test query
         query_text = "information about databases"
         query_vector = get_mock_embedding(query_text)
         
-        log.info(f"Querying for: '{query_text}'")
+        log.info("Querying for: '%s'", query_text)
         results = query_vector_store(test_workspace_dir, query_vector, top_k=1, collection_name="my_test_collection")
-        log.info(f"Query results: {results}")
+        log.info("Query results: %s", results)
         assert len(results) == 1
         assert results[0]['chroma_doc_id'] == "decision_1"
         assert results[0]['metadata']['conport_item_type'] == "decision"
 
         # Test query with filter
-        log.info(f"Querying for: '{query_text}' with item_type filter 'custom_data'")
+        log.info("Querying for: '%s' with item_type filter 'custom_data'", query_text)
         # ChromaDB filter syntax: {"metadata_field": "value"} or {"$operator": {"metadata_field": "value"}}
         # Our metadata keys are conport_item_type, conport_item_id, etc.
         results_filtered = query_vector_store(
@@ -308,7 +1077,7 @@ if __name__ == '__main__':
             filters={"conport_item_type": "custom_data"},
             collection_name="my_test_collection"
         )
-        log.info(f"Filtered query results: {results_filtered}")
+        log.info("Filtered query results: %s", results_filtered)
         # This query might still return decision_1 if it's closer, filter applies to candidates.
         # If "information about databases" is much closer to decision_1 than "API keys", it might still be top.
         # A better test for filtering would be a query text closer to the filtered item.
@@ -321,19 +1090,19 @@ if __name__ == '__main__':
             filters={"conport_item_type": "custom_data"},
             collection_name="my_test_collection"
         )
-        log.info(f"Querying for '{query_text_secrets}' with item_type filter 'custom_data': {results_filtered_secrets}")
+        log.info("Querying for '%s' with item_type filter 'custom_data': %s", query_text_secrets, results_filtered_secrets)
         assert len(results_filtered_secrets) == 1
         assert results_filtered_secrets[0]['chroma_doc_id'] == "custom_data_api_key_service_x"
 
 
         # Test delete
         delete_item_embedding(test_workspace_dir, "decision", "1", collection_name="my_test_collection")
-        log.info(f"Collection count after delete: {collection.count()}")
+        log.info("Collection count after delete: %s", collection.count())
         assert collection.count() == 1
         
         # Verify deletion
         results_after_delete = query_vector_store(test_workspace_dir, query_vector, top_k=1, collection_name="my_test_collection")
-        log.info(f"Query results after delete: {results_after_delete}")
+        log.info("Query results after delete: %s", results_after_delete)
         if results_after_delete: # if something is returned
             assert results_after_delete[0]['chroma_doc_id'] != "decision_1"
 
@@ -341,18 +1110,18 @@ if __name__ == '__main__':
         log.info("--- ChromaDB Service Test Completed Successfully ---")
 
     except Exception as e:
-        log.error(f"An error occurred during vector_store_service testing: {e}", exc_info=True)
+        log.error("An error occurred during vector_store_service testing: %s", e, exc_info=True)
     finally:
         # Clean up the temporary directory
-        log.info(f"Cleaning up temporary test workspace: {test_workspace_dir}")
+        log.info("Cleaning up temporary test workspace: %s", test_workspace_dir)
         # First, try to delete the vector store explicitly to test that function
         try:
             delete_workspace_vector_store(test_workspace_dir) # This should clear _chroma_clients and _chroma_collections cache for this ws_id
         except Exception as e:
-            log.error(f"Error during explicit vector store deletion: {e}")
+            log.error("Error during explicit vector store deletion: %s", e)
         
         # Then remove the whole temp dir
         try:
             shutil.rmtree(test_workspace_dir)
         except Exception as e:
-            log.error(f"Error cleaning up temp directory {test_workspace_dir}: {e}")
\ No newline at end of file
+            log.error("Error cleaning up temp directory %s: %s", test_workspace_dir, e)
\ No newline at end of file
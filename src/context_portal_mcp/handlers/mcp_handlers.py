@@ -1,15 +1,27 @@
 """Functions implementing the logic for each MCP tool."""
 
+import asyncio
+import functools
+import itertools
 import logging
+import operator
 import os
+import sys
 from pathlib import Path
 import json
+import mmap
 import re # For markdown parsing
 import hashlib
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timezone # Added missing import
 
-from pydantic import ValidationError
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from pydantic import TypeAdapter, ValidationError
 
 from ..db import database as db
 from ..db import models
@@ -19,6 +31,110 @@ from ..db import vector_store_service # Added for semantic search
 
 log = logging.getLogger(__name__)
 
+# orjson accelerates the custom-data value JSON work in export and import when
+# it is installed; the stdlib json module is the drop-in fallback, mirroring
+# the optional binding in db.database.
+try:
+    import orjson
+
+    def _dumps_value_indented(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+    def _dumps_value_compact(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def _dumps_canonical(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS, default=str)
+
+    _loads_value = orjson.loads
+except ImportError:
+    def _dumps_value_indented(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+    def _dumps_value_compact(obj: Any) -> str:
+        return json.dumps(obj)
+
+    def _dumps_canonical(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+    _loads_value = json.loads
+
+# Module-level bindings for the models constructed on every write call;
+# skips the models.<attr> lookup and method-descriptor dispatch per call.
+Decision = models.Decision
+ProgressEntry = models.ProgressEntry
+SystemPattern = models.SystemPattern
+CustomData = models.CustomData
+ContextLink = models.ContextLink
+
+def _dump_model(model) -> Dict[str, Any]:
+    """
+    Serializes a Pydantic model to a JSON-safe dict via model_dump_json,
+    which runs pydantic-core's Rust serializer in one pass instead of
+    walking the model in Python with model_dump(mode='json').
+    """
+    return json.loads(model.model_dump_json())
+
+# Shared empty result for list handlers; never mutate, always return as-is.
+_EMPTY: List[Any] = []
+
+@functools.lru_cache(maxsize=None)
+def _list_dump_adapter(model_type) -> TypeAdapter:
+    """One cached TypeAdapter(List[Model]) per model class, for batched dumps."""
+    return TypeAdapter(List[model_type])
+
+def _dump_model_list(items) -> List[Dict[str, Any]]:
+    """
+    List variant of _dump_model; used by the list-returning tool handlers.
+    Serializes the whole (homogeneous) list in one pydantic-core traversal
+    via a cached TypeAdapter rather than one model_dump_json call per row,
+    which is where large FTS/link responses spend their time.
+    """
+    if not items:
+        return _EMPTY
+    return _list_dump_adapter(type(items[0])).dump_python(items, mode='json')
+
+# --- Version-stamped read cache for hot polling endpoints ---
+# Agents poll product/active context and system patterns far more often than
+# they write them. Each (workspace_id, kind) pair carries a monotonically
+# increasing version that the write handlers bump on success; the read paths
+# memoize on (workspace_id, version), so a poll between writes is an O(1)
+# lru_cache hit and a bump naturally orphans the stale entry (reclaimed by
+# the cache's LRU bound).
+_CTX_VERSION: Dict[Tuple[str, str], int] = {}
+
+def _ctx_version(workspace_id: str, kind: str) -> int:
+    return _CTX_VERSION.get((workspace_id, kind), 0)
+
+def _bump_ctx_version(workspace_id: str, kind: str) -> None:
+    key = (workspace_id, kind)
+    _CTX_VERSION[key] = _CTX_VERSION.get(key, 0) + 1
+
+@functools.lru_cache(maxsize=128)
+def _get_product_context_cached(workspace_id: str, version: int) -> Dict[str, Any]:
+    return db.get_product_context(workspace_id).content
+
+@functools.lru_cache(maxsize=128)
+def _get_active_context_cached(workspace_id: str, version: int) -> Dict[str, Any]:
+    return db.get_active_context(workspace_id).content
+
+@functools.lru_cache(maxsize=128)
+def _get_system_patterns_cached(
+    workspace_id: str,
+    version: int,
+    tags_all: Optional[Tuple[str, ...]],
+    tags_any: Optional[Tuple[str, ...]],
+) -> List[Dict[str, Any]]:
+    patterns_list = db.get_system_patterns(
+        workspace_id,
+        tags_filter_include_all=list(tags_all) if tags_all is not None else None,
+        tags_filter_include_any=list(tags_any) if tags_any is not None else None,
+    )
+    if not patterns_list:
+        return _EMPTY
+    # DB rows deserialize to JSON-native fields; __dict__ copy beats the serializer walk.
+    return [item.to_json_dict() for item in patterns_list]
+
 # --- Tool Handler Functions ---
 
 def handle_get_product_context(args: models.GetContextArgs) -> Dict[str, Any]:
@@ -27,8 +143,9 @@ def handle_get_product_context(args: models.GetContextArgs) -> Dict[str, Any]:
     Assumes 'args' is an already validated Pydantic model instance.
     """
     try:
-        context_model = db.get_product_context(args.workspace_id)
-        return context_model.content
+        return _get_product_context_cached(
+            args.workspace_id, _ctx_version(args.workspace_id, "product")
+        )
     except DatabaseError as e:
         raise ContextPortalError(f"Database error getting product context: {e}")
     except Exception as e:
@@ -47,15 +164,11 @@ def handle_update_product_context(args: models.UpdateContextArgs) -> Dict[str, A
         # for 'content' vs 'patch_content'.
         # The database function 'db.update_product_context' now expects UpdateContextArgs.
         db.update_product_context(args.workspace_id, args)
+        _bump_ctx_version(args.workspace_id, "product")
         # FastMCP expects direct results. A status message is a reasonable result.
         return {"status": "success", "message": "Product context updated successfully."}
-    except ValidationError as e: # Should not happen if FastMCP validates schema, but good for direct calls
-         raise ToolArgumentError(f"Invalid content structure: {e}")
     except DatabaseError as e:
         raise ContextPortalError(f"Database error updating product context: {e}")
-    except Exception as e:
-        log.exception(f"Unexpected error in update_product_context for workspace {args.workspace_id}")
-        raise ContextPortalError(f"Unexpected error in update_product_context: {e}")
 
 def handle_log_decision(args: models.LogDecisionArgs) -> Dict[str, Any]:
     """
@@ -64,7 +177,7 @@ def handle_log_decision(args: models.LogDecisionArgs) -> Dict[str, Any]:
     Returns the logged decision as a dictionary.
     """
     try:
-        decision_to_log = models.Decision(
+        decision_to_log = Decision(
             summary=args.summary,
             rationale=args.rationale,
             implementation_details=args.implementation_details,
@@ -103,12 +216,9 @@ def handle_log_decision(args: models.LogDecisionArgs) -> Dict[str, Any]:
                 log.error(f"Failed to generate/store embedding for decision ID {logged_decision.id}: {e_embed}", exc_info=True)
         # --- End Add to Vector Store ---
 
-        return logged_decision.model_dump(mode='json')
+        return logged_decision.to_json_dict()
     except DatabaseError as e:
         raise ContextPortalError(f"Database error logging decision: {e}")
-    except Exception as e:
-        log.exception(f"Unexpected error in log_decision for workspace {args.workspace_id}")
-        raise ContextPortalError(f"Unexpected error in log_decision: {e}")
 
 # --- Added handlers --- # This comment might be outdated, these are just more handlers
 
@@ -125,12 +235,12 @@ def handle_get_decisions(args: models.GetDecisionsArgs) -> List[Dict[str, Any]]:
             tags_filter_include_all=args.tags_filter_include_all,
             tags_filter_include_any=args.tags_filter_include_any
         )
-        return [d.model_dump(mode='json') for d in decisions_list]
+        if not decisions_list:
+            return _EMPTY
+        # DB rows deserialize to JSON-native fields; __dict__ copy beats the serializer walk.
+        return [item.to_json_dict() for item in decisions_list]
     except DatabaseError as e:
         raise ContextPortalError(f"Database error getting decisions: {e}")
-    except Exception as e:
-        log.exception(f"Unexpected error in get_decisions for workspace {args.workspace_id}")
-        raise ContextPortalError(f"Unexpected error in get_decisions: {e}")
 
 def handle_search_decisions_fts(args: models.SearchDecisionsArgs) -> List[Dict[str, Any]]:
     """
@@ -144,12 +254,9 @@ def handle_search_decisions_fts(args: models.SearchDecisionsArgs) -> List[Dict[s
             query_term=args.query_term,
             limit=args.limit
         )
-        return [d.model_dump(mode='json') for d in decisions_list]
+        return _dump_model_list(decisions_list)
     except DatabaseError as e:
         raise ContextPortalError(f"Database error searching decisions: {e}")
-    except Exception as e:
-        log.exception(f"Unexpected error in search_decisions_fts for workspace {args.workspace_id}")
-        raise ContextPortalError(f"Unexpected error in search_decisions_fts: {e}")
 
 def handle_get_active_context(args: models.GetContextArgs) -> Dict[str, Any]:
     """
@@ -157,13 +264,11 @@ def handle_get_active_context(args: models.GetContextArgs) -> Dict[str, Any]:
     Assumes 'args' is an already validated Pydantic model instance.
     """
     try:
-        context_model = db.get_active_context(args.workspace_id)
-        return context_model.content
+        return _get_active_context_cached(
+            args.workspace_id, _ctx_version(args.workspace_id, "active")
+        )
     except DatabaseError as e:
         raise ContextPortalError(f"Database error getting active context: {e}")
-    except Exception as e:
-        log.exception(f"Unexpected error in get_active_context for workspace {args.workspace_id}")
-        raise ContextPortalError(f"Unexpected error in get_active_context: {e}")
 
 def handle_update_active_context(args: models.UpdateContextArgs) -> Dict[str, Any]:
     """
@@ -176,14 +281,10 @@ def handle_update_active_context(args: models.UpdateContextArgs) -> Dict[str, An
         # for 'content' vs 'patch_content'.
         # The database function 'db.update_active_context' now expects UpdateContextArgs.
         db.update_active_context(args.workspace_id, args)
+        _bump_ctx_version(args.workspace_id, "active")
         return {"status": "success", "message": "Active context updated successfully."}
-    except ValidationError as e: # Should not happen if FastMCP validates
-         raise ToolArgumentError(f"Invalid content structure: {e}")
     except DatabaseError as e:
         raise ContextPortalError(f"Database error updating active context: {e}")
-    except Exception as e:
-        log.exception(f"Unexpected error in update_active_context for workspace {args.workspace_id}")
-        raise ContextPortalError(f"Unexpected error in update_active_context: {e}")
 
 def handle_log_progress(args: models.LogProgressArgs) -> Dict[str, Any]:
     """
@@ -192,7 +293,7 @@ def handle_log_progress(args: models.LogProgressArgs) -> Dict[str, Any]:
     Returns the logged progress entry as a dictionary.
     """
     try:
-        progress_to_log = models.ProgressEntry(
+        progress_to_log = ProgressEntry(
             status=args.status,
             description=args.description,
             parent_id=args.parent_id
@@ -203,7 +304,7 @@ def handle_log_progress(args: models.LogProgressArgs) -> Dict[str, Any]:
         # If linking information is provided, create the link
         if args.linked_item_type and args.linked_item_id and logged_progress.id is not None:
             try:
-                link_to_create = models.ContextLink(
+                link_to_create = ContextLink(
                     source_item_type="progress_entry", # The progress entry is the source
                     source_item_id=str(logged_progress.id), # ID of the newly created progress entry
                     target_item_type=args.linked_item_type,
@@ -245,12 +346,9 @@ def handle_log_progress(args: models.LogProgressArgs) -> Dict[str, Any]:
                 log.error(f"Failed to generate/store embedding for progress entry ID {logged_progress.id}: {e_embed}", exc_info=True)
         # --- End Add to Vector Store ---
 
-        return logged_progress.model_dump(mode='json')
+        return logged_progress.to_json_dict()
     except DatabaseError as e:
         raise ContextPortalError(f"Database error logging progress: {e}")
-    except Exception as e:
-        log.exception(f"Unexpected error in log_progress for workspace {args.workspace_id}")
-        raise ContextPortalError(f"Unexpected error in log_progress: {e}")
 
 def handle_get_progress(args: models.GetProgressArgs) -> List[Dict[str, Any]]:
     """
@@ -265,12 +363,12 @@ def handle_get_progress(args: models.GetProgressArgs) -> List[Dict[str, Any]]:
             parent_id_filter=args.parent_id_filter,
             limit=args.limit
         )
-        return [p.model_dump(mode='json') for p in progress_list]
+        if not progress_list:
+            return _EMPTY
+        # DB rows deserialize to JSON-native fields; __dict__ copy beats the serializer walk.
+        return [item.to_json_dict() for item in progress_list]
     except DatabaseError as e:
         raise ContextPortalError(f"Database error getting progress: {e}")
-    except Exception as e:
-        log.exception(f"Unexpected error in get_progress for workspace {args.workspace_id}")
-        raise ContextPortalError(f"Unexpected error in get_progress: {e}")
 
 def handle_update_progress(args: models.UpdateProgressArgs) -> Dict[str, Any]:
     """
@@ -346,8 +444,9 @@ def handle_log_system_pattern(args: models.LogSystemPatternArgs) -> Dict[str, An
     Returns the logged system pattern as a dictionary.
     """
     try:
-        pattern_to_log = models.SystemPattern(name=args.name, description=args.description, tags=args.tags)
+        pattern_to_log = SystemPattern(name=args.name, description=args.description, tags=args.tags)
         logged_pattern = db.log_system_pattern(args.workspace_id, pattern_to_log)
+        _bump_ctx_version(args.workspace_id, "system_patterns")
 
         # --- Add to Vector Store ---
         if logged_pattern and logged_pattern.id is not None:
@@ -375,12 +474,9 @@ def handle_log_system_pattern(args: models.LogSystemPatternArgs) -> Dict[str, An
                 log.error(f"Failed to generate/store embedding for system pattern ID {logged_pattern.id}: {e_embed}", exc_info=True)
         # --- End Add to Vector Store ---
 
-        return logged_pattern.model_dump(mode='json')
+        return logged_pattern.to_json_dict()
     except DatabaseError as e:
         raise ContextPortalError(f"Database error logging system pattern: {e}")
-    except Exception as e:
-        log.exception(f"Unexpected error in log_system_pattern for workspace {args.workspace_id}")
-        raise ContextPortalError(f"Unexpected error in log_system_pattern: {e}")
 
 def handle_get_system_patterns(args: models.GetSystemPatternsArgs) -> List[Dict[str, Any]]:
     """
@@ -389,17 +485,32 @@ def handle_get_system_patterns(args: models.GetSystemPatternsArgs) -> List[Dict[
     Returns a list of system pattern dictionaries.
     """
     try:
-        patterns_list = db.get_system_patterns(
+        return _get_system_patterns_cached(
             args.workspace_id,
-            tags_filter_include_all=args.tags_filter_include_all,
-            tags_filter_include_any=args.tags_filter_include_any
+            _ctx_version(args.workspace_id, "system_patterns"),
+            tuple(args.tags_filter_include_all) if args.tags_filter_include_all is not None else None,
+            tuple(args.tags_filter_include_any) if args.tags_filter_include_any is not None else None,
         )
-        return [p.model_dump(mode='json') for p in patterns_list]
     except DatabaseError as e:
         raise ContextPortalError(f"Database error getting system patterns: {e}")
-    except Exception as e:
-        log.exception(f"Unexpected error in get_system_patterns for workspace {args.workspace_id}")
-        raise ContextPortalError(f"Unexpected error in get_system_patterns: {e}")
+
+@functools.lru_cache(maxsize=1)
+def _build_tool_schemas() -> Dict[str, Dict[str, Any]]:
+    """
+    Builds the per-tool JSON schemas once. TOOL_ARG_MODELS is fixed at import
+    time and model_json_schema() walks every field on each call, so the full
+    schema dict is generated on first request and reused afterwards.
+    """
+    tool_schemas: Dict[str, Dict[str, Any]] = {}
+    for tool_name, model_class in models.TOOL_ARG_MODELS.items():
+        # Ensure model_class is a Pydantic BaseModel before calling model_json_schema
+        if hasattr(model_class, 'model_json_schema') and callable(model_class.model_json_schema):
+            tool_schemas[tool_name] = model_class.model_json_schema()
+        else:
+            # This case should ideally not happen if TOOL_ARG_MODELS is correctly populated
+            log.warning(f"Model class for tool '{tool_name}' is not a Pydantic model or does not have 'model_json_schema' method.")
+            tool_schemas[tool_name] = {"error": "Schema not available"}
+    return tool_schemas
 
 def handle_get_conport_schema(args: models.GetConportSchemaArgs) -> Dict[str, Dict[str, Any]]:
     """
@@ -409,17 +520,7 @@ def handle_get_conport_schema(args: models.GetConportSchemaArgs) -> Dict[str, Di
     """
     try:
         log.info(f"Handling get_conport_schema for workspace {args.workspace_id}")
-        tool_schemas: Dict[str, Dict[str, Any]] = {}
-        for tool_name, model_class in models.TOOL_ARG_MODELS.items():
-            # Ensure model_class is a Pydantic BaseModel before calling model_json_schema
-            if hasattr(model_class, 'model_json_schema') and callable(model_class.model_json_schema):
-                tool_schemas[tool_name] = model_class.model_json_schema()
-            else:
-                # This case should ideally not happen if TOOL_ARG_MODELS is correctly populated
-                log.warning(f"Model class for tool '{tool_name}' is not a Pydantic model or does not have 'model_json_schema' method.")
-                tool_schemas[tool_name] = {"error": "Schema not available"}
-
-        return tool_schemas
+        return _build_tool_schemas()
     except Exception as e:
         log.exception(f"Unexpected error in get_conport_schema for workspace {args.workspace_id}")
         # Return a more structured error if possible, or a generic one
@@ -468,7 +569,7 @@ def handle_log_custom_data_with_cache_hint(args: models.LogCustomDataWithCacheHi
         cache_score = calculate_content_cache_score(args.value, args.category, args.key)
         
         # Create the custom data model
-        data_to_log = models.CustomData(
+        data_to_log = CustomData(
             category=args.category,
             key=args.key,
             value=args.value,
@@ -525,7 +626,7 @@ def handle_log_custom_data_with_cache_hint(args: models.LogCustomDataWithCacheHi
                 log.debug(f"Skipping embedding for custom_data ID {logged_data.id} ({logged_data.category}/{logged_data.key}) as value is not text-like.")
         # --- End Add to Vector Store ---
 
-        result = logged_data.model_dump(mode='json')
+        result = logged_data.to_json_dict()
         
         # Return suggestion if applicable
         if auto_suggest_cache and args.cache_hint is None:
@@ -539,9 +640,6 @@ def handle_log_custom_data_with_cache_hint(args: models.LogCustomDataWithCacheHi
         return result
     except DatabaseError as e:
         raise ContextPortalError(f"Database error logging custom data with cache hint: {e}")
-    except Exception as e:
-        log.exception(f"Unexpected error in log_custom_data_with_cache_hint for workspace {args.workspace_id}")
-        raise ContextPortalError(f"Unexpected error in log_custom_data_with_cache_hint: {e}")
 
 def handle_log_custom_data(args: models.LogCustomDataArgs) -> Dict[str, Any]:
     """
@@ -553,7 +651,7 @@ def handle_log_custom_data(args: models.LogCustomDataArgs) -> Dict[str, Any]:
         # Calculate cache score for enhanced schema support
         cache_score = calculate_content_cache_score(args.value, args.category, args.key)
         
-        data_to_log = models.CustomData(
+        data_to_log = CustomData(
             category=args.category,
             key=args.key,
             value=args.value,
@@ -610,12 +708,9 @@ def handle_log_custom_data(args: models.LogCustomDataArgs) -> Dict[str, Any]:
                 log.debug(f"Skipping embedding for custom_data ID {logged_data.id} ({logged_data.category}/{logged_data.key}) as value is not text-like.")
         # --- End Add to Vector Store ---
 
-        return logged_data.model_dump(mode='json')
+        return logged_data.to_json_dict()
     except DatabaseError as e:
         raise ContextPortalError(f"Database error logging custom data: {e}")
-    except Exception as e:
-        log.exception(f"Unexpected error in log_custom_data for workspace {args.workspace_id}")
-        raise ContextPortalError(f"Unexpected error in log_custom_data: {e}")
 
 def handle_get_custom_data(args: models.GetCustomDataArgs) -> List[Dict[str, Any]]:
     """
@@ -625,14 +720,14 @@ def handle_get_custom_data(args: models.GetCustomDataArgs) -> List[Dict[str, Any
     """
     try:
         data_list = db.get_custom_data(args.workspace_id, category=args.category, key=args.key)
-        return [d.model_dump(mode='json') for d in data_list]
+        if not data_list:
+            return _EMPTY
+        # DB rows deserialize to JSON-native fields; __dict__ copy beats the serializer walk.
+        return [item.to_json_dict() for item in data_list]
     except ValueError as e: # From db function if key w/o category, or other validation
          raise ToolArgumentError(str(e)) # Pass specific error message
     except DatabaseError as e:
         raise ContextPortalError(f"Database error getting custom data: {e}")
-    except Exception as e:
-        log.exception(f"Unexpected error in get_custom_data for workspace {args.workspace_id}")
-        raise ContextPortalError(f"Unexpected error in get_custom_data: {e}")
 
 def handle_delete_custom_data(args: models.DeleteCustomDataArgs) -> Dict[str, Any]:
     """
@@ -648,9 +743,6 @@ def handle_delete_custom_data(args: models.DeleteCustomDataArgs) -> Dict[str, An
             return {"status": "success", "message": f"Custom data '{args.category}/{args.key}' not found for deletion."}
     except DatabaseError as e:
         raise ContextPortalError(f"Database error deleting custom data: {e}")
-    except Exception as e:
-        log.exception(f"Unexpected error in delete_custom_data for workspace {args.workspace_id}")
-        raise ContextPortalError(f"Unexpected error in delete_custom_data: {e}")
 
 def handle_search_project_glossary_fts(args: models.SearchProjectGlossaryArgs) -> List[Dict[str, Any]]:
     """
@@ -664,12 +756,9 @@ def handle_search_project_glossary_fts(args: models.SearchProjectGlossaryArgs) -
             query_term=args.query_term,
             limit=args.limit
         )
-        return [entry.model_dump(mode='json') for entry in glossary_entries]
+        return _dump_model_list(glossary_entries)
     except DatabaseError as e:
         raise ContextPortalError(f"Database error searching project glossary: {e}")
-    except Exception as e:
-        log.exception(f"Unexpected error in search_project_glossary_fts for workspace {args.workspace_id}")
-        raise ContextPortalError(f"Unexpected error in search_project_glossary_fts: {e}")
 
 def handle_search_custom_data_value_fts(args: models.SearchCustomDataValueArgs) -> List[Dict[str, Any]]:
     """
@@ -683,7 +772,7 @@ def handle_search_custom_data_value_fts(args: models.SearchCustomDataValueArgs)
             category_filter=args.category_filter,
             limit=args.limit
         )
-        return [item.model_dump(mode='json') for item in results]
+        return _dump_model_list(results)
     except DatabaseError as e:
         raise ContextPortalError(f"Database error searching custom data values: {e}")
     except Exception as e:
@@ -692,6 +781,150 @@ def handle_search_custom_data_value_fts(args: models.SearchCustomDataValueArgs)
 
 # --- Semantic Search Handler ---
 
+# --- Similarity-keyed semantic query cache ---
+# Exact-text memoization (below) misses rephrasings that embed to nearly the
+# same vector. This cache keeps the last N answered queries and, when a new
+# query's cosine similarity against a cached vector with the same
+# workspace/filters/top_k exceeds the threshold, returns the cached results
+# without touching the vector store. The cache key carries the workspace's
+# write version (db.get_write_version), so any log_*/delete_*/update_* in
+# the workspace orphans its entries instead of serving pre-write results
+# (including full_item_data snapshots of since-deleted rows). Disable with
+# CONPORT_SEMANTIC_QUERY_CACHE=0 where exact recall matters more than speed.
+_SEMANTIC_QUERY_CACHE_ENABLED = os.environ.get(
+    "CONPORT_SEMANTIC_QUERY_CACHE", "1"
+).lower() not in ("0", "false", "off")
+# Over-fetch multiplier for exact-cosine re-ranking of semantic search hits
+# (e.g. 4 fetches 4*top_k candidates with embeddings and re-scores them via
+# one BLAS matrix-vector product). 0 disables re-ranking; HNSW order is
+# returned as-is.
+_SEMANTIC_RERANK_OVERFETCH = int(os.environ.get("CONPORT_SEMANTIC_RERANK_OVERFETCH", "0"))
+_SEMANTIC_QUERY_CACHE_SIZE = 128
+_SEMANTIC_QUERY_CACHE_THRESHOLD = 0.97
+# Cached unit vectors are quantized to int8 (symmetric, scale 127: unit
+# vector components are in [-1, 1]) so each entry stores 1 byte per
+# dimension instead of 4 and the scoring pass moves a quarter of the
+# memory. Integer dot products are rescaled by 1/127^2 back to cosine;
+# the rounding error (std ~2e-3 at 384 dims) is far below the 0.97
+# threshold. Set CONPORT_SEMANTIC_QUERY_CACHE_QUANT=off to keep float32.
+_SEMANTIC_QUERY_CACHE_QUANTIZE = os.environ.get(
+    "CONPORT_SEMANTIC_QUERY_CACHE_QUANT", "int8"
+).lower() not in ("0", "false", "off")
+_INT8_QUANT_SCALE = 127.0
+# Entries are (unit_vector, cache_key, results); LRU order, most recent last.
+_semantic_query_cache: List[Tuple[Any, str, List[Dict[str, Any]]]] = []
+_semantic_query_cache_lock = threading.Lock()
+
+def _quantize_unit_vector(unit: "np.ndarray") -> "np.ndarray":
+    """Quantizes a unit vector to int8 with the fixed symmetric scale."""
+    return np.clip(np.rint(unit * _INT8_QUANT_SCALE), -127, 127).astype(np.int8)
+
+def _semantic_query_cache_lookup(cache_key: str, query_vector) -> Optional[List[Dict[str, Any]]]:
+    """Returns cached results for a near-identical query, or None."""
+    norm = float(np.linalg.norm(query_vector))
+    if norm == 0.0:
+        return None
+    unit = np.asarray(query_vector, dtype=np.float32) / norm
+    if _SEMANTIC_QUERY_CACHE_QUANTIZE:
+        query = _quantize_unit_vector(unit).astype(np.int32)
+    else:
+        query = unit
+    with _semantic_query_cache_lock:
+        candidates = [i for i, e in enumerate(_semantic_query_cache) if e[1] == cache_key]
+        if not candidates:
+            return None
+        # One matrix-vector product scores every candidate at once.
+        sims = np.stack([_semantic_query_cache[i][0] for i in candidates]) @ query
+        if _SEMANTIC_QUERY_CACHE_QUANTIZE:
+            sims = sims / (_INT8_QUANT_SCALE * _INT8_QUANT_SCALE)
+        best = int(np.argmax(sims))
+        if float(sims[best]) < _SEMANTIC_QUERY_CACHE_THRESHOLD:
+            return None
+        entry = _semantic_query_cache.pop(candidates[best])
+        _semantic_query_cache.append(entry)
+        return list(entry[2])
+
+def _semantic_query_cache_insert(cache_key: str, query_vector, results: List[Dict[str, Any]]) -> None:
+    norm = float(np.linalg.norm(query_vector))
+    if norm == 0.0:
+        return
+    unit = np.asarray(query_vector, dtype=np.float32) / norm
+    if _SEMANTIC_QUERY_CACHE_QUANTIZE:
+        unit = _quantize_unit_vector(unit)
+    with _semantic_query_cache_lock:
+        _semantic_query_cache.append((unit, cache_key, list(results)))
+        if len(_semantic_query_cache) > _SEMANTIC_QUERY_CACHE_SIZE:
+            del _semantic_query_cache[0]
+
+@functools.lru_cache(maxsize=1024)
+def _cached_query_embedding(ws_id: str, text: str):
+    """
+    Two-tier memoization of query-text embeddings: this process-level LRU
+    sits in front of the workspace's persistent embedding_cache table (via
+    _get_embedding_cached). Encoding a query costs tens to hundreds of
+    milliseconds on the sentence-transformer model and agents repeat or
+    lightly rephrase searches constantly; a RAM hit is a dict lookup, and
+    after a restart (or from a sibling worker process) the SQLite tier
+    still answers with one point lookup instead of a model invocation.
+    """
+    return _get_embedding_cached(ws_id, text)
+
+def _get_embedding_cached(ws_id: str, text: str) -> Any:
+    """
+    Returns the embedding for text, consulting the workspace's persistent
+    embedding_cache table first. The batch handlers (and through them the
+    markdown import) call this so re-imports of unchanged items skip the
+    sentence-transformer invocation entirely. Cache misbehavior (e.g. a
+    legacy database without the table) degrades to computing the embedding.
+    """
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=32).digest()
+    model_name = embedding_service.DEFAULT_MODEL_NAME
+    try:
+        cached = db.get_cached_embedding(ws_id, digest, model_name)
+    except DatabaseError as e:
+        log.debug(f"Embedding cache lookup failed, computing directly: {e}")
+        cached = None
+    if cached is not None:
+        return np.frombuffer(cached, dtype=np.float32)
+    vector = embedding_service.get_embedding(text)
+    try:
+        db.store_cached_embedding(ws_id, digest, model_name, np.asarray(vector, dtype=np.float32).tobytes())
+    except DatabaseError as e:
+        log.debug(f"Embedding cache store failed: {e}")
+    return vector
+
+def _get_embeddings_cached(ws_id: str, texts: List[str]) -> List[Any]:
+    """
+    Batch variant of _get_embedding_cached: cache hits are served from the
+    embedding_cache table and all misses are encoded in one
+    embedding_service.get_embeddings call instead of one model invocation
+    per text. Returns vectors in the order of texts.
+    """
+    model_name = embedding_service.DEFAULT_MODEL_NAME
+    digests = [hashlib.blake2b(t.encode("utf-8"), digest_size=32).digest() for t in texts]
+    vectors: List[Any] = [None] * len(texts)
+    miss_indices = []
+    for i, digest in enumerate(digests):
+        try:
+            cached = db.get_cached_embedding(ws_id, digest, model_name)
+        except DatabaseError as e:
+            log.debug(f"Embedding cache lookup failed, computing directly: {e}")
+            cached = None
+        if cached is not None:
+            vectors[i] = np.frombuffer(cached, dtype=np.float32)
+        else:
+            miss_indices.append(i)
+    if miss_indices:
+        computed = embedding_service.get_embeddings([texts[i] for i in miss_indices])
+        for row, i in enumerate(miss_indices):
+            vector = np.ascontiguousarray(computed[row])
+            vectors[i] = vector
+            try:
+                db.store_cached_embedding(ws_id, digests[i], model_name, vector.tobytes())
+            except DatabaseError as e:
+                log.debug(f"Embedding cache store failed: {e}")
+    return vectors
+
 async def handle_semantic_search_conport(args: models.SemanticSearchConportArgs) -> List[Dict[str, Any]]:
     """
     Handles the 'semantic_search_conport' MCP tool.
@@ -701,35 +934,53 @@ async def handle_semantic_search_conport(args: models.SemanticSearchConportArgs)
         query_preview = args.query_text[:50] + "..." if len(args.query_text) > 50 else args.query_text
         log.info(f"Handling semantic_search_conport for workspace {args.workspace_id} with query: '{query_preview}'")
 
-        query_vector = embedding_service.get_embedding(args.query_text)
+        query_vector = _cached_query_embedding(args.workspace_id, args.query_text)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"Query embedding cache: {_cached_query_embedding.cache_info()}")
 
-        # Construct ChromaDB filters
-        chroma_filters = {}
+        # Construct ChromaDB filters. When no filter arguments are given at
+        # all this stays None and the query skips Chroma's metadata scan
+        # entirely (pure vector fast path).
         and_conditions = []
 
-        if args.filter_item_types:
+        has_tag_filters = bool(args.filter_tags_include_all or args.filter_tags_include_any)
+        if has_tag_filters:
+            # Tag filters used to be pushed down as nested $and/$or
+            # $contains scans, Chroma's slowest filter path. Resolve them to
+            # candidate ids in SQLite first (exact tag membership, matching
+            # get_decisions' semantics) and hand Chroma an $in on the two
+            # keys its schema keeps inverted indexes for.
+            taggable_types = [
+                t for t in (args.filter_item_types or list(db.TAGGED_ITEM_TABLES))
+                if t in db.TAGGED_ITEM_TABLES
+            ]
+            ids_by_type = await asyncio.to_thread(
+                db.get_item_ids_by_tags,
+                args.workspace_id,
+                taggable_types,
+                args.filter_tags_include_all,
+                args.filter_tags_include_any,
+            )
+            matched_types = [t for t in taggable_types if ids_by_type.get(t)]
+            if not matched_types:
+                return _EMPTY
+            and_conditions.append({"conport_item_type": {"$in": matched_types}})
+            and_conditions.append({"conport_item_id": {"$in": [
+                str(item_id) for t in matched_types for item_id in ids_by_type[t]
+            ]}})
+        elif args.filter_item_types:
             and_conditions.append({"conport_item_type": {"$in": args.filter_item_types}})
 
-        if args.filter_tags_include_all:
-            # For $all behavior with $contains, we need an $and for each tag
-            tag_all_conditions = [{"tags": {"$contains": tag}} for tag in args.filter_tags_include_all]
-            if tag_all_conditions:
-                and_conditions.append({"$and": tag_all_conditions})
-
-        if args.filter_tags_include_any:
-            # For $or behavior with $contains
-            tag_any_conditions = [{"tags": {"$contains": tag}} for tag in args.filter_tags_include_any]
-            if tag_any_conditions:
-                and_conditions.append({"$or": tag_any_conditions})
-
-        if args.filter_custom_data_categories:
-            # This filter is only meaningful if 'custom_data' is in item_types or no item_types are specified
+        if args.filter_custom_data_categories and not has_tag_filters:
+            # This filter is only meaningful if 'custom_data' is in item_types or no item_types are specified.
+            # (With tag filters active, custom_data items are excluded anyway: they carry no tags.)
             category_condition = {"category": {"$in": args.filter_custom_data_categories}}
             if args.filter_item_types and 'custom_data' in args.filter_item_types:
                 and_conditions.append(category_condition)
             elif not args.filter_item_types: # If no item_type filter, apply category filter broadly (might hit non-custom-data items if they had 'category' metadata)
                  and_conditions.append(category_condition)
 
+        chroma_filters = None
         if and_conditions:
             if len(and_conditions) == 1:
                 chroma_filters = and_conditions[0]
@@ -738,38 +989,59 @@ async def handle_semantic_search_conport(args: models.SemanticSearchConportArgs)
 
         log.debug(f"ChromaDB query filters: {chroma_filters}")
 
+        cache_key = None
+        if _SEMANTIC_QUERY_CACHE_ENABLED:
+            cache_key = (
+                f"{args.workspace_id}|{db.get_write_version(args.workspace_id)}"
+                f"|{args.top_k}|{json.dumps(chroma_filters, sort_keys=True)}"
+            )
+            cached_results = _semantic_query_cache_lookup(cache_key, query_vector)
+            if cached_results is not None:
+                log.debug("Semantic query cache hit; skipping vector store query.")
+                return cached_results
+
         search_results = vector_store_service.query_vector_store(
             workspace_id=args.workspace_id,
             query_vector=query_vector,
             top_k=args.top_k,
-            filters=chroma_filters if chroma_filters else None
+            filters=chroma_filters if chroma_filters else None,
+            rerank_overfetch=_SEMANTIC_RERANK_OVERFETCH
         )
 
         # Process results: search_results is List[Dict] with 'chroma_doc_id', 'distance', 'metadata'
-        # We need to potentially fetch full items from SQLite based on metadata.conport_item_id and conport_item_type
-        # For now, just return the direct results from vector store, which includes metadata.
-        # A more advanced version would re-hydrate with full SQLite objects.
-
-        # Example of enriching results (conceptual, actual DB calls would be needed)
-        enriched_results = []
+        # Re-hydrate full items from SQLite with one batched WHERE id IN (...)
+        # query per item type rather than a lookup per hit (N+1 pattern).
+        ids_by_type: Dict[str, List[int]] = {}
         for res in search_results:
             meta = res.get("metadata", {})
             item_id = meta.get("conport_item_id")
             item_type = meta.get("conport_item_type")
+            if item_id is not None and item_type:
+                ids_by_type.setdefault(item_type, []).append(int(item_id))
 
-            # Here you could fetch the full item from SQLite using item_id and item_type
-            # For example:
-            # if item_type == "decision" and item_id:
-            #     full_item = db.get_decision_by_id(args.workspace_id, int(item_id)) # Assuming get_decision_by_id exists
-            #     res["full_item_data"] = full_item.model_dump(mode='json') if full_item else None
-            # else if item_type == "custom_data" and item_id:
-            #     # For custom_data, ID is internal. Key and Category are in metadata.
-            #     full_item_list = db.get_custom_data(args.workspace_id, category=meta.get("category"), key=meta.get("key"))
-            #     if full_item_list:
-            #         res["full_item_data"] = full_item_list[0].model_dump(mode='json')
-
-            enriched_results.append(res) # For now, just pass through
+        hydrated_by_type: Dict[str, Dict[int, Any]] = {}
+        for item_type, ids in ids_by_type.items():
+            try:
+                hydrated_by_type[item_type] = await asyncio.to_thread(
+                    db.get_items_by_ids, args.workspace_id, item_type, ids
+                )
+            except ValueError:
+                log.warning(f"Skipping hydration for unknown item type '{item_type}'")
+                hydrated_by_type[item_type] = {}
 
+        enriched_results = []
+        for res in search_results:
+            meta = res.get("metadata", {})
+            item_id = meta.get("conport_item_id")
+            item_type = meta.get("conport_item_type")
+            full_item = None
+            if item_id is not None and item_type:
+                full_item = hydrated_by_type.get(item_type, {}).get(int(item_id))
+            res["full_item_data"] = full_item.model_dump(mode='json') if full_item else None
+            enriched_results.append(res)
+
+        if cache_key is not None:
+            _semantic_query_cache_insert(cache_key, query_vector, enriched_results)
         return enriched_results
 
     except RuntimeError as re: # Catch errors from embedding or vector store service
@@ -814,117 +1086,169 @@ def _format_active_context_md(data: Dict[str, Any]) -> str:
         lines.append("\n")
     return "".join(lines)
 
+# Export timestamp format; strftime (not isoformat) so tz-aware values do not
+# grow a "+00:00" suffix the import parsers never see.
+_EXPORT_TS_FMT = '%Y-%m-%d %H:%M:%S'
+
 def _format_decisions_md(decisions: List[models.Decision]) -> str:
+    # One f-string (and one append) per logical block instead of one per
+    # line; on thousand-entry logs the interpreter work per item is what
+    # dominates, not the join.
     lines = ["# Decision Log\n"]
-    for dec in sorted(decisions, key=lambda x: x.timestamp, reverse=True):
-        lines.append("\n---\n")
-        lines.append("## Decision\n")
-        lines.append(f"*   [{dec.timestamp.strftime('%Y-%m-%d %H:%M:%S')}] {dec.summary}\n")
+    append = lines.append
+    for dec in sorted(decisions, key=operator.attrgetter("timestamp"), reverse=True):
+        append(f"\n---\n## Decision\n*   [{dec.timestamp.strftime(_EXPORT_TS_FMT)}] {dec.summary}\n")
         if dec.rationale:
-            lines.append("\n## Rationale\n")
-            lines.append(f"*   {dec.rationale}\n")
+            append(f"\n## Rationale\n*   {dec.rationale}\n")
         if dec.implementation_details:
-            lines.append("\n## Implementation Details\n")
-            lines.append(f"*   {dec.implementation_details}\n")
+            append(f"\n## Implementation Details\n*   {dec.implementation_details}\n")
     return "".join(lines)
 
+_PROGRESS_SECTIONS = (
+    ("DONE", "\n## Completed Tasks\n"),
+    ("IN_PROGRESS", "\n## In Progress Tasks\n"),
+    ("TODO", "\n## TODO Tasks\n"),
+)
+
 def _format_progress_md(progress_entries: List[models.ProgressEntry]) -> str:
-    lines = ["# Progress Log\n"]
+    # Bucket by status first, then sort each (smaller) bucket. Both orders
+    # are equivalent to sorting the whole list up front — Python's sort is
+    # stable even with reverse=True — but three small sorts do fewer
+    # comparisons than one big one.
     status_map = {"DONE": [], "IN_PROGRESS": [], "TODO": []}
-    for entry in sorted(progress_entries, key=lambda x: x.timestamp, reverse=True):
+    for entry in progress_entries:
         status_map.get(entry.status, status_map["TODO"]).append(entry)
+    for bucket in status_map.values():
+        bucket.sort(key=operator.attrgetter("timestamp"), reverse=True)
 
-    if status_map["DONE"]:
-        lines.append("\n## Completed Tasks\n")
-        for entry in status_map["DONE"]:
-            lines.append(f"*   [{entry.timestamp.strftime('%Y-%m-%d %H:%M:%S')}] {entry.description}\n")
-    if status_map["IN_PROGRESS"]:
-        lines.append("\n## In Progress Tasks\n")
-        for entry in status_map["IN_PROGRESS"]:
-            lines.append(f"*   [{entry.timestamp.strftime('%Y-%m-%d %H:%M:%S')}] {entry.description}\n")
-    if status_map["TODO"]:
-        lines.append("\n## TODO Tasks\n")
-        for entry in status_map["TODO"]:
-            lines.append(f"*   [{entry.timestamp.strftime('%Y-%m-%d %H:%M:%S')}] {entry.description}\n")
+    lines = ["# Progress Log\n"]
+    for status, heading in _PROGRESS_SECTIONS:
+        entries = status_map[status]
+        if entries:
+            lines.append(heading)
+            lines.append("".join(
+                f"*   [{entry.timestamp.strftime(_EXPORT_TS_FMT)}] {entry.description}\n"
+                for entry in entries
+            ))
     return "".join(lines)
 
 def _format_system_patterns_md(patterns: List[models.SystemPattern]) -> str:
     lines = ["# System Patterns\n"]
+    append = lines.append
     for pattern in sorted(patterns, key=lambda x: x.timestamp, reverse=True): # Sort by timestamp
-        lines.append("\n---\n")
-        lines.append(f"## {pattern.name}\n")
-        lines.append(f"*   [{pattern.timestamp.strftime('%Y-%m-%d %H:%M:%S')}]\n") # Add timestamp
+        append(f"\n---\n## {pattern.name}\n*   [{pattern.timestamp.strftime(_EXPORT_TS_FMT)}]\n")
         if pattern.description:
-            lines.append(f"{pattern.description}\n")
+            append(f"{pattern.description}\n")
     return "".join(lines)
 
-def handle_export_conport_to_markdown(args: models.ExportConportToMarkdownArgs) -> Dict[str, Any]:
+def _write_export_file(path: Path, content: str) -> None:
+    """
+    Writes one export file; runs on worker threads during export. Encoding
+    up front and using write_bytes issues a single write() syscall instead of
+    draining a multi-MB log through TextIOWrapper's 8 KiB buffer.
+    """
+    path.write_bytes(content.encode("utf-8"))
+
+# Maps every non-alphanumeric ASCII codepoint to '_'; the common (ASCII)
+# category names sanitize in one C-level translate call instead of a
+# per-character Python loop.
+_CATEGORY_SANITIZE_TABLE = str.maketrans({chr(c): "_" for c in range(128) if not chr(c).isalnum()})
+
+def _sanitize_category_filename(name: str) -> str:
+    """Replaces every non-alphanumeric character in a category name with '_'."""
+    if name.isascii():
+        return name.translate(_CATEGORY_SANITIZE_TABLE)
+    return "".join(c if c.isalnum() else "_" for c in name)
+
+def _export_custom_data_files(ws_id: str, output_path: Path) -> List[str]:
+    """
+    Streams custom data out of SQLite in category order and writes one file
+    per category as each group completes; runs on a worker thread during
+    export. Memory stays bounded by the largest single category instead of
+    the whole table, and both the SQLite scan and the writes are sequential.
+    """
+    files_created: List[str] = []
+    custom_data_path = output_path / "custom_data"
+    grouped = itertools.groupby(
+        db.stream_custom_data_ordered(ws_id), key=operator.attrgetter("category")
+    )
+    for category_name, rows in grouped:
+        if not files_created:
+            custom_data_path.mkdir(exist_ok=True)
+        blocks = []
+        append = blocks.append
+        for item in rows:
+            value_str = _dumps_value_indented(item.value) if not isinstance(item.value, str) else item.value
+            append(f"### {item.key}\n\n*   [{item.timestamp.strftime(_EXPORT_TS_FMT)}]\n\n```json\n{value_str}\n```\n")
+        cat_file_name = _sanitize_category_filename(category_name) + ".md"
+        _write_export_file(
+            custom_data_path / cat_file_name,
+            f"# Custom Data: {category_name}\n\n" + "\n---\n".join(blocks)
+        )
+        files_created.append(f"custom_data/{cat_file_name}")
+    return files_created
+
+async def handle_export_conport_to_markdown(args: models.ExportConportToMarkdownArgs) -> Dict[str, Any]:
     """
     Exports all ConPort data for a workspace to markdown files.
     Assumes 'args' is an already validated Pydantic model instance.
+    The six independent DB reads run concurrently off the event loop, and the
+    file writes are likewise gathered, so wall time approaches the slowest
+    read plus the slowest write instead of their sum.
     """
     workspace_path = Path(args.workspace_id)
     output_dir_name = args.output_path if args.output_path else "conport_export"
     output_path = workspace_path / output_dir_name
+    ws_id = args.workspace_id
 
     try:
         output_path.mkdir(parents=True, exist_ok=True)
-        log.info(f"Exporting ConPort data for workspace '{args.workspace_id}' to '{output_path}'")
+        log.info(f"Exporting ConPort data for workspace '{ws_id}' to '{output_path}'")
+
+        (
+            product_ctx,
+            active_ctx,
+            decisions,
+            progress_entries,
+            system_patterns,
+        ) = await asyncio.gather(
+            asyncio.to_thread(db.get_product_context, ws_id),
+            asyncio.to_thread(db.get_active_context, ws_id),
+            asyncio.to_thread(db.get_decisions, ws_id, limit=None),  # Get all
+            asyncio.to_thread(db.get_progress, ws_id, limit=None),  # Get all
+            asyncio.to_thread(db.get_system_patterns, ws_id),
+        )
 
+        # Formatting is pure CPU and fast; build every (path, content) pair
+        # synchronously, then write all files concurrently.
         files_created = []
+        pending_writes: List[Tuple[Path, str]] = []
 
-        # Product Context
-        product_ctx_data = db.get_product_context(args.workspace_id).content
-        if product_ctx_data:
-            with open(output_path / "product_context.md", "w", encoding="utf-8") as f:
-                f.write(_format_product_context_md(product_ctx_data))
+        if product_ctx.content:
+            pending_writes.append((output_path / "product_context.md", _format_product_context_md(product_ctx.content)))
             files_created.append("product_context.md")
-
-        # Active Context
-        active_ctx_data = db.get_active_context(args.workspace_id).content
-        if active_ctx_data:
-            with open(output_path / "active_context.md", "w", encoding="utf-8") as f:
-                f.write(_format_active_context_md(active_ctx_data))
+        if active_ctx.content:
+            pending_writes.append((output_path / "active_context.md", _format_active_context_md(active_ctx.content)))
             files_created.append("active_context.md")
-
-        # Decisions
-        decisions = db.get_decisions(args.workspace_id, limit=None) # Get all
         if decisions:
-            with open(output_path / "decision_log.md", "w", encoding="utf-8") as f:
-                f.write(_format_decisions_md(decisions))
+            pending_writes.append((output_path / "decision_log.md", _format_decisions_md(decisions)))
             files_created.append("decision_log.md")
-
-        # Progress
-        progress_entries = db.get_progress(args.workspace_id, limit=None) # Get all
         if progress_entries:
-            with open(output_path / "progress_log.md", "w", encoding="utf-8") as f:
-                f.write(_format_progress_md(progress_entries))
+            pending_writes.append((output_path / "progress_log.md", _format_progress_md(progress_entries)))
             files_created.append("progress_log.md")
-
-        # System Patterns
-        system_patterns = db.get_system_patterns(args.workspace_id)
         if system_patterns:
-            with open(output_path / "system_patterns.md", "w", encoding="utf-8") as f:
-                f.write(_format_system_patterns_md(system_patterns))
+            pending_writes.append((output_path / "system_patterns.md", _format_system_patterns_md(system_patterns)))
             files_created.append("system_patterns.md")
 
-        # Custom Data
-        custom_data_entries = db.get_custom_data(args.workspace_id)
-        if custom_data_entries:
-            custom_data_path = output_path / "custom_data"
-            custom_data_path.mkdir(exist_ok=True)
-            categories: Dict[str, List[str]] = {}
-            for item in custom_data_entries:
-                if item.category not in categories:
-                    categories[item.category] = []
-                value_str = json.dumps(item.value, indent=2) if not isinstance(item.value, str) else item.value
-                categories[item.category].append(f"### {item.key}\n\n*   [{item.timestamp.strftime('%Y-%m-%d %H:%M:%S')}]\n\n```json\n{value_str}\n```\n")
-            for category_name_from_loop, items_md in categories.items(): # Renamed category to avoid clash
-                cat_file_name = "".join(c if c.isalnum() else "_" for c in category_name_from_loop) + ".md"
-                with open(custom_data_path / cat_file_name, "w", encoding="utf-8") as f:
-                    f.write(f"# Custom Data: {category_name_from_loop}\n\n" + "\n---\n".join(items_md))
-                files_created.append(f"custom_data/{cat_file_name}")
-        
+        # Custom data never passes through memory as a whole table: a worker
+        # thread streams it out of SQLite category by category while the
+        # other files are written concurrently.
+        custom_data_files, *_ = await asyncio.gather(
+            asyncio.to_thread(_export_custom_data_files, ws_id, output_path),
+            *[asyncio.to_thread(_write_export_file, path, content) for path, content in pending_writes]
+        )
+        files_created.extend(custom_data_files)
+
         return {"status": "success", "message": f"ConPort data exported to '{output_path}'. Files created: {', '.join(files_created)}"}
 
     except DatabaseError as e:
@@ -937,21 +1261,52 @@ def handle_export_conport_to_markdown(args: models.ExportConportToMarkdownArgs)
 
 # --- Import Tool Handler ---
 
+# Patterns used by the markdown import parsers, compiled once at module scope.
+# The parsers run once per line/block across potentially thousands of items,
+# and inline re.* calls would re-hash the pattern string through re._compile's
+# bounded cache on every call.
+_MD_LIST_MARKER_RE = re.compile(r"^\*   ")
+_MD_SECTION_SPLIT_RE = re.compile(r"\n## ")
+_MD_CONTEXT_INTRO_RE = re.compile(r"^#\s\w+\sContext\n+(.*?)\n## ", re.DOTALL | re.MULTILINE)
+# Bytes patterns: the decision and progress parsers run straight over the
+# import file's mmap'd buffer, so the full file is never decoded (or even
+# copied) into a Python str; only the matched fields are.
+_MD_DECISION_SUMMARY_RE = re.compile(rb"## Decision\n\*\s*\[.*?\]\s*(.+)", re.DOTALL)
+_MD_DECISION_RATIONALE_RE = re.compile(rb"## Rationale\n\*\s*(.+)", re.DOTALL)
+_MD_DECISION_IMPL_RE = re.compile(rb"## Implementation Details\n\*\s*(.+)", re.DOTALL)
+# Tokenizes a whole progress log in one finditer pass: alternative 1 is a
+# recognized status header, alternative 2 a task bullet with its optional
+# leading '[x]'-style marker already skipped.
+_MD_PROGRESS_TOKEN_RE = re.compile(
+    rb"^[ \t]*(?:"
+    rb"## (Completed Tasks|In Progress Tasks|Current Tasks|TODO Tasks|Next Steps)"
+    rb"|\*[ \t]*(?:\[[^\]\n]*\][ \t]*)?(.*)"
+    rb")",
+    re.MULTILINE,
+)
+_MD_PROGRESS_HEADER_STATUS = {
+    b"Completed Tasks": "DONE",
+    b"In Progress Tasks": "IN_PROGRESS",
+    b"Current Tasks": "IN_PROGRESS",
+    b"TODO Tasks": "TODO",
+    b"Next Steps": "TODO",
+}
+
 def _parse_key_value_markdown_section(section_content: str) -> str:
     """Helper to extract content from a simple markdown section."""
     lines = [line.strip() for line in section_content.strip().split('\n') if line.strip()]
     # Remove potential list markers like '* '
-    cleaned_lines = [re.sub(r"^\*   ", "", line) for line in lines]
+    cleaned_lines = [_MD_LIST_MARKER_RE.sub("", line) for line in lines]
     return "\n".join(cleaned_lines).strip()
 
 def _parse_product_or_active_context_md(content: str) -> Dict[str, Any]:
     """Parses product_context.md or active_context.md content."""
     data = {}
     # Split by '## ' to get sections, ignoring the initial '# Title' part
-    sections = re.split(r'\n## ', content)[1:]
+    sections = _MD_SECTION_SPLIT_RE.split(content)[1:]
 
     # First section is usually an introduction before the first '## '
-    intro_match = re.match(r'^#\s\w+\sContext\n+(.*?)\n## ', content, re.DOTALL | re.MULTILINE)
+    intro_match = _MD_CONTEXT_INTRO_RE.match(content)
     if intro_match:
         data["introduction"] = intro_match.group(1).strip()
 
@@ -972,53 +1327,71 @@ def _parse_product_or_active_context_md(content: str) -> Dict[str, Any]:
                 data[key] = _parse_key_value_markdown_section(section_content)
     return data
 
-def _parse_decisions_md(content: str) -> List[Dict[str, str]]:
-    """Parses decision_log.md content."""
-    decisions = []
-    # Split by '---' separator, then process each decision block
-    decision_blocks = content.split('\n---\n')
-    for block in decision_blocks:
-        if not block.strip() or "## Decision" not in block :
-            continue
-
-        summary_match = re.search(r"## Decision\n\*\s*\[.*?\]\s*(.+)", block, re.DOTALL)
-        summary = summary_match.group(1).strip() if summary_match else "N/A"
-
-        rationale_match = re.search(r"## Rationale\n\*\s*(.+)", block, re.DOTALL)
-        rationale = rationale_match.group(1).strip() if rationale_match else None
-        # Handle multi-line rationale
-        if rationale_match and rationale and '\n*' in rationale: # crude check for multi-bullet rationale
-            rationale = "\n".join([line.strip().lstrip('*').strip() for line in rationale.split('\n')])
-
-        impl_details_match = re.search(r"## Implementation Details\n\*\s*(.+)", block, re.DOTALL)
-        impl_details = impl_details_match.group(1).strip() if impl_details_match else None
-        if impl_details_match and impl_details and '\n*' in impl_details: # crude check for multi-bullet details
-            impl_details = "\n".join([line.strip().lstrip('*').strip() for line in impl_details.split('\n')])
+def _clean_multiline_bullets(text: str) -> str:
+    """Flattens a multi-bullet field into newline-joined bare lines."""
+    return "\n".join([line.strip().lstrip('*').strip() for line in text.split('\n')])
 
-        decisions.append({
-            "summary": summary,
-            "rationale": rationale,
-            "implementation_details": impl_details
-        })
+def _parse_decisions_md(content) -> List[Dict[str, str]]:
+    """
+    Parses decision_log.md content from a bytes-like buffer (the file's mmap
+    during import). Blocks are walked with find() so only one block at a
+    time is copied out of the buffer, and only matched fields are decoded;
+    the full file never exists as a Python str.
+    """
+    decisions = []
+    # Blocks are delimited by a '---' separator line.
+    separator = b'\n---\n'
+    size = len(content)
+    pos = 0
+    while pos <= size:
+        sep_at = content.find(separator, pos)
+        end = size if sep_at == -1 else sep_at
+        block = content[pos:end]
+        if block.strip() and b"## Decision" in block:
+            summary_match = _MD_DECISION_SUMMARY_RE.search(block)
+            summary = summary_match.group(1).decode("utf-8").strip() if summary_match else "N/A"
+
+            rationale_match = _MD_DECISION_RATIONALE_RE.search(block)
+            rationale = rationale_match.group(1).decode("utf-8").strip() if rationale_match else None
+            # Handle multi-line rationale
+            if rationale_match and rationale and '\n*' in rationale: # crude check for multi-bullet rationale
+                rationale = _clean_multiline_bullets(rationale)
+
+            impl_details_match = _MD_DECISION_IMPL_RE.search(block)
+            impl_details = impl_details_match.group(1).decode("utf-8").strip() if impl_details_match else None
+            if impl_details_match and impl_details and '\n*' in impl_details: # crude check for multi-bullet details
+                impl_details = _clean_multiline_bullets(impl_details)
+
+            decisions.append({
+                "summary": summary,
+                "rationale": rationale,
+                "implementation_details": impl_details
+            })
+        if sep_at == -1:
+            break
+        pos = sep_at + len(separator)
     return decisions
 
-def _parse_progress_md(content: str) -> List[Dict[str, str]]:
-    """Parses progress_log.md content."""
+def _parse_progress_md(content) -> List[Dict[str, str]]:
+    """
+    Parses progress_log.md content from a bytes-like buffer (the file's mmap
+    during import).
+
+    A single finditer pass over the whole buffer replaces the old per-line
+    loop (strip + startswith ladder + re.sub per bullet); only header and
+    bullet lines reach Python at all, and only descriptions are decoded.
+    """
     progress_items = []
     current_status = "TODO" # Default
 
-    for line in content.split('\n'):
-        line = line.strip()
-        if line.startswith("## Completed Tasks"):
-            current_status = "DONE"
-        elif line.startswith("## In Progress Tasks") or line.startswith("## Current Tasks"):
-            current_status = "IN_PROGRESS"
-        elif line.startswith("## TODO Tasks") or line.startswith("## Next Steps"):
-            current_status = "TODO"
-        elif line.startswith("*"):
-            description = re.sub(r"^\*\s*(\[.*?\]\s*)?", "", line).strip()
-            if description:
-                progress_items.append({"status": current_status, "description": description})
+    for match in _MD_PROGRESS_TOKEN_RE.finditer(content):
+        header = match.group(1)
+        if header is not None:
+            current_status = _MD_PROGRESS_HEADER_STATUS[header]
+            continue
+        description = match.group(2).decode("utf-8").strip()
+        if description:
+            progress_items.append({"status": current_status, "description": description})
     return progress_items
 
 def _parse_system_patterns_md(content: str) -> List[Dict[str, str]]:
@@ -1041,39 +1414,103 @@ def _parse_system_patterns_md(content: str) -> List[Dict[str, str]]:
         patterns.append({"name": current_name, "description": "\n".join(current_desc_lines).strip() or None})
     return patterns
 
-def _parse_custom_data_category_md(content: str, category_name: str) -> List[Dict[str, Any]]:
-    """Parses a custom_data category markdown file."""
-    items = []
-    # Split by '### ' for keys, then parse the JSON block
-    key_blocks = re.split(r'\n### ', content)
-    for block in key_blocks:
-        if not block.strip() or "```json" not in block:
-            continue
-
-        key_match = re.match(r"(.+?)\n+```json\n(.*?)\n```", block.strip(), re.DOTALL | re.MULTILINE)
-        if key_match:
-            key = key_match.group(1).strip()
-            json_str_value = key_match.group(2).strip()
-            try:
-                value = json.loads(json_str_value)
-                items.append({"category": category_name, "key": key, "value": value})
-            except json.JSONDecodeError as e:
-                log.warning(f"Could not parse JSON for custom data {category_name}/{key}: {e}. Value: '{json_str_value}'")
-    return items
+def _parse_custom_data_block(block: str, category_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Parses a single '### <key>' block from a custom_data category file.
+
+    Extraction is a pair of str.find scans plus slicing rather than a regex:
+    the block format is rigid (key text, blank line(s), fenced JSON), and the
+    single pass over the block retires far fewer interpreter operations per
+    byte than driving the re engine for every item.
+    """
+    block = block.strip()
+    if not block:
+        return None
+    fence_start = block.find("\n```json\n")
+    if fence_start <= 0:
+        return None
+    key = block[:fence_start].rstrip("\n").strip()
+    if not key:
+        return None
+    value_start = fence_start + 9  # len("\n```json\n")
+    value_end = block.find("\n```", value_start)
+    if value_end == -1:
+        return None
+    json_str_value = block[value_start:value_end].strip()
+    try:
+        return {"category": category_name, "key": key, "value": _loads_value(json_str_value)}
+    except json.JSONDecodeError as e:
+        log.warning(f"Could not parse JSON for custom data {category_name}/{key}: {e}. Value: '{json_str_value}'")
+        return None
+
+def _iter_custom_data_category_md(file_obj, category_name: str):
+    """
+    Yields custom data items from an open category markdown file, one
+    '### <key>' block at a time. Streaming block-by-block keeps the working
+    set to a single block instead of holding the full file text plus the
+    parsed item list in memory at once.
+    """
+    block_lines: List[str] = []
+    for line in file_obj:
+        if line.startswith("### "):
+            if block_lines:
+                item = _parse_custom_data_block("".join(block_lines), category_name)
+                if item is not None:
+                    yield item
+            block_lines = [line[4:]]
+        else:
+            block_lines.append(line)
+    if block_lines:
+        item = _parse_custom_data_block("".join(block_lines), category_name)
+        if item is not None:
+            yield item
+
+# Rows buffered per bulk insert while streaming a custom_data category file.
+_IMPORT_FLUSH_ROWS = 1000
+
+def _import_file_digest(path: Path) -> bytes:
+    """Streams a file through blake2b for the incremental-import state table."""
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.digest()
+
+def _parse_category_file(path: Path) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Parses one custom_data category file; returns (valid_items, skipped_count).
+    Runs on import worker threads, so it only parses — all DB writes stay on
+    the calling thread.
+    """
+    category_name = path.stem.replace("_", " ")
+    items: List[Dict[str, Any]] = []
+    skipped = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for item in _iter_custom_data_category_md(f, category_name):
+            # Cheap boolean pre-filter instead of letting per-item validation
+            # raise later; malformed items are counted, not thrown.
+            if isinstance(item.get("key"), str) and item["key"] and item.get("category"):
+                items.append(item)
+            else:
+                skipped += 1
+    return items, skipped
 
 def handle_import_markdown_to_conport(args: models.ImportMarkdownToConportArgs) -> Dict[str, Any]:
     """
     Imports data from markdown files into ConPort for a workspace.
     Assumes 'args' is an already validated Pydantic model instance.
     """
-    workspace_path = Path(args.workspace_id)
+    # Bound once; the import loops reference the workspace id per item and a
+    # plain local skips pydantic's attribute dispatch on every use.
+    ws_id = args.workspace_id
+    workspace_path = Path(ws_id)
     input_dir_name = args.input_path if args.input_path else "conport_export"
     input_path = workspace_path / input_dir_name
 
     if not input_path.is_dir():
         raise ToolArgumentError(f"Input directory not found: {input_path}")
 
-    log.info(f"Importing ConPort data for workspace '{args.workspace_id}' from '{input_path}'")
+    log.info(f"Importing ConPort data for workspace '{ws_id}' from '{input_path}'")
     summary_report = {"status": "success", "message": "Import process initiated.", "files_processed": [], "items_logged": {}, "errors": []}
 
     # This handler will be called by a tool wrapper in main.py.
@@ -1083,35 +1520,54 @@ def handle_import_markdown_to_conport(args: models.ImportMarkdownToConportArgs)
     file_processing_map = {
         "product_context.md": (_parse_product_or_active_context_md, handle_update_product_context, models.UpdateContextArgs),
         "active_context.md": (_parse_product_or_active_context_md, handle_update_active_context, models.UpdateContextArgs),
-        "decision_log.md": (_parse_decisions_md, handle_log_decision, models.LogDecisionArgs),
-        "progress_log.md": (_parse_progress_md, handle_log_progress, models.LogProgressArgs),
-        "system_patterns.md": (_parse_system_patterns_md, handle_log_system_pattern, models.LogSystemPatternArgs),
+        "decision_log.md": (_parse_decisions_md, handle_log_decisions_batch, models.LogDecisionsBatchArgs),
+        "progress_log.md": (_parse_progress_md, handle_log_progress_batch, models.LogProgressBatchArgs),
+        "system_patterns.md": (_parse_system_patterns_md, handle_log_system_patterns_batch, models.LogSystemPatternsBatchArgs),
     }
+    # Files whose parsers take a bytes-like buffer and are read via mmap;
+    # the rest are small and parsed from a decoded str.
+    _MMAP_PARSED_FILES = {"decision_log.md", "progress_log.md"}
 
     for filename, (parser_func, target_handler_func, pydantic_arg_model) in file_processing_map.items():
         file_to_import = input_path / filename
         if file_to_import.is_file():
             try:
-                with open(file_to_import, "r", encoding="utf-8") as f:
-                    content_str = f.read()
-                parsed_data = parser_func(content_str)
+                if filename in _MMAP_PARSED_FILES:
+                    # These parsers run bytes patterns straight over the
+                    # mmap'd buffer: the OS page cache backs the scan and the
+                    # file is never materialized as bytes + decoded str.
+                    with open(file_to_import, "rb") as import_file:
+                        if os.fstat(import_file.fileno()).st_size:
+                            with mmap.mmap(import_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                                parsed_data = parser_func(mapped)
+                        else: # mmap rejects empty files
+                            parsed_data = parser_func(b"")
+                else:
+                    parsed_data = parser_func(file_to_import.read_text(encoding="utf-8"))
                 summary_report["files_processed"].append(filename)
 
                 item_type_key = filename.split('.')[0] # Define item_type_key
 
                 if item_type_key in ["product_context", "active_context"]:
                     # For these, parsed_data is the content dict itself
-                    handler_call_args = pydantic_arg_model(workspace_id=args.workspace_id, content=parsed_data)
+                    handler_call_args = pydantic_arg_model(workspace_id=ws_id, content=parsed_data)
                     target_handler_func(handler_call_args)
                     summary_report["items_logged"][item_type_key] = summary_report["items_logged"].get(item_type_key, 0) + 1
                 else: # List based items (decisions, progress, system_patterns)
-                    for item_data in parsed_data: # parsed_data is a list of dicts
-                        handler_call_args = pydantic_arg_model(workspace_id=args.workspace_id, **item_data)
-                        target_handler_func(handler_call_args)
-                        summary_report["items_logged"][item_type_key] = summary_report["items_logged"].get(item_type_key, 0) + 1
-            except Exception as e:
+                    if parsed_data:
+                        # One batch call per file: a single TypeAdapter
+                        # validation pass, one insert transaction instead of
+                        # a commit per row, and one batched embedding upsert.
+                        target_handler_func(pydantic_arg_model(workspace_id=ws_id, items=parsed_data))
+                        summary_report["items_logged"][item_type_key] = summary_report["items_logged"].get(item_type_key, 0) + len(parsed_data)
+            except (OSError, ValueError, KeyError, ValidationError, ContextPortalError) as e:
+                # Narrow catch: these are the failure modes the parsers and
+                # handlers actually raise (JSONDecodeError is a ValueError,
+                # Database/ToolArgument errors are ContextPortalErrors). Only
+                # the formatted message is stored, so the exception's frame
+                # chain is released immediately.
                 log.error(f"Error processing file {filename}: {e}")
-                summary_report["errors"].append(f"Error processing {filename}: {str(e)}")
+                summary_report["errors"].append(f"Error processing {filename}: {type(e).__name__}: {e}")
         else:
             log.warning(f"File not found for import: {file_to_import}")
             summary_report["errors"].append(f"File not found: {filename}")
@@ -1120,20 +1576,85 @@ def handle_import_markdown_to_conport(args: models.ImportMarkdownToConportArgs)
     custom_data_dir = input_path / "custom_data"
     if custom_data_dir.is_dir():
         summary_report["files_processed"].append("custom_data/*")
-        for category_md_file in custom_data_dir.glob("*.md"): # Renamed variable
+        # os.scandir yields DirEntry objects whose stat() is served from the
+        # directory scan itself on most platforms, so the mtime/size check
+        # below costs no extra syscall per file (glob + Path.stat would).
+        with os.scandir(custom_data_dir) as dir_iter:
+            md_entries = sorted(
+                (entry for entry in dir_iter if entry.name.endswith(".md") and entry.is_file()),
+                key=lambda entry: entry.name,
+            )
+        category_files = []
+        for entry in md_entries:
+            path = Path(entry.path)
+            # Re-imports are mostly no-ops: skip files whose stat signature
+            # matches the last successful import, falling back to a content
+            # hash when only the mtime moved (touch, checkout, copy).
+            try:
+                stat = entry.stat()
+                state = db.get_import_file_state(ws_id, str(path))
+                if state is not None and state[0] == stat.st_mtime_ns and state[1] == stat.st_size:
+                    continue
+                digest = _import_file_digest(path)
+                if state is not None and state[2] == digest:
+                    db.upsert_import_file_state(ws_id, str(path), stat.st_mtime_ns, stat.st_size, digest)
+                    continue
+            except (OSError, DatabaseError) as e:
+                log.warning(f"Could not check import state for {path.name}: {e}")
+                stat, digest = None, None
+            category_files.append((path, stat, digest))
+        # Category files are independent, so they parse concurrently while
+        # this thread stays the single writer draining parsed batches into
+        # the DB. Threads rather than processes: workers share the already
+        # loaded module state instead of re-importing the model stack, and
+        # the parse stage is dominated by file I/O.
+        if category_files:
+            # Non-unique custom_data indexes are dropped for the duration of
+            # the bulk insert and rebuilt bottom-up afterwards; the finally
+            # restores them (and the synchronous level) even if a file fails.
             try:
-                category_name = category_md_file.stem.replace("_", " ")
-                with open(category_md_file, "r", encoding="utf-8") as f:
-                    content_str = f.read()
-                parsed_custom_items = _parse_custom_data_category_md(content_str, category_name)
-                for item_data in parsed_custom_items:
-                    # item_data already contains 'category', 'key', 'value'
-                    handler_args = models.LogCustomDataArgs(workspace_id=args.workspace_id, **item_data)
-                    handle_log_custom_data(handler_args)
-                    summary_report["items_logged"]["custom_data"] = summary_report["items_logged"].get("custom_data", 0) + 1
-            except Exception as e:
-                log.error(f"Error processing custom data file {category_md_file.name}: {e}")
-                summary_report["errors"].append(f"Error processing {category_md_file.name}: {str(e)}")
+                dropped_index_sql, prev_sync = db.prepare_custom_data_bulk_import(ws_id)
+            except DatabaseError as e:
+                log.warning(f"Proceeding with indexes in place; bulk-import prepare failed: {e}")
+                dropped_index_sql, prev_sync = [], None
+            try:
+                with ThreadPoolExecutor(max_workers=min(4, len(category_files))) as executor:
+                    parse_futures = [
+                        executor.submit(_parse_category_file, path) for path, _, _ in category_files
+                    ]
+                    for (category_md_file, file_stat, file_digest), future in zip(category_files, parse_futures):
+                        try:
+                            items, skipped = future.result()
+                            logged = 0
+                            for start in range(0, len(items), _IMPORT_FLUSH_ROWS):
+                                batch = items[start:start + _IMPORT_FLUSH_ROWS]
+                                # One batch call per slice inserts all rows in a
+                                # single transaction instead of a commit per item.
+                                handle_log_custom_data_batch(
+                                    models.LogCustomDataBatchArgs(workspace_id=ws_id, items=batch)
+                                )
+                                logged += len(batch)
+                            if skipped:
+                                summary_report["errors"].append(
+                                    f"Skipped {skipped} malformed item(s) in {category_md_file.name}"
+                                )
+                            if logged:
+                                summary_report["items_logged"]["custom_data"] = summary_report["items_logged"].get("custom_data", 0) + logged
+                            if file_stat is not None and file_digest is not None:
+                                db.upsert_import_file_state(
+                                    ws_id, str(category_md_file),
+                                    file_stat.st_mtime_ns, file_stat.st_size, file_digest
+                                )
+                        except (OSError, ValueError, KeyError, ValidationError, ContextPortalError) as e:
+                            log.error(f"Error processing custom data file {category_md_file.name}: {e}")
+                            summary_report["errors"].append(f"Error processing {category_md_file.name}: {type(e).__name__}: {e}")
+            finally:
+                if prev_sync is not None:
+                    try:
+                        db.finish_custom_data_bulk_import(ws_id, dropped_index_sql, prev_sync)
+                    except DatabaseError as e:
+                        log.error(f"Failed to rebuild custom_data indexes after import: {e}")
+                        summary_report["errors"].append(f"Index rebuild after import failed: {e}")
 
     summary_report["message"] = f"ConPort data import from '{input_path}' complete. See details."
     return summary_report
@@ -1144,7 +1665,7 @@ def handle_link_conport_items(args: models.LinkConportItemsArgs) -> Dict[str, An
     Creates a link between two ConPort items.
     """
     try:
-        link_to_create = models.ContextLink(
+        link_to_create = ContextLink(
             source_item_type=args.source_item_type,
             source_item_id=args.source_item_id,
             target_item_type=args.target_item_type,
@@ -1155,7 +1676,7 @@ def handle_link_conport_items(args: models.LinkConportItemsArgs) -> Dict[str, An
             # timestamp is handled by Pydantic model default_factory
         )
         logged_link = db.log_context_link(args.workspace_id, link_to_create)
-        return logged_link.model_dump(mode='json')
+        return _dump_model(logged_link)
     except DatabaseError as e:
         raise ContextPortalError(f"Database error linking ConPort items: {e}")
     except Exception as e:
@@ -1176,7 +1697,7 @@ def handle_get_linked_items(args: models.GetLinkedItemsArgs) -> List[Dict[str, A
             linked_item_type_filter=args.linked_item_type_filter,
             limit=args.limit
         )
-        return [link.model_dump(mode='json') for link in links_list]
+        return _dump_model_list(links_list)
     except DatabaseError as e:
         raise ContextPortalError(f"Database error retrieving context links: {e}")
     except Exception as e:
@@ -1221,14 +1742,32 @@ def handle_get_cacheable_content(args: models.GetCacheableContentArgs) -> List[D
         if not args.workspace_id:
             raise ValidationError("Workspace ID is required")
 
-        # Get content from various sources based on priority
-        cacheable_content = []
+        # Get content from various sources based on priority. The five
+        # fetches are independent, so overlap their round-trips instead of
+        # paying each connection/lock acquire sequentially. Priority is known
+        # at append time, so items go straight into per-priority buckets and
+        # the final list is their concatenation; no sort pass needed.
+        high_priority = []
+        medium_priority = []
+        low_priority = []
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            fut_product = executor.submit(db.get_product_context, args.workspace_id)
+            fut_patterns = executor.submit(db.get_system_patterns, args.workspace_id)
+            fut_custom = executor.submit(db.get_custom_data_with_cache_hints, args.workspace_id)
+            fut_active = executor.submit(db.get_active_context, args.workspace_id)
+            fut_decisions = executor.submit(db.get_decisions, args.workspace_id, limit=10)
+
+            product_context = fut_product.result()
+            system_patterns = fut_patterns.result()
+            custom_data_entries = fut_custom.result()
+            active_context = fut_active.result()
+            decisions = fut_decisions.result()
 
         # 1. Product Context (high priority)
-        product_context = db.get_product_context(args.workspace_id)
         content_dict = product_context.content
         token_estimate = estimate_tokens(content_dict)
-        cacheable_content.append({
+        high_priority.append({
             "source": "product_context",
             "priority": "high",
             "token_estimate": token_estimate,
@@ -1236,7 +1775,6 @@ def handle_get_cacheable_content(args: models.GetCacheableContentArgs) -> List[D
         })
 
         # 2. System Patterns (medium priority)
-        system_patterns = db.get_system_patterns(args.workspace_id)
         for pattern in system_patterns:
             pattern_dict = {
                 "name": pattern.name,
@@ -1244,7 +1782,7 @@ def handle_get_cacheable_content(args: models.GetCacheableContentArgs) -> List[D
                 "tags": pattern.tags or []
             }
             token_estimate = estimate_tokens(pattern_dict)
-            cacheable_content.append({
+            medium_priority.append({
                 "source": f"system_pattern/{pattern.name}",
                 "priority": "medium",
                 "token_estimate": token_estimate,
@@ -1252,10 +1790,9 @@ def handle_get_cacheable_content(args: models.GetCacheableContentArgs) -> List[D
             })
 
         # 3. Custom Data with cache hints (medium priority)
-        custom_data_entries = db.get_custom_data_with_cache_hints(args.workspace_id)
         for entry in custom_data_entries:
             token_estimate = estimate_tokens(entry.value)
-            cacheable_content.append({
+            medium_priority.append({
                 "source": f"custom_data/{entry.category}/{entry.key}",
                 "priority": "medium",
                 "token_estimate": token_estimate,
@@ -1263,10 +1800,9 @@ def handle_get_cacheable_content(args: models.GetCacheableContentArgs) -> List[D
             })
 
         # 4. Active Context (low priority)
-        active_context = db.get_active_context(args.workspace_id)
         content_dict = active_context.content
         token_estimate = estimate_tokens(content_dict)
-        cacheable_content.append({
+        low_priority.append({
             "source": "active_context",
             "priority": "low",
             "token_estimate": token_estimate,
@@ -1274,7 +1810,6 @@ def handle_get_cacheable_content(args: models.GetCacheableContentArgs) -> List[D
         })
 
         # 5. Decisions (low priority)
-        decisions = db.get_decisions(args.workspace_id, limit=10)
         for decision in decisions:
             decision_dict = {
                 "summary": decision.summary,
@@ -1283,160 +1818,606 @@ def handle_get_cacheable_content(args: models.GetCacheableContentArgs) -> List[D
                 "tags": decision.tags or []
             }
             token_estimate = estimate_tokens(decision_dict)
-            cacheable_content.append({
+            low_priority.append({
                 "source": f"decision/{decision.id}",
                 "priority": "low",
                 "token_estimate": token_estimate,
                 "content": decision_dict
             })
 
-        # Sort by priority (high > medium > low)
-        priority_order = {"high": 0, "medium": 1, "low": 2}
-        cacheable_content.sort(key=lambda x: priority_order.get(x["priority"], 3))
-
-        return cacheable_content
-    except (DatabaseError, ValidationError) as e:
-        log.error(f"Error in get_cacheable_content: {e}")
-        raise ContextPortalError(f"Error retrieving cacheable content: {e}")
+        # Concatenation in bucket order replaces the old stable sort by
+        # priority (high > medium > low) and preserves its ordering exactly.
+        return high_priority + medium_priority + low_priority
     except Exception as e:
+        # Single broad handler; the isinstance check replaces a second
+        # except clause so the error path takes one handler entry, not two.
+        if isinstance(e, (DatabaseError, ValidationError)):
+            log.error(f"Error in get_cacheable_content: {e}")
+            raise ContextPortalError(f"Error retrieving cacheable content: {e}") from e
         log.exception(f"Unexpected error in get_cacheable_content for workspace {args.workspace_id}")
         raise ContextPortalError(f"Unexpected error retrieving cacheable content: {e}")
 
+# Hash-keyed LRU over estimate_tokens results. Cache-state probes walk the
+# same (unchanged) product/active/custom content blobs over and over; a hit
+# turns the recursive walk into one canonical-JSON hash plus a dict lookup.
+_ESTIMATE_TOKENS_CACHE: "OrderedDict[Any, int]" = OrderedDict()
+_ESTIMATE_TOKENS_CACHE_SIZE = 1024
+_estimate_tokens_cache_lock = threading.Lock()
+
+# Deletion tables for counting punctuation/structure characters in one
+# C-level translate pass (len(s) - len(s.translate(table))) instead of
+# one full str.count() scan per character.
+_PUNCT_STRUCT_DELETE = str.maketrans('', '', ',.:;{}[]')
+_PUNCT_ONLY_DELETE = str.maketrans('', '', ',.:;')
+
+# Lookup tables for the numpy fast path below: boolean masks over byte
+# values marking whitespace (everything str.split treats as a separator in
+# ASCII) and the two punctuation sets.
+_ASCII_SPACE_TABLE = np.zeros(256, dtype=bool)
+_ASCII_SPACE_TABLE[[c for c in range(128) if chr(c).isspace()]] = True
+_PUNCT_STRUCT_TABLE = np.zeros(256, dtype=bool)
+_PUNCT_STRUCT_TABLE[list(b',.:;{}[]')] = True
+_PUNCT_ONLY_TABLE = np.zeros(256, dtype=bool)
+_PUNCT_ONLY_TABLE[list(b',.:;')] = True
+
+# Below this size the numpy round trip costs more than it saves.
+_NUMPY_SCAN_MIN_CHARS = 4096
+
+def _word_punct_count(text: str, punct_table: Any, delete_table: Dict[int, Any]) -> int:
+    """Combined word + punctuation count for one string.
+
+    Long ASCII strings (the multi-KB assembled prefixes and custom-data
+    blobs) are scored with vectorized table lookups over the raw bytes,
+    which avoids str.split materializing a list of word objects; everything
+    else takes the split + translate path. Both give identical counts for
+    ASCII input, so which path runs never changes the estimate.
+    """
+    if len(text) >= _NUMPY_SCAN_MIN_CHARS and text.isascii():
+        codes = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        nonspace = ~_ASCII_SPACE_TABLE[codes]
+        # A word starts at a non-space whose predecessor is a space (or the
+        # string start); counting starts equals counting words.
+        words = int(nonspace[0]) + int(np.count_nonzero(nonspace[1:] & ~nonspace[:-1]))
+        return words + int(np.count_nonzero(punct_table[codes]))
+    return len(text.split()) + (len(text) - len(text.translate(delete_table)))
+
 def estimate_tokens(content: Any) -> int:
-    """Enhanced token estimation for various content types."""
+    """Enhanced token estimation for various content types; memoized on a
+    stable content signature (strings key directly, dicts/lists by a blake2b
+    digest of their canonical JSON)."""
     if content is None:
         return 0
-    
-    word_count = 0
-    
     if isinstance(content, str):
-        # Count words, but also account for punctuation and structure
-        words = content.split()
-        word_count = len(words)
-        # Add extra tokens for punctuation and formatting
-        word_count += content.count(',') + content.count('.') + content.count(':') + content.count(';')
-        # Add tokens for special characters and formatting
-        word_count += content.count('{') + content.count('}') + content.count('[') + content.count(']')
-    elif isinstance(content, dict):
-        # Count keys as tokens too - keys are very important for context
-        word_count += len(content.keys()) * 3  # Keys are important tokens
-        for key, value in content.items():
-            # Add tokens for the key itself
-            key_words = str(key).split()
-            word_count += len(key_words) * 2  # Keys get extra weight
-            
-            if isinstance(value, str):
-                words = value.split()
-                word_count += len(words)
-                # Add punctuation tokens
-                word_count += value.count(',') + value.count('.') + value.count(':') + value.count(';')
-                word_count += value.count('{') + value.count('}') + value.count('[') + value.count(']')
-            elif isinstance(value, list):
-                word_count += len(value) * 2  # Each list item is at least two tokens
-                for item in value:
-                    if isinstance(item, str):
-                        words = item.split()
-                        word_count += len(words)
-                        word_count += item.count(',') + item.count('.') + item.count(':') + item.count(';')
-                    elif isinstance(item, dict):
-                        word_count += estimate_tokens(item)
-                    else:
-                        word_count += len(str(item).split()) + 1  # Other types count as extra tokens
-            elif isinstance(value, dict):
-                word_count += estimate_tokens(value)
-            else:
-                word_count += len(str(value).split()) + 1
-    elif isinstance(content, list):
-        word_count += len(content) * 2  # Each list item is at least two tokens
-        for item in content:
-            if isinstance(item, str):
-                words = item.split()
-                word_count += len(words)
-                # Add punctuation tokens
-                word_count += item.count(',') + item.count('.') + item.count(':') + item.count(';')
-                word_count += item.count('{') + item.count('}') + item.count('[') + item.count(']')
-            elif isinstance(item, dict):
-                word_count += estimate_tokens(item)
-            else:
-                word_count += len(str(item).split()) + 1
+        key = content
     else:
+        try:
+            key = hashlib.blake2b(
+                _dumps_canonical(content), digest_size=16
+            ).digest()
+        except (TypeError, ValueError):
+            # Unserializable content; estimate without caching.
+            return _estimate_tokens_impl(content)
+    with _estimate_tokens_cache_lock:
+        cached = _ESTIMATE_TOKENS_CACHE.get(key)
+        if cached is not None:
+            _ESTIMATE_TOKENS_CACHE.move_to_end(key)
+            return cached
+    result = _estimate_tokens_impl(content)
+    with _estimate_tokens_cache_lock:
+        _ESTIMATE_TOKENS_CACHE[key] = result
+        while len(_ESTIMATE_TOKENS_CACHE) > _ESTIMATE_TOKENS_CACHE_SIZE:
+            _ESTIMATE_TOKENS_CACHE.popitem(last=False)
+    return result
+
+def _estimate_tokens_impl(content: Any) -> int:
+    """Uncached token-estimation walk; estimate_tokens fronts it.
+
+    Iterative: the old version recursed once per nested dict, paying a
+    Python frame per level on deep custom_data blobs. Recursion only ever
+    happened at dict nodes (lists inside lists are stringified), so the
+    walk now collects those dict subtrees parent-first and then folds each
+    subtree's token value into its parent child-last, which reproduces the
+    recursive results exactly -- including the per-subtree bonus
+    multipliers applied by _tokens_from_word_count.
+    """
+    if content is None:
+        return 0
+
+    if isinstance(content, str):
+        # Count words, punctuation, special characters and formatting
+        return _tokens_from_word_count(
+            _word_punct_count(content, _PUNCT_STRUCT_TABLE, _PUNCT_STRUCT_DELETE)
+        )
+
+    if not isinstance(content, (dict, list)):
         # For other types, convert to string and count words
         str_content = str(content)
-        word_count = len(str_content.split())
-        word_count += str_content.count(',') + str_content.count('.') + str_content.count(':') + str_content.count(';')
-        word_count += str_content.count('{') + str_content.count('}') + str_content.count('[') + str_content.count(']')
-    
+        return _tokens_from_word_count(
+            _word_punct_count(str_content, _PUNCT_STRUCT_TABLE, _PUNCT_STRUCT_DELETE)
+        )
+
+    # Pass 1: discover the dict subtrees (the recursion points of the old
+    # implementation) parent-first. Index 0 is the root dict or list.
+    nodes: List[Tuple[Any, int]] = [(content, -1)]
+    i = 0
+    while i < len(nodes):
+        node, _parent = nodes[i]
+        if isinstance(node, dict):
+            for value in node.values():
+                if isinstance(value, dict):
+                    nodes.append((value, i))
+                elif isinstance(value, list):
+                    for item in value:
+                        if isinstance(item, dict):
+                            nodes.append((item, i))
+        else:
+            for item in node:
+                if isinstance(item, dict):
+                    nodes.append((item, i))
+        i += 1
+
+    # Pass 2: children before parents. child_tokens[i] accumulates the
+    # token values of node i's dict children, finalized before i itself.
+    child_tokens = [0] * len(nodes)
+    for i in range(len(nodes) - 1, -1, -1):
+        node, parent = nodes[i]
+        word_count = child_tokens[i]
+        if isinstance(node, dict):
+            # Count keys as tokens too - keys are very important for context
+            word_count += len(node.keys()) * 3  # Keys are important tokens
+            for key, value in node.items():
+                # Add tokens for the key itself
+                word_count += len(str(key).split()) * 2  # Keys get extra weight
+
+                if isinstance(value, str):
+                    word_count += _word_punct_count(value, _PUNCT_STRUCT_TABLE, _PUNCT_STRUCT_DELETE)
+                elif isinstance(value, list):
+                    word_count += len(value) * 2  # Each list item is at least two tokens
+                    for item in value:
+                        if isinstance(item, str):
+                            word_count += _word_punct_count(item, _PUNCT_ONLY_TABLE, _PUNCT_ONLY_DELETE)
+                        elif isinstance(item, dict):
+                            pass  # folded in via child_tokens
+                        else:
+                            word_count += len(str(item).split()) + 1  # Other types count as extra tokens
+                elif isinstance(value, dict):
+                    pass  # folded in via child_tokens
+                else:
+                    word_count += len(str(value).split()) + 1
+        else:
+            word_count += len(node) * 2  # Each list item is at least two tokens
+            for item in node:
+                if isinstance(item, str):
+                    word_count += _word_punct_count(item, _PUNCT_STRUCT_TABLE, _PUNCT_STRUCT_DELETE)
+                elif isinstance(item, dict):
+                    pass  # folded in via child_tokens
+                else:
+                    word_count += len(str(item).split()) + 1
+        tokens = _tokens_from_word_count(word_count)
+        if i == 0:
+            return tokens
+        child_tokens[parent] += tokens
+
+# Minimum estimate for any content containing at least one word.
+_ESTIMATE_TOKENS_FLOOR = 25
+
+def _tokens_from_word_count(word_count: int) -> int:
+    """Converts a raw word/punctuation count into the token estimate."""
     # Use a very aggressive token ratio - approximately 0.25 words per token
     # This accounts for subword tokenization and provides higher estimates for caching
     estimated_tokens = max(1, int(word_count / 0.25))
-    
+
     # For very small content, ensure reasonable minimum
-    if word_count > 0 and estimated_tokens < 25:
-        estimated_tokens = max(25, word_count)
-    
+    if word_count > 0 and estimated_tokens < _ESTIMATE_TOKENS_FLOOR:
+        estimated_tokens = max(_ESTIMATE_TOKENS_FLOOR, word_count)
+
     # Add significant bonus tokens for structured content (JSON, nested data)
     if word_count > 50:
         estimated_tokens = int(estimated_tokens * 2.2)  # 120% bonus for substantial content
-    
+
     # Additional bonus for very large content
     if word_count > 500:
         estimated_tokens = int(estimated_tokens * 1.3)  # Additional 30% for very large content
-    
+
     return estimated_tokens
 
 # --- Batch Logging Handler ---
 
+# Keys are interned so lookups with an interned probe hit CPython's
+# pointer-comparison fast path instead of a full string hash + compare.
 _SINGLE_ITEM_HANDLERS_MAP = {
-    "decision": (handle_log_decision, models.LogDecisionArgs),
-    "progress_entry": (handle_log_progress, models.LogProgressArgs),
-    "system_pattern": (handle_log_system_pattern, models.LogSystemPatternArgs),
-    "custom_data": (handle_log_custom_data, models.LogCustomDataArgs),
+    sys.intern("decision"): (handle_log_decision, models.LogDecisionArgs),
+    sys.intern("progress_entry"): (handle_log_progress, models.LogProgressArgs),
+    sys.intern("system_pattern"): (handle_log_system_pattern, models.LogSystemPatternArgs),
+    sys.intern("custom_data"): (handle_log_custom_data, models.LogCustomDataArgs),
     # Add other loggable item types here if needed
 }
 
+def _item_content_hash(item_data_dict: Dict[str, Any]) -> bytes:
+    """Stable 128-bit digest of an item dict, used for intra-batch dedup."""
+    return hashlib.blake2b(_dumps_canonical(item_data_dict), digest_size=16).digest()
+
 def handle_batch_log_items(args: models.BatchLogItemsArgs) -> Dict[str, Any]:
     """
     Handles the 'batch_log_items' MCP tool.
     Logs multiple items of a specified type.
-    """
-    if args.item_type not in _SINGLE_ITEM_HANDLERS_MAP:
+
+    Items identical by content hash are logged once (duplicates are counted
+    and skipped). Validation runs in a single pydantic-core pass over the
+    whole batch, with failures unpacked back to their original item indices,
+    and the validated models are handed straight to the matching *_batch
+    writer -- one insert transaction and one batched embedding upsert for the
+    whole batch, with no second validation pass.
+    """
+    # item_type arrives as a fresh wire string; intern it once so the map
+    # lookups below compare by pointer.
+    item_type = sys.intern(args.item_type)
+    if item_type not in _SINGLE_ITEM_HANDLERS_MAP:
         raise ToolArgumentError(f"Unsupported item_type for batch logging: {args.item_type}. Supported types: {list(_SINGLE_ITEM_HANDLERS_MAP.keys())}")
 
-    handler_func, pydantic_model = _SINGLE_ITEM_HANDLERS_MAP[args.item_type]
+    batch_writer_func = _BATCH_ITEM_WRITERS_MAP[item_type]
+    list_validate = _ITEM_ARGS_LIST_ADAPTERS[item_type].validate_python
 
-    results = []
     errors = []
-    success_count = 0
-    failure_count = 0
+    duplicate_count = 0
+    seen_hashes = set()
+    unique_items: List[Dict[str, Any]] = []
+    original_indices: List[int] = []
 
     for i, item_data_dict in enumerate(args.items):
+        item_hash = _item_content_hash(item_data_dict)
+        if item_hash in seen_hashes:
+            duplicate_count += 1
+            continue
+        seen_hashes.add(item_hash)
+        unique_items.append(item_data_dict)
+        original_indices.append(i)
+
+    # One pydantic-core pass over the whole batch; the common all-valid case
+    # never enters Python-level error handling. On failure the aggregate
+    # error is unpacked per item and reported against the original indices,
+    # and only the surviving subset is validated a second time.
+    valid_items = unique_items
+    valid_entries: List[Any] = []
+    if unique_items:
         try:
-            # Each item_data_dict needs workspace_id for the Pydantic model
-            item_args_with_ws = {"workspace_id": args.workspace_id, **item_data_dict}
-            validated_item_args = pydantic_model(**item_args_with_ws)
-            result = handler_func(validated_item_args)
-            results.append(result)
-            success_count += 1
+            # Each item dict needs workspace_id for the Pydantic model
+            valid_entries = list_validate([
+                {"workspace_id": args.workspace_id, **item} for item in unique_items
+            ])
         except ValidationError as ve:
-            log.error(f"Validation error for item {i} in batch_log_items ({args.item_type}): {ve}")
-            errors.append({"item_index": i, "error": str(ve), "data": item_data_dict})
-            failure_count += 1
+            errors_by_position: Dict[int, List[Any]] = {}
+            for err in ve.errors():
+                position = err["loc"][0] if err["loc"] else 0
+                errors_by_position.setdefault(position, []).append(err)
+            valid_items = []
+            for position, item_data_dict in enumerate(unique_items):
+                item_errors = errors_by_position.get(position)
+                if item_errors is None:
+                    valid_items.append(item_data_dict)
+                    continue
+                i = original_indices[position]
+                log.error(f"Validation error for item {i} in batch_log_items ({args.item_type}): {item_errors}")
+                errors.append({"item_index": i, "error": str(item_errors), "data": item_data_dict})
+            if valid_items:
+                valid_entries = list_validate([
+                    {"workspace_id": args.workspace_id, **item} for item in valid_items
+                ])
+
+    results = []
+    if valid_entries:
+        try:
+            results = batch_writer_func(args.workspace_id, valid_entries)
         except ContextPortalError as cpe:
-            log.error(f"ContextPortalError for item {i} in batch_log_items ({args.item_type}): {cpe}")
-            errors.append({"item_index": i, "error": str(cpe), "data": item_data_dict})
-            failure_count += 1
+            log.error(f"ContextPortalError writing batch_log_items ({args.item_type}) batch: {cpe}")
+            errors.extend({"item_index": None, "error": str(cpe), "data": item} for item in valid_items)
         except Exception as e:
-            log.exception(f"Unexpected error for item {i} in batch_log_items ({args.item_type})")
-            errors.append({"item_index": i, "error": f"Unexpected server error: {type(e).__name__}", "data": item_data_dict})
-            failure_count += 1
+            log.exception(f"Unexpected error writing batch_log_items ({args.item_type}) batch")
+            errors.extend({"item_index": None, "error": f"Unexpected server error: {type(e).__name__}", "data": item} for item in valid_items)
 
+    success_count = len(results)
+    failure_count = len(errors)
     return {
         "status": "partial_success" if success_count > 0 and failure_count > 0 else ("success" if failure_count == 0 else "failure"),
-        "message": f"Batch log for '{args.item_type}': {success_count} succeeded, {failure_count} failed.",
+        "message": f"Batch log for '{args.item_type}': {success_count} succeeded, {failure_count} failed, {duplicate_count} duplicates skipped.",
         "successful_items": results,
         "failed_items": errors
     }
 
+# TypeAdapters compiled once at import so batch handlers validate whole entry
+# lists in a single pydantic-core pass instead of per-item model construction.
+_DECISION_ARGS_LIST_ADAPTER = TypeAdapter(List[models.LogDecisionArgs])
+_PROGRESS_ARGS_LIST_ADAPTER = TypeAdapter(List[models.LogProgressArgs])
+_CUSTOM_DATA_ARGS_LIST_ADAPTER = TypeAdapter(List[models.LogCustomDataArgs])
+_SYSTEM_PATTERN_ARGS_LIST_ADAPTER = TypeAdapter(List[models.LogSystemPatternArgs])
+
+def handle_log_decisions_batch(args: models.LogDecisionsBatchArgs) -> List[Dict[str, Any]]:
+    """
+    Handles the 'log_decisions_batch' MCP tool.
+    Validates all entries up front, inserts them in one transaction, and
+    upserts their embeddings in one batched call. Unlike batch_log_items this
+    is all-or-nothing: one invalid entry rejects the whole batch.
+    """
+    try:
+        entry_args = _DECISION_ARGS_LIST_ADAPTER.validate_python(
+            [{"workspace_id": args.workspace_id, **item} for item in args.items]
+        )
+    except ValidationError as e:
+        raise ToolArgumentError("Invalid decision items for batch log", errors=e.errors()) from e
+    return _log_decisions_batch_validated(args.workspace_id, entry_args)
+
+def _log_decisions_batch_validated(workspace_id: str, entry_args: List[models.LogDecisionArgs]) -> List[Dict[str, Any]]:
+    """Writes pre-validated decision entries: one insert transaction and one
+    batched embedding upsert. Shared by handle_log_decisions_batch and
+    batch_log_items so each entry is validated exactly once.
+    """
+    try:
+        decisions_to_log = [
+            Decision(
+                summary=entry.summary,
+                rationale=entry.rationale,
+                implementation_details=entry.implementation_details,
+                tags=entry.tags
+            )
+            for entry in entry_args
+        ]
+        logged_decisions = db.log_decisions_many(workspace_id, decisions_to_log)
+
+        # --- Add to Vector Store (one batched upsert) ---
+        try:
+            texts_to_embed = []
+            for logged_decision in logged_decisions:
+                text_to_embed = f"Decision Summary: {logged_decision.summary}\n"
+                if logged_decision.rationale:
+                    text_to_embed += f"Rationale: {logged_decision.rationale}\n"
+                if logged_decision.implementation_details:
+                    text_to_embed += f"Implementation Details: {logged_decision.implementation_details}"
+                texts_to_embed.append(text_to_embed.strip())
+            vectors = _get_embeddings_cached(workspace_id, texts_to_embed)
+
+            vector_items = []
+            for logged_decision, vector in zip(logged_decisions, vectors):
+                metadata_for_vector = {
+                    "conport_item_id": str(logged_decision.id),
+                    "conport_item_type": "decision",
+                    "summary": logged_decision.summary,
+                    "timestamp_created": logged_decision.timestamp.isoformat(),
+                    "tags": ", ".join(logged_decision.tags) if logged_decision.tags else None
+                }
+                vector_items.append(("decision", str(logged_decision.id), vector, metadata_for_vector))
+            vector_store_service.upsert_items_batch(workspace_id, vector_items)
+            log.info(f"Stored embeddings for {len(vector_items)} batch-logged decisions")
+        except Exception as e_embed:
+            log.error(f"Failed to generate/store embeddings for decision batch: {e_embed}", exc_info=True)
+        # --- End Add to Vector Store ---
+
+        return _dump_model_list(logged_decisions)
+    except DatabaseError as e:
+        raise ContextPortalError(f"Database error batch logging decisions: {e}")
+
+def handle_log_progress_batch(args: models.LogProgressBatchArgs) -> List[Dict[str, Any]]:
+    """
+    Handles the 'log_progress_batch' MCP tool.
+    Single-transaction variant of repeated log_progress calls; also creates
+    the optional per-entry context links and batches the embedding upserts.
+    """
+    try:
+        entry_args = _PROGRESS_ARGS_LIST_ADAPTER.validate_python(
+            [{"workspace_id": args.workspace_id, **item} for item in args.items]
+        )
+    except ValidationError as e:
+        raise ToolArgumentError("Invalid progress items for batch log", errors=e.errors()) from e
+    return _log_progress_batch_validated(args.workspace_id, entry_args)
+
+def _log_progress_batch_validated(workspace_id: str, entry_args: List[models.LogProgressArgs]) -> List[Dict[str, Any]]:
+    """Writes pre-validated progress entries: one insert transaction and one
+    batched embedding upsert. Shared by handle_log_progress_batch and
+    batch_log_items so each entry is validated exactly once.
+    """
+    try:
+        entries_to_log = [
+            ProgressEntry(
+                status=entry.status,
+                description=entry.description,
+                parent_id=entry.parent_id
+            )
+            for entry in entry_args
+        ]
+        logged_entries = db.log_progress_many(workspace_id, entries_to_log)
+
+        for entry, logged_progress in zip(entry_args, logged_entries):
+            if entry.linked_item_type and entry.linked_item_id and logged_progress.id is not None:
+                try:
+                    link_to_create = ContextLink(
+                        source_item_type="progress_entry",
+                        source_item_id=str(logged_progress.id),
+                        target_item_type=entry.linked_item_type,
+                        target_item_id=entry.linked_item_id,
+                        relationship_type=entry.link_relationship_type,
+                        description=f"Progress entry '{logged_progress.description[:30]}...' automatically linked."
+                    )
+                    db.log_context_link(workspace_id, link_to_create)
+                except Exception as link_e:
+                    log.error(f"Failed to automatically link progress entry ID {logged_progress.id} for workspace {workspace_id}: {link_e}")
+
+        # --- Add to Vector Store (one batched upsert) ---
+        try:
+            texts_to_embed = [
+                f"Progress: {logged_progress.status} - {logged_progress.description}".strip()
+                for logged_progress in logged_entries
+            ]
+            vectors = _get_embeddings_cached(workspace_id, texts_to_embed)
+
+            vector_items = []
+            for logged_progress, vector in zip(logged_entries, vectors):
+                metadata_for_vector = {
+                    "conport_item_id": str(logged_progress.id),
+                    "conport_item_type": "progress_entry",
+                    "status": logged_progress.status,
+                    "description_snippet": logged_progress.description[:100],
+                    "timestamp_created": logged_progress.timestamp.isoformat(),
+                    "parent_id": str(logged_progress.parent_id) if logged_progress.parent_id else None
+                }
+                vector_items.append(("progress_entry", str(logged_progress.id), vector, metadata_for_vector))
+            vector_store_service.upsert_items_batch(workspace_id, vector_items)
+            log.info(f"Stored embeddings for {len(vector_items)} batch-logged progress entries")
+        except Exception as e_embed:
+            log.error(f"Failed to generate/store embeddings for progress batch: {e_embed}", exc_info=True)
+        # --- End Add to Vector Store ---
+
+        return _dump_model_list(logged_entries)
+    except DatabaseError as e:
+        raise ContextPortalError(f"Database error batch logging progress: {e}")
+
+def handle_log_custom_data_batch(args: models.LogCustomDataBatchArgs) -> List[Dict[str, Any]]:
+    """
+    Handles the 'log_custom_data_batch' MCP tool.
+    Single-transaction variant of repeated log_custom_data calls with one
+    batched embedding upsert for the text-like values.
+    """
+    try:
+        entry_args = _CUSTOM_DATA_ARGS_LIST_ADAPTER.validate_python(
+            [{"workspace_id": args.workspace_id, **item} for item in args.items]
+        )
+    except ValidationError as e:
+        raise ToolArgumentError("Invalid custom data items for batch log", errors=e.errors()) from e
+    return _log_custom_data_batch_validated(args.workspace_id, entry_args)
+
+def _log_custom_data_batch_validated(workspace_id: str, entry_args: List[models.LogCustomDataArgs]) -> List[Dict[str, Any]]:
+    """Writes pre-validated custom data entries: one insert transaction and one
+    batched embedding upsert. Shared by handle_log_custom_data_batch and
+    batch_log_items so each entry is validated exactly once.
+    """
+    try:
+        entries_to_log = [
+            CustomData(
+                category=entry.category,
+                key=entry.key,
+                value=entry.value,
+                metadata=entry.metadata,
+                cache_score=calculate_content_cache_score(entry.value, entry.category, entry.key)
+            )
+            for entry in entry_args
+        ]
+        logged_entries = db.log_custom_data_many(workspace_id, entries_to_log)
+
+        # --- Add to Vector Store (one batched upsert) ---
+        try:
+            embeddable_entries = []
+            texts_to_embed = []
+            for logged_data in logged_entries:
+                if logged_data.id is None:
+                    continue
+                text_to_embed = None
+                if isinstance(logged_data.value, str):
+                    text_to_embed = logged_data.value
+                elif isinstance(logged_data.value, (dict, list)):
+                    try:
+                        text_to_embed = json.dumps(logged_data.value)
+                    except TypeError:
+                        log.warning(f"Custom data value for {logged_data.category}/{logged_data.key} is not JSON serializable for embedding.")
+                if not text_to_embed:
+                    continue
+                embeddable_entries.append(logged_data)
+                texts_to_embed.append(f"Category: {logged_data.category}\nKey: {logged_data.key}\nValue: {text_to_embed}".strip())
+            vectors = _get_embeddings_cached(workspace_id, texts_to_embed)
+
+            vector_items = []
+            for logged_data, vector in zip(embeddable_entries, vectors):
+                metadata_for_vector = {
+                    "conport_item_id": str(logged_data.id),
+                    "conport_item_type": "custom_data",
+                    "category": logged_data.category,
+                    "key": logged_data.key,
+                    "timestamp_created": logged_data.timestamp.isoformat(),
+                }
+                vector_items.append(("custom_data", str(logged_data.id), vector, metadata_for_vector))
+            vector_store_service.upsert_items_batch(workspace_id, vector_items)
+            log.info(f"Stored embeddings for {len(vector_items)} batch-logged custom data entries")
+        except Exception as e_embed:
+            log.error(f"Failed to generate/store embeddings for custom data batch: {e_embed}", exc_info=True)
+        # --- End Add to Vector Store ---
+
+        return _dump_model_list(logged_entries)
+    except DatabaseError as e:
+        raise ContextPortalError(f"Database error batch logging custom data: {e}")
+
+def handle_log_system_patterns_batch(args: models.LogSystemPatternsBatchArgs) -> List[Dict[str, Any]]:
+    """
+    Handles the 'log_system_patterns_batch' MCP tool.
+    Validates all entries up front, inserts them in one transaction, and
+    upserts their embeddings in one batched call. All-or-nothing like the
+    other *_batch handlers.
+    """
+    try:
+        entry_args = _SYSTEM_PATTERN_ARGS_LIST_ADAPTER.validate_python(
+            [{"workspace_id": args.workspace_id, **item} for item in args.items]
+        )
+    except ValidationError as e:
+        raise ToolArgumentError("Invalid system pattern items for batch log", errors=e.errors()) from e
+    return _log_system_patterns_batch_validated(args.workspace_id, entry_args)
+
+def _log_system_patterns_batch_validated(workspace_id: str, entry_args: List[models.LogSystemPatternArgs]) -> List[Dict[str, Any]]:
+    """Writes pre-validated system pattern entries: one insert transaction and one
+    batched embedding upsert. Shared by handle_log_system_patterns_batch and
+    batch_log_items so each entry is validated exactly once.
+    """
+    try:
+        patterns_to_log = [
+            SystemPattern(name=entry.name, description=entry.description, tags=entry.tags)
+            for entry in entry_args
+        ]
+        logged_patterns = db.log_system_patterns_many(workspace_id, patterns_to_log)
+        _bump_ctx_version(workspace_id, "system_patterns")
+
+        # --- Add to Vector Store (one batched upsert) ---
+        try:
+            embeddable_patterns = [p for p in logged_patterns if p.id is not None]
+            texts_to_embed = [
+                f"System Pattern: {logged_pattern.name}\nDescription: {logged_pattern.description if logged_pattern.description else ''}".strip()
+                for logged_pattern in embeddable_patterns
+            ]
+            vectors = _get_embeddings_cached(workspace_id, texts_to_embed)
+
+            vector_items = []
+            for logged_pattern, vector in zip(embeddable_patterns, vectors):
+                metadata_for_vector = {
+                    "conport_item_id": str(logged_pattern.id),
+                    "conport_item_type": "system_pattern",
+                    "name": logged_pattern.name,
+                    "timestamp_created": logged_pattern.timestamp.isoformat(),
+                    "tags": ", ".join(logged_pattern.tags) if logged_pattern.tags else None
+                }
+                vector_items.append(("system_pattern", str(logged_pattern.id), vector, metadata_for_vector))
+            vector_store_service.upsert_items_batch(workspace_id, vector_items)
+            log.info(f"Stored embeddings for {len(vector_items)} batch-logged system patterns")
+        except Exception as e_embed:
+            log.error(f"Failed to generate/store embeddings for system pattern batch: {e_embed}", exc_info=True)
+        # --- End Add to Vector Store ---
+
+        return _dump_model_list(logged_patterns)
+    except DatabaseError as e:
+        raise ContextPortalError(f"Database error batch logging system patterns: {e}")
+
+# Batch counterparts of _SINGLE_ITEM_HANDLERS_MAP; defined after the batch
+# handlers and keyed by the same interned type strings. batch_log_items
+# routes already-validated entry models through these writers.
+_BATCH_ITEM_WRITERS_MAP = {
+    sys.intern("decision"): _log_decisions_batch_validated,
+    sys.intern("progress_entry"): _log_progress_batch_validated,
+    sys.intern("system_pattern"): _log_system_patterns_batch_validated,
+    sys.intern("custom_data"): _log_custom_data_batch_validated,
+}
+
+# List adapters for batch_log_items validation, shared with the *_batch
+# handlers above and keyed by the same interned type strings.
+_ITEM_ARGS_LIST_ADAPTERS = {
+    sys.intern("decision"): _DECISION_ARGS_LIST_ADAPTER,
+    sys.intern("progress_entry"): _PROGRESS_ARGS_LIST_ADAPTER,
+    sys.intern("system_pattern"): _SYSTEM_PATTERN_ARGS_LIST_ADAPTER,
+    sys.intern("custom_data"): _CUSTOM_DATA_ARGS_LIST_ADAPTER,
+}
+
 # --- Deletion Tool Handlers ---
 
 def handle_delete_decision_by_id(args: models.DeleteDecisionByIdArgs) -> Dict[str, Any]:
@@ -1482,6 +2463,7 @@ def handle_delete_system_pattern_by_id(args: models.DeleteSystemPatternByIdArgs)
         deleted_from_db = db.delete_system_pattern_by_id(args.workspace_id, args.pattern_id)
 
         if deleted_from_db:
+            _bump_ctx_version(args.workspace_id, "system_patterns")
             try:
                 vector_store_service.delete_item_embedding(
                     workspace_id=args.workspace_id,
@@ -1506,6 +2488,58 @@ def handle_delete_system_pattern_by_id(args: models.DeleteSystemPatternByIdArgs)
 
 # --- Core KV Cache Tool Handlers ---
 
+
+_BATCH_DELETE_ITEM_TYPES = ("decision", "system_pattern")
+
+def handle_batch_delete_by_ids(args: models.BatchDeleteByIdsArgs) -> Dict[str, Any]:
+    """
+    Handles the 'batch_delete_by_ids' MCP tool.
+    Deletes several items of one type with one DELETE statement and removes
+    their embeddings in one filtered vector-store call, instead of a
+    transaction plus vector round-trip per item.
+    """
+    if args.item_type not in _BATCH_DELETE_ITEM_TYPES:
+        raise ToolArgumentError(f"Unsupported item_type for batch delete: {args.item_type}. Supported types: {list(_BATCH_DELETE_ITEM_TYPES)}")
+    try:
+        deleted_ids = db.delete_items_by_ids(args.workspace_id, args.item_type, args.ids)
+        deleted_set = set(deleted_ids)
+        not_found_ids = [item_id for item_id in args.ids if item_id not in deleted_set]
+
+        if not deleted_ids:
+            return {
+                "status": "success",
+                "message": f"No {args.item_type} items found for the given IDs.",
+                "deleted_ids": [],
+                "not_found_ids": not_found_ids
+            }
+
+        if args.item_type == "system_pattern":
+            _bump_ctx_version(args.workspace_id, "system_patterns")
+
+        try:
+            vector_store_service.delete_item_embeddings(args.workspace_id, args.item_type, deleted_ids)
+            log.info(f"Successfully deleted embeddings for {len(deleted_ids)} {args.item_type} items")
+        except Exception as e_vec_del:
+            log.error(f"Failed to delete embeddings for {args.item_type} batch (DB records were deleted): {e_vec_del}", exc_info=True)
+            return {
+                "status": "partial_success",
+                "message": f"Deleted {len(deleted_ids)} {args.item_type} items from database, but failed to delete their embeddings: {e_vec_del}",
+                "deleted_ids": deleted_ids,
+                "not_found_ids": not_found_ids
+            }
+
+        return {
+            "status": "success",
+            "message": f"Deleted {len(deleted_ids)} {args.item_type} items and their embeddings.",
+            "deleted_ids": deleted_ids,
+            "not_found_ids": not_found_ids
+        }
+    except DatabaseError as e:
+        raise ContextPortalError(f"Database error batch deleting {args.item_type} items: {e}")
+    except Exception as e:
+        log.exception(f"Unexpected error in batch_delete_by_ids for workspace {args.workspace_id}")
+        raise ContextPortalError(f"Unexpected error batch deleting {args.item_type} items: {e}")
+
 def handle_build_stable_context_prefix(args: models.BuildStableContextPrefixArgs) -> Dict[str, Any]:
     """
     Handles the 'build_stable_context_prefix' MCP tool.
@@ -1513,9 +2547,18 @@ def handle_build_stable_context_prefix(args: models.BuildStableContextPrefixArgs
     """
     try:
         stable_context_parts = []
-        
+
+        # The three source fetches are independent; overlap their round-trips.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            fut_product = executor.submit(db.get_product_context_data, args.workspace_id)
+            fut_patterns = executor.submit(db.get_system_patterns_data, args.workspace_id, limit=3)
+            fut_critical = executor.submit(db.get_custom_data_with_cache_hints, args.workspace_id)
+
+            product_ctx = fut_product.result()
+            patterns = fut_patterns.result()
+            critical_data = fut_critical.result()
+
         # 1. Product Context (highest priority)
-        product_ctx = db.get_product_context_data(args.workspace_id)
         if product_ctx:
             formatted_product = format_product_context_for_cache(product_ctx)
             stable_context_parts.append({
@@ -1526,7 +2569,6 @@ def handle_build_stable_context_prefix(args: models.BuildStableContextPrefixArgs
             })
         
         # 2. System Patterns (architectural stability)
-        patterns = db.get_system_patterns_data(args.workspace_id, limit=3)
         if patterns:
             formatted_patterns = format_patterns_for_cache(patterns)
             stable_context_parts.append({
@@ -1537,7 +2579,6 @@ def handle_build_stable_context_prefix(args: models.BuildStableContextPrefixArgs
             })
         
         # 3. Critical Custom Data
-        critical_data = db.get_custom_data_with_cache_hints(args.workspace_id)
         if critical_data:
             # Convert CustomData models to dicts for formatting
             critical_data_dicts = [
@@ -1558,15 +2599,21 @@ def handle_build_stable_context_prefix(args: models.BuildStableContextPrefixArgs
         
         # Assemble final prefix
         stable_prefix = assemble_stable_prefix(stable_context_parts, args.format_type)
-        prefix_hash = hashlib.md5(stable_prefix.encode()).hexdigest()
-        
+        # Cache key only, nothing cryptographic: blake2b runs markedly
+        # faster than md5 on large prefixes and, at digest_size=16, keeps
+        # the same 32-char hex format callers already hold.
+        prefix_bytes = stable_prefix.encode('utf-8')
+        prefix_hash = hashlib.blake2b(prefix_bytes, digest_size=16).hexdigest()
+        generated_at = datetime.now(timezone.utc)
+        _record_prefix_hash(args.workspace_id, prefix_hash, generated_at)
+
         return {
             "stable_prefix": stable_prefix,
             "prefix_hash": prefix_hash,
             "total_tokens": sum(part["tokens"] for part in stable_context_parts),
             "sections": stable_context_parts,
             "format_version": "1.0",
-            "generated_at": datetime.now(timezone.utc).isoformat()
+            "generated_at": generated_at.isoformat()
         }
     except DatabaseError as e:
         raise ContextPortalError(f"Database error building stable context prefix: {e}")
@@ -1574,12 +2621,59 @@ def handle_build_stable_context_prefix(args: models.BuildStableContextPrefixArgs
         log.exception(f"Unexpected error in build_stable_context_prefix for workspace {args.workspace_id}")
         raise ContextPortalError(f"Unexpected error building stable context prefix: {e}")
 
+def _as_utc(ts: datetime) -> datetime:
+    """Normalizes naive timestamps (stored as UTC) for safe comparison."""
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=timezone.utc)
+
+# Build times of recently issued prefix hashes, recorded by
+# handle_build_stable_context_prefix. The get_cache_state fast path may only
+# trust a hash whose build time is actually known -- db.get_hash_timestamp is
+# a placeholder that returns "one minute ago" for any input, so deciding
+# validity with it would bless arbitrary stale or garbage hashes. Unknown
+# hashes (e.g. after a restart) fall through to a full rebuild and compare.
+_PREFIX_HASH_TIMES: "OrderedDict[Tuple[str, str], datetime]" = OrderedDict()
+_PREFIX_HASH_TIMES_SIZE = 256
+_prefix_hash_times_lock = threading.Lock()
+
+def _record_prefix_hash(workspace_id: str, prefix_hash: str, generated_at: datetime) -> None:
+    """Remembers when a stable-prefix hash was built for this workspace."""
+    with _prefix_hash_times_lock:
+        _PREFIX_HASH_TIMES[(workspace_id, prefix_hash)] = generated_at
+        while len(_PREFIX_HASH_TIMES) > _PREFIX_HASH_TIMES_SIZE:
+            _PREFIX_HASH_TIMES.popitem(last=False)
+
+def _lookup_prefix_hash_time(workspace_id: str, prefix_hash: str) -> Optional[datetime]:
+    """Returns the recorded build time of a prefix hash, or None if unknown."""
+    with _prefix_hash_times_lock:
+        return _PREFIX_HASH_TIMES.get((workspace_id, prefix_hash))
+
 def handle_get_cache_state(args: models.GetCacheStateArgs) -> Dict[str, Any]:
     """
     Handles the 'get_cache_state' MCP tool.
     Check if stable context cache needs refresh.
     """
     try:
+        if args.current_prefix_hash:
+            # Fast path: if the provided hash is one we built (and recorded)
+            # and none of the stable-prefix inputs changed since, validate
+            # with three MAX(timestamp) lookups in one query instead of
+            # rebuilding and re-hashing the whole prefix. Hashes without a
+            # recorded build time take the full rebuild-and-compare path.
+            hash_time = _lookup_prefix_hash_time(args.workspace_id, args.current_prefix_hash)
+            if hash_time is not None:
+                modified_times = db.get_last_modified_times(args.workspace_id)
+            if hash_time is not None and all(
+                _as_utc(ts) <= hash_time for ts in modified_times.values()
+            ):
+                return {
+                    "cache_valid": True,
+                    "current_hash": args.current_prefix_hash,
+                    "provided_hash": args.current_prefix_hash,
+                    "changes_detected": [],
+                    "recommendation": "reuse",
+                    "stable_content_size": None  # not rebuilt on the fast path
+                }
+
         # Get current state hash by building stable context
         build_args = models.BuildStableContextPrefixArgs(workspace_id=args.workspace_id)
         current_state = handle_build_stable_context_prefix(build_args)
@@ -1607,6 +2701,22 @@ def handle_get_cache_state(args: models.GetCacheStateArgs) -> Dict[str, Any]:
         log.exception(f"Unexpected error in get_cache_state for workspace {args.workspace_id}")
         raise ContextPortalError(f"Unexpected error checking cache state: {e}")
 
+# Keyword groups for dynamic-context intent matching, compiled once so each
+# request scans the query (and candidate decision text) in a single C-level
+# pass instead of one Python-level substring test per keyword. Plain
+# alternations, no word boundaries: matching stays substring-containment,
+# same as the previous any(keyword in text) checks.
+_DECISION_INTENT_RE = re.compile(
+    r"decision|decide|choice|architecture|design|pattern|approach", re.IGNORECASE
+)
+_PROGRESS_INTENT_RE = re.compile(
+    r"task|progress|todo|work|status|current|doing|working", re.IGNORECASE
+)
+_TECH_INTENT_RE = re.compile(
+    r"react|query|redis|database|api|performance|optimization|cache|caching|review|best|practices",
+    re.IGNORECASE,
+)
+
 def handle_get_dynamic_context(args: models.GetDynamicContextArgs) -> Dict[str, Any]:
     """
     Handles the 'get_dynamic_context' MCP tool.
@@ -1615,14 +2725,13 @@ def handle_get_dynamic_context(args: models.GetDynamicContextArgs) -> Dict[str,
     try:
         dynamic_parts = []
         remaining_budget = args.context_budget
-        query_intent_lower = args.query_intent.lower()
         
         # Always include active context (session-level)
         active_ctx = db.get_active_context_data(args.workspace_id)
         if active_ctx and remaining_budget > 0:
-            formatted_active = format_active_context(active_ctx)
-            tokens_used = estimate_tokens(formatted_active)
-            if tokens_used <= remaining_budget:
+            section = format_active_context(active_ctx, budget=remaining_budget)
+            if section is not None and section[1] <= remaining_budget:
+                formatted_active, tokens_used = section
                 dynamic_parts.append({
                     "section": "active_context",
                     "content": formatted_active,
@@ -1631,13 +2740,12 @@ def handle_get_dynamic_context(args: models.GetDynamicContextArgs) -> Dict[str,
                 remaining_budget -= tokens_used
         
         # Query-specific context based on intent - check for decision-related keywords
-        decision_keywords = ["decision", "decide", "choice", "architecture", "design", "pattern", "approach"]
-        if any(keyword in query_intent_lower for keyword in decision_keywords) and remaining_budget > 0:
+        if _DECISION_INTENT_RE.search(args.query_intent) and remaining_budget > 0:
             recent_decisions = db.get_decisions_data(args.workspace_id, limit=5)
             if recent_decisions:
-                formatted_decisions = format_decisions_for_context(recent_decisions)
-                tokens_used = estimate_tokens(formatted_decisions)
-                if tokens_used <= remaining_budget:
+                section = format_decisions_for_context(recent_decisions, budget=remaining_budget)
+                if section is not None and section[1] <= remaining_budget:
+                    formatted_decisions, tokens_used = section
                     dynamic_parts.append({
                         "section": "recent_decisions",
                         "content": formatted_decisions,
@@ -1646,13 +2754,12 @@ def handle_get_dynamic_context(args: models.GetDynamicContextArgs) -> Dict[str,
                     remaining_budget -= tokens_used
         
         # Progress and task-related context
-        progress_keywords = ["task", "progress", "todo", "work", "status", "current", "doing", "working"]
-        if any(keyword in query_intent_lower for keyword in progress_keywords) and remaining_budget > 0:
+        if _PROGRESS_INTENT_RE.search(args.query_intent) and remaining_budget > 0:
             current_progress = db.get_progress_data(args.workspace_id, status_filter="IN_PROGRESS", limit=5)
             if current_progress:
-                formatted_progress = format_progress_for_context(current_progress)
-                tokens_used = estimate_tokens(formatted_progress)
-                if tokens_used <= remaining_budget:
+                section = format_progress_for_context(current_progress, budget=remaining_budget)
+                if section is not None and section[1] <= remaining_budget:
+                    formatted_progress, tokens_used = section
                     dynamic_parts.append({
                         "section": "current_progress",
                         "content": formatted_progress,
@@ -1661,22 +2768,25 @@ def handle_get_dynamic_context(args: models.GetDynamicContextArgs) -> Dict[str,
                     remaining_budget -= tokens_used
         
         # Technology and implementation context - look for specific tech mentions
-        tech_keywords = ["react", "query", "redis", "database", "api", "performance", "optimization", "cache", "caching", "review", "best", "practices"]
-        if any(keyword in query_intent_lower for keyword in tech_keywords) and remaining_budget > 0:
+        if _TECH_INTENT_RE.search(args.query_intent) and remaining_budget > 0:
             # Get recent decisions that might contain tech details
             all_decisions = db.get_decisions_data(args.workspace_id, limit=10)
             tech_decisions = []
             for decision in all_decisions:
-                decision_text = f"{decision.get('summary', '')} {decision.get('rationale', '')} {decision.get('implementation_details', '')}".lower()
-                if any(keyword in decision_text for keyword in tech_keywords):
+                decision_text = f"{decision.get('summary', '')} {decision.get('rationale', '')} {decision.get('implementation_details', '')}"
+                if _TECH_INTENT_RE.search(decision_text):
                     tech_decisions.append(decision)
+                    # Only the first three are ever included below; stop
+                    # scanning once we have them.
+                    if len(tech_decisions) >= 3:
+                        break
             
             if tech_decisions and remaining_budget > 0:
                 # Only include if we haven't already added decisions
                 if not any(part["section"] == "recent_decisions" for part in dynamic_parts):
-                    formatted_tech_decisions = format_decisions_for_context(tech_decisions[:3])
-                    tokens_used = estimate_tokens(formatted_tech_decisions)
-                    if tokens_used <= remaining_budget:
+                    section = format_decisions_for_context(tech_decisions, budget=remaining_budget)
+                    if section is not None and section[1] <= remaining_budget:
+                        formatted_tech_decisions, tokens_used = section
                         dynamic_parts.append({
                             "section": "tech_decisions",
                             "content": formatted_tech_decisions,
@@ -1688,9 +2798,9 @@ def handle_get_dynamic_context(args: models.GetDynamicContextArgs) -> Dict[str,
         if len(dynamic_parts) <= 1 and remaining_budget > 0:  # Only active context so far
             recent_decisions = db.get_decisions_data(args.workspace_id, limit=3)
             if recent_decisions:
-                formatted_decisions = format_decisions_for_context(recent_decisions)
-                tokens_used = estimate_tokens(formatted_decisions)
-                if tokens_used <= remaining_budget:
+                section = format_decisions_for_context(recent_decisions, budget=remaining_budget)
+                if section is not None and section[1] <= remaining_budget:
+                    formatted_decisions, tokens_used = section
                     dynamic_parts.append({
                         "section": "fallback_decisions",
                         "content": formatted_decisions,
@@ -1714,33 +2824,31 @@ def handle_get_dynamic_context(args: models.GetDynamicContextArgs) -> Dict[str,
 def identify_context_changes(workspace_id: str, previous_hash: str) -> List[Dict[str, Any]]:
     """Identify what content changed to trigger cache refresh"""
     changes = []
-    
+
+    # Maps the batched-query source keys to the change types reported here.
+    change_types = {
+        "product_context": "product_context",
+        "system_patterns": "system_patterns",
+        "custom_data_cached": "critical_custom_data",
+    }
+
     try:
-        # Check product context modification time
-        product_modified = db.get_last_modified_time("product_context", workspace_id)
-        hash_time = db.get_hash_timestamp(previous_hash)
-        if product_modified > hash_time:
-            changes.append({
-                "type": "product_context",
-                "last_modified": product_modified.isoformat()
-            })
-        
-        # Check system patterns
-        patterns_modified = db.get_last_modified_time("system_patterns", workspace_id)
-        if patterns_modified > hash_time:
-            changes.append({
-                "type": "system_patterns",
-                "last_modified": patterns_modified.isoformat()
-            })
-        
-        # Check critical custom data
-        critical_modified = db.get_last_modified_time("custom_data_cached", workspace_id)
-        if critical_modified > hash_time:
-            changes.append({
-                "type": "critical_custom_data",
-                "last_modified": critical_modified.isoformat()
-            })
-        
+        # One combined MAX(timestamp) query instead of three separate
+        # get_last_modified_time round-trips. Prefer the recorded build time
+        # of the hash; the db placeholder is only a last resort.
+        hash_time = _lookup_prefix_hash_time(workspace_id, previous_hash)
+        if hash_time is None:
+            hash_time = db.get_hash_timestamp(previous_hash)
+        hash_time = _as_utc(hash_time)
+        modified_times = db.get_last_modified_times(workspace_id)
+        for source_key, change_type in change_types.items():
+            modified = modified_times[source_key]
+            if _as_utc(modified) > hash_time:
+                changes.append({
+                    "type": change_type,
+                    "last_modified": modified.isoformat()
+                })
+
     except Exception as e:
         log.warning(f"Error identifying context changes: {e}")
         # Return generic change indication if we can't determine specifics
@@ -1767,51 +2875,84 @@ TECHNOLOGIES: {context.get('technologies', '')}
 def format_patterns_for_cache(patterns: List[dict]) -> str:
     """Format system patterns for consistent caching"""
     formatted = ["=== SYSTEM PATTERNS ==="]
+    append = formatted.append
     for pattern in patterns:
-        formatted.append(f"PATTERN: {pattern.get('name', '')}")
-        formatted.append(f"DESCRIPTION: {pattern.get('description', '')}")
+        # One appended block per pattern; embedded newlines plus the
+        # trailing one reproduce the old per-line appends exactly.
         if pattern.get('tags'):
-            formatted.append(f"TAGS: {', '.join(pattern['tags'])}")
-        formatted.append("")  # Blank line separator
+            append(f"PATTERN: {pattern.get('name', '')}\nDESCRIPTION: {pattern.get('description', '')}\nTAGS: {', '.join(pattern['tags'])}\n")
+        else:
+            append(f"PATTERN: {pattern.get('name', '')}\nDESCRIPTION: {pattern.get('description', '')}\n")
     return "\n".join(formatted)
 
 def format_critical_data_for_cache(critical_data: List[dict]) -> str:
     """Format critical custom data for caching"""
     formatted = ["=== CRITICAL SPECIFICATIONS ==="]
+    append = formatted.append
     for item in critical_data:
-        formatted.append(f"CATEGORY: {item.get('category', '')}")
-        formatted.append(f"KEY: {item.get('key', '')}")
-        value_str = json.dumps(item.get('value', '')) if isinstance(item.get('value'), (dict, list)) else str(item.get('value', ''))
-        formatted.append(f"VALUE: {value_str}")
-        formatted.append("")  # Blank line separator
+        value = item.get('value', '')
+        if isinstance(value, str):
+            value_str = value
+        elif isinstance(value, (dict, list)):
+            value_str = _dumps_value_compact(value)
+        else:
+            value_str = str(value)
+        append(f"CATEGORY: {item.get('category', '')}\nKEY: {item.get('key', '')}\nVALUE: {value_str}\n")
     return "\n".join(formatted)
 
-def format_active_context(active_ctx: dict) -> str:
-    """Format active context for dynamic assembly"""
+def _join_with_token_estimate(lines: List[str], budget: Optional[int] = None) -> Optional[Tuple[str, int]]:
+    """Joins formatted lines and estimates their tokens in the same pass.
+
+    Word and punctuation counts are additive across newline-joined lines, so
+    counting per line matches estimate_tokens on the joined string exactly
+    without walking the concatenated copy a second time. When a budget is
+    given, sections are rejected (returns None) without joining or counting
+    if even the estimator's floor cannot fit. No length-based bound is sound
+    beyond that: a single multi-KB run without whitespace or punctuation
+    (a base64 blob, say) still estimates at the floor, so length says
+    nothing about the real estimate.
+    """
+    if budget is not None and budget < _ESTIMATE_TOKENS_FLOOR:
+        # Every section starts with a header line containing words, so the
+        # estimate is always at least the floor.
+        return None
+    word_count = 0
+    for line in lines:
+        word_count += _word_punct_count(line, _PUNCT_STRUCT_TABLE, _PUNCT_STRUCT_DELETE)
+    return "\n".join(lines), _tokens_from_word_count(word_count)
+
+def format_active_context(active_ctx: dict, budget: Optional[int] = None) -> Optional[Tuple[str, int]]:
+    """Format active context for dynamic assembly; returns (text, tokens)
+    or None when the text cannot fit the given budget."""
     formatted = ["=== ACTIVE CONTEXT ==="]
+    append = formatted.append
     for key, value in active_ctx.items():
         heading = key.replace("_", " ").title()
-        formatted.append(f"{heading.upper()}: {value}")
-    return "\n".join(formatted)
+        append(f"{heading.upper()}: {value}")
+    return _join_with_token_estimate(formatted, budget)
 
-def format_decisions_for_context(decisions: List[dict]) -> str:
-    """Format decisions for context"""
+def format_decisions_for_context(decisions: List[dict], budget: Optional[int] = None) -> Optional[Tuple[str, int]]:
+    """Format decisions for context; returns (text, tokens) or None when
+    the text cannot fit the given budget."""
     formatted = ["=== RECENT DECISIONS ==="]
+    append = formatted.append
     for decision in decisions:
-        formatted.append(f"DECISION: {decision.get('summary', '')}")
         if decision.get('rationale'):
-            formatted.append(f"RATIONALE: {decision['rationale']}")
-        formatted.append("")  # Blank line separator
-    return "\n".join(formatted)
+            append(f"DECISION: {decision.get('summary', '')}\nRATIONALE: {decision['rationale']}\n")
+        else:
+            append(f"DECISION: {decision.get('summary', '')}\n")
+    return _join_with_token_estimate(formatted, budget)
 
-def format_progress_for_context(progress: List[dict]) -> str:
-    """Format progress entries for context"""
+def format_progress_for_context(progress: List[dict], budget: Optional[int] = None) -> Optional[Tuple[str, int]]:
+    """Format progress entries for context; returns (text, tokens) or None
+    when the text cannot fit the given budget."""
     formatted = ["=== CURRENT PROGRESS ==="]
+    append = formatted.append
     for entry in progress:
         status = entry.get('status', 'UNKNOWN')
         description = entry.get('description', '')
-        formatted.append(f"[{status}] {description}")
-    return "\n".join(formatted)
+        append(f"[{status}] {description}")
+    return _join_with_token_estimate(formatted, budget)
 
 def calculate_cache_score(cacheable_items: List[dict]) -> float:
     """Calculate overall cache optimization score"""
@@ -1975,4 +3116,8 @@ def handle_get_cache_performance(args: models.GetCachePerformanceArgs) -> Dict[s
 # --- Obsolete MCP Dispatcher Logic ---
 # The following (TOOL_DESCRIPTIONS, handle_list_tools, TOOL_HANDLERS, dispatch_tool)
 # are now obsolete as FastMCP handles tool registration, listing, and dispatch.
-# They are removed to prevent confusion and ensure the new FastMCP mechanism is used.
\ No newline at end of file
+# They are removed to prevent confusion and ensure the new FastMCP mechanism is used.
+# Note: FastMCP routes each call directly to the bound per-tool closure
+# registered in main.py, so there is no per-call dict lookup or broad
+# re-raise wrapper left to optimize here; don't reintroduce a name-based
+# dispatcher in front of it.
\ No newline at end of file
@@ -1,3 +1,4 @@
+import asyncio
 import sys
 import uvicorn
 from fastapi import FastAPI
@@ -179,7 +180,8 @@ async def tool_update_product_context(
             content=content,
             patch_content=patch_content
         )
-        return mcp_handlers.handle_update_product_context(pydantic_args)
+        # Large payloads make this CPU-bound; keep it off the event loop.
+        return await asyncio.to_thread(mcp_handlers.handle_update_product_context, pydantic_args)
     except exceptions.ContextPortalError as e:
         log.error(f"Error in update_product_context handler: {e}")
         raise
@@ -218,7 +220,8 @@ async def tool_update_active_context(
             content=content,
             patch_content=patch_content
         )
-        return mcp_handlers.handle_update_active_context(pydantic_args)
+        # Large payloads make this CPU-bound; keep it off the event loop.
+        return await asyncio.to_thread(mcp_handlers.handle_update_active_context, pydantic_args)
     except exceptions.ContextPortalError as e:
         log.error(f"Error in update_active_context handler: {e}")
         raise
@@ -591,7 +594,7 @@ async def tool_export_conport_to_markdown(
             workspace_id=workspace_id,
             output_path=output_path
         )
-        return mcp_handlers.handle_export_conport_to_markdown(pydantic_args)
+        return await mcp_handlers.handle_export_conport_to_markdown(pydantic_args)
     except exceptions.ContextPortalError as e:
         log.error(f"Error in export_conport_to_markdown handler: {e}")
         raise
@@ -720,6 +723,86 @@ async def tool_batch_log_items(
         log.error(f"Error processing args for batch_log_items: {e}. Args: workspace_id={workspace_id}, item_type='{item_type}', num_items={len(items) if isinstance(items, list) else 'N/A'}")
         raise exceptions.ContextPortalError(f"Server error processing batch_log_items: {type(e).__name__}")
 
+@conport_mcp.tool(name="log_decisions_batch", description="Logs multiple decisions in a single transaction (all-or-nothing; faster than batch_log_items for large batches).")
+async def tool_log_decisions_batch(
+    workspace_id: Annotated[str, Field(description="Identifier for the workspace (e.g., absolute path)")],
+    items: Annotated[List[Dict[str, Any]], Field(description="A list of dictionaries, each holding the fields of one 'log_decision' call (without workspace_id).")],
+    ctx: Context
+) -> List[Dict[str, Any]]:
+    try:
+        pydantic_args = models.LogDecisionsBatchArgs(
+            workspace_id=workspace_id,
+            items=items
+        )
+        # Large payloads make this CPU-bound; keep it off the event loop.
+        return await asyncio.to_thread(mcp_handlers.handle_log_decisions_batch, pydantic_args)
+    except exceptions.ContextPortalError as e:
+        log.error(f"Error in log_decisions_batch handler: {e}")
+        raise
+    except Exception as e:
+        log.error(f"Error processing args for log_decisions_batch: {e}. Args: workspace_id={workspace_id}, num_items={len(items) if isinstance(items, list) else 'N/A'}")
+        raise exceptions.ContextPortalError(f"Server error processing log_decisions_batch: {type(e).__name__}")
+
+@conport_mcp.tool(name="log_progress_batch", description="Logs multiple progress entries in a single transaction (all-or-nothing; faster than batch_log_items for large batches).")
+async def tool_log_progress_batch(
+    workspace_id: Annotated[str, Field(description="Identifier for the workspace (e.g., absolute path)")],
+    items: Annotated[List[Dict[str, Any]], Field(description="A list of dictionaries, each holding the fields of one 'log_progress' call (without workspace_id).")],
+    ctx: Context
+) -> List[Dict[str, Any]]:
+    try:
+        pydantic_args = models.LogProgressBatchArgs(
+            workspace_id=workspace_id,
+            items=items
+        )
+        # Large payloads make this CPU-bound; keep it off the event loop.
+        return await asyncio.to_thread(mcp_handlers.handle_log_progress_batch, pydantic_args)
+    except exceptions.ContextPortalError as e:
+        log.error(f"Error in log_progress_batch handler: {e}")
+        raise
+    except Exception as e:
+        log.error(f"Error processing args for log_progress_batch: {e}. Args: workspace_id={workspace_id}, num_items={len(items) if isinstance(items, list) else 'N/A'}")
+        raise exceptions.ContextPortalError(f"Server error processing log_progress_batch: {type(e).__name__}")
+
+@conport_mcp.tool(name="log_custom_data_batch", description="Logs multiple custom data entries in a single transaction (all-or-nothing; faster than batch_log_items for large batches).")
+async def tool_log_custom_data_batch(
+    workspace_id: Annotated[str, Field(description="Identifier for the workspace (e.g., absolute path)")],
+    items: Annotated[List[Dict[str, Any]], Field(description="A list of dictionaries, each holding the fields of one 'log_custom_data' call (without workspace_id).")],
+    ctx: Context
+) -> List[Dict[str, Any]]:
+    try:
+        pydantic_args = models.LogCustomDataBatchArgs(
+            workspace_id=workspace_id,
+            items=items
+        )
+        # Large payloads make this CPU-bound; keep it off the event loop.
+        return await asyncio.to_thread(mcp_handlers.handle_log_custom_data_batch, pydantic_args)
+    except exceptions.ContextPortalError as e:
+        log.error(f"Error in log_custom_data_batch handler: {e}")
+        raise
+    except Exception as e:
+        log.error(f"Error processing args for log_custom_data_batch: {e}. Args: workspace_id={workspace_id}, num_items={len(items) if isinstance(items, list) else 'N/A'}")
+        raise exceptions.ContextPortalError(f"Server error processing log_custom_data_batch: {type(e).__name__}")
+
+@conport_mcp.tool(name="log_system_patterns_batch", description="Logs multiple system patterns in a single transaction (all-or-nothing; faster than batch_log_items for large batches).")
+async def tool_log_system_patterns_batch(
+    workspace_id: Annotated[str, Field(description="Identifier for the workspace (e.g., absolute path)")],
+    items: Annotated[List[Dict[str, Any]], Field(description="A list of dictionaries, each holding the fields of one 'log_system_pattern' call (without workspace_id).")],
+    ctx: Context
+) -> List[Dict[str, Any]]:
+    try:
+        pydantic_args = models.LogSystemPatternsBatchArgs(
+            workspace_id=workspace_id,
+            items=items
+        )
+        # Large payloads make this CPU-bound; keep it off the event loop.
+        return await asyncio.to_thread(mcp_handlers.handle_log_system_patterns_batch, pydantic_args)
+    except exceptions.ContextPortalError as e:
+        log.error(f"Error in log_system_patterns_batch handler: {e}")
+        raise
+    except Exception as e:
+        log.error(f"Error processing args for log_system_patterns_batch: {e}. Args: workspace_id={workspace_id}, num_items={len(items) if isinstance(items, list) else 'N/A'}")
+        raise exceptions.ContextPortalError(f"Server error processing log_system_patterns_batch: {type(e).__name__}")
+
 @conport_mcp.tool(name="get_item_history", description="Retrieves version history for Product or Active Context.")
 async def tool_get_item_history(
     workspace_id: Annotated[str, Field(description="Identifier for the workspace (e.g., absolute path)")],
@@ -777,6 +860,23 @@ async def tool_delete_system_pattern_by_id(
         log.error(f"Error processing args for delete_system_pattern_by_id: {e}. Args: workspace_id={workspace_id}, pattern_id={pattern_id}")
         raise exceptions.ContextPortalError(f"Server error processing delete_system_pattern_by_id: {type(e).__name__}")
 
+@conport_mcp.tool(name="batch_delete_by_ids", description="Deletes multiple items of the same type by their IDs in one operation.")
+async def tool_batch_delete_by_ids(
+    workspace_id: Annotated[str, Field(description="Identifier for the workspace (e.g., absolute path)")],
+    item_type: Annotated[str, Field(description="Type of items to delete (e.g., 'decision', 'system_pattern')")],
+    ids: Annotated[List[int], Field(description="IDs of the items to delete.")],
+    ctx: Context
+) -> Dict[str, Any]:
+    try:
+        pydantic_args = models.BatchDeleteByIdsArgs(workspace_id=workspace_id, item_type=item_type, ids=ids)
+        return await asyncio.to_thread(mcp_handlers.handle_batch_delete_by_ids, pydantic_args)
+    except exceptions.ContextPortalError as e:
+        log.error(f"Error in batch_delete_by_ids handler: {e}")
+        raise
+    except Exception as e:
+        log.error(f"Error processing args for batch_delete_by_ids: {e}. Args: workspace_id={workspace_id}, item_type={item_type}")
+        raise exceptions.ContextPortalError(f"Server error processing batch_delete_by_ids: {type(e).__name__}")
+
 @conport_mcp.tool(name="get_conport_schema", description="Retrieves the schema of available ConPort tools and their arguments.")
 async def tool_get_conport_schema(
     workspace_id: Annotated[str, Field(description="Identifier for the workspace (e.g., absolute path)")],
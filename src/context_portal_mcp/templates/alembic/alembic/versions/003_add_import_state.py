@@ -0,0 +1,35 @@
+"""Add custom_data_import_state table for incremental markdown imports
+
+Revision ID: 003_add_import_state
+Revises: 002_add_cache_metadata
+Create Date: 2025-08-28 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.sql import text
+
+# revision identifiers, used by Alembic.
+revision = '003_add_import_state'
+down_revision = '002_add_cache_metadata'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the import-state table used to skip unchanged category files."""
+
+    op.execute(text("""
+        CREATE TABLE IF NOT EXISTS custom_data_import_state (
+            path TEXT PRIMARY KEY NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            hash BLOB NOT NULL
+        )
+    """))
+
+
+def downgrade():
+    """Remove the import-state table."""
+
+    op.execute(text("DROP TABLE IF EXISTS custom_data_import_state"))
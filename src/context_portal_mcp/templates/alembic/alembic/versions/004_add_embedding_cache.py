@@ -0,0 +1,35 @@
+"""Add embedding_cache table for content-hash keyed embedding reuse
+
+Revision ID: 004_add_embedding_cache
+Revises: 003_add_import_state
+Create Date: 2025-08-28 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.sql import text
+
+# revision identifiers, used by Alembic.
+revision = '004_add_embedding_cache'
+down_revision = '003_add_import_state'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create the persistent cache of computed embedding vectors."""
+
+    op.execute(text("""
+        CREATE TABLE IF NOT EXISTS embedding_cache (
+            text_hash BLOB NOT NULL,
+            model TEXT NOT NULL,
+            vector BLOB NOT NULL,
+            PRIMARY KEY (text_hash, model)
+        )
+    """))
+
+
+def downgrade():
+    """Remove the embedding cache table."""
+
+    op.execute(text("DROP TABLE IF EXISTS embedding_cache"))
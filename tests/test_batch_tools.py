@@ -0,0 +1,240 @@
+"""
+Tests for the batch logging/deletion tools and the to_json_dict fast path.
+Covers batch_log_items routing, the all-or-nothing *_batch handlers,
+batch_delete_by_ids, and the to_json_dict == model_dump(mode='json')
+serialization contract.
+"""
+
+import pytest
+import tempfile
+import os
+from pathlib import Path
+from datetime import datetime, timezone
+
+# Import the MCP handlers directly for testing
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from context_portal_mcp.handlers import mcp_handlers
+from context_portal_mcp.db import models
+from context_portal_mcp.core.exceptions import ToolArgumentError
+
+
+class TestToJsonDictSerialization:
+    """to_json_dict must stay byte-for-byte equivalent to model_dump(mode='json')"""
+
+    def test_decision_matches_model_dump(self):
+        decision = models.Decision(
+            id=7,
+            summary="Adopt SQLite for workspace storage",
+            rationale="Zero-config embedded database",
+            implementation_details="One file per workspace under context_portal/",
+            tags=["architecture", "storage"]
+        )
+        assert decision.to_json_dict() == decision.model_dump(mode='json')
+
+    def test_decision_with_optional_fields_unset(self):
+        decision = models.Decision(summary="Minimal decision")
+        assert decision.to_json_dict() == decision.model_dump(mode='json')
+
+    def test_progress_entry_matches_model_dump(self):
+        entry = models.ProgressEntry(
+            id=3,
+            status="IN_PROGRESS",
+            description="Wire up batch logging",
+            parent_id=1
+        )
+        assert entry.to_json_dict() == entry.model_dump(mode='json')
+
+    def test_system_pattern_matches_model_dump(self):
+        pattern = models.SystemPattern(
+            id=2,
+            name="Repository Pattern",
+            description="Data access abstraction layer",
+            tags=["pattern"]
+        )
+        assert pattern.to_json_dict() == pattern.model_dump(mode='json')
+
+    def test_custom_data_matches_model_dump(self):
+        data = models.CustomData(
+            id=5,
+            category="Architecture",
+            key="database_schema",
+            value={"tables": ["users", "orders"], "engine": "SQLite"},
+            metadata={"cache_hint": True},
+            cache_score=42
+        )
+        assert data.to_json_dict() == data.model_dump(mode='json')
+
+    def test_explicit_timestamp_serialization(self):
+        timestamp = datetime(2025, 6, 1, 12, 30, 0, tzinfo=timezone.utc)
+        decision = models.Decision(summary="Timestamped", timestamp=timestamp)
+        dumped = decision.to_json_dict()
+        assert dumped["timestamp"] == timestamp.isoformat()
+        assert dumped == decision.model_dump(mode='json')
+
+
+class TestBatchLogging:
+    """Test suite for batch_log_items and the *_batch handlers"""
+
+    @pytest.fixture
+    def test_workspace(self):
+        """Create a temporary workspace for testing"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace_path = Path(temp_dir) / "test_workspace"
+            workspace_path.mkdir()
+            yield str(workspace_path)
+
+    def test_batch_log_items_decisions(self, test_workspace):
+        """All-valid batch logs every item and reports success"""
+        args = models.BatchLogItemsArgs(
+            workspace_id=test_workspace,
+            item_type="decision",
+            items=[
+                {"summary": "Use FastMCP for the server layer"},
+                {"summary": "Cache embeddings in SQLite", "rationale": "Avoid re-encoding unchanged text"}
+            ]
+        )
+        result = mcp_handlers.handle_batch_log_items(args)
+
+        assert result["status"] == "success"
+        assert len(result["successful_items"]) == 2
+        assert result["failed_items"] == []
+
+        stored = mcp_handlers.handle_get_decisions(
+            models.GetDecisionsArgs(workspace_id=test_workspace)
+        )
+        assert {d["summary"] for d in stored} == {
+            "Use FastMCP for the server layer",
+            "Cache embeddings in SQLite"
+        }
+
+    def test_batch_log_items_skips_duplicates(self, test_workspace):
+        """Identical items in one batch are logged once and counted as duplicates"""
+        args = models.BatchLogItemsArgs(
+            workspace_id=test_workspace,
+            item_type="decision",
+            items=[
+                {"summary": "Single decision"},
+                {"summary": "Single decision"}
+            ]
+        )
+        result = mcp_handlers.handle_batch_log_items(args)
+
+        assert result["status"] == "success"
+        assert len(result["successful_items"]) == 1
+        assert "1 duplicates skipped" in result["message"]
+
+    def test_batch_log_items_partial_failure(self, test_workspace):
+        """Invalid items are reported by original index; valid ones still land"""
+        args = models.BatchLogItemsArgs(
+            workspace_id=test_workspace,
+            item_type="progress_entry",
+            items=[
+                {"status": "TODO", "description": "Valid entry"},
+                {"status": "DONE"},  # missing required description
+                {"status": "IN_PROGRESS", "description": "Another valid entry"}
+            ]
+        )
+        result = mcp_handlers.handle_batch_log_items(args)
+
+        assert result["status"] == "partial_success"
+        assert len(result["successful_items"]) == 2
+        assert len(result["failed_items"]) == 1
+        assert result["failed_items"][0]["item_index"] == 1
+
+    def test_batch_log_items_unsupported_type(self, test_workspace):
+        args = models.BatchLogItemsArgs(
+            workspace_id=test_workspace,
+            item_type="nonexistent_type",
+            items=[{"summary": "irrelevant"}]
+        )
+        with pytest.raises(ToolArgumentError):
+            mcp_handlers.handle_batch_log_items(args)
+
+    def test_log_decisions_batch_all_or_nothing(self, test_workspace):
+        """One invalid entry rejects the whole log_decisions_batch call"""
+        args = models.LogDecisionsBatchArgs(
+            workspace_id=test_workspace,
+            items=[
+                {"summary": "Valid decision"},
+                {"rationale": "No summary at all"}
+            ]
+        )
+        with pytest.raises(ToolArgumentError):
+            mcp_handlers.handle_log_decisions_batch(args)
+
+        stored = mcp_handlers.handle_get_decisions(
+            models.GetDecisionsArgs(workspace_id=test_workspace)
+        )
+        assert stored == []
+
+
+class TestBatchDeleteByIds:
+    """Test suite for the batch_delete_by_ids tool"""
+
+    @pytest.fixture
+    def test_workspace(self):
+        """Create a temporary workspace for testing"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            workspace_path = Path(temp_dir) / "test_workspace"
+            workspace_path.mkdir()
+            yield str(workspace_path)
+
+    def test_delete_decisions_by_ids(self, test_workspace):
+        """Deletes existing IDs, reports missing ones, leaves the rest"""
+        logged = mcp_handlers.handle_log_decisions_batch(
+            models.LogDecisionsBatchArgs(
+                workspace_id=test_workspace,
+                items=[
+                    {"summary": "Keep this decision"},
+                    {"summary": "Delete this decision"},
+                    {"summary": "Delete this one too"}
+                ]
+            )
+        )
+        ids_by_summary = {d["summary"]: d["id"] for d in logged}
+        to_delete = [
+            ids_by_summary["Delete this decision"],
+            ids_by_summary["Delete this one too"],
+            99999  # never existed
+        ]
+
+        result = mcp_handlers.handle_batch_delete_by_ids(
+            models.BatchDeleteByIdsArgs(
+                workspace_id=test_workspace,
+                item_type="decision",
+                ids=to_delete
+            )
+        )
+
+        assert result["status"] in ("success", "partial_success")
+        assert sorted(result["deleted_ids"]) == sorted(to_delete[:2])
+        assert result["not_found_ids"] == [99999]
+
+        remaining = mcp_handlers.handle_get_decisions(
+            models.GetDecisionsArgs(workspace_id=test_workspace)
+        )
+        assert [d["summary"] for d in remaining] == ["Keep this decision"]
+
+    def test_delete_no_matching_ids(self, test_workspace):
+        result = mcp_handlers.handle_batch_delete_by_ids(
+            models.BatchDeleteByIdsArgs(
+                workspace_id=test_workspace,
+                item_type="decision",
+                ids=[12345]
+            )
+        )
+        assert result["status"] == "success"
+        assert result["deleted_ids"] == []
+        assert result["not_found_ids"] == [12345]
+
+    def test_delete_unsupported_item_type(self, test_workspace):
+        with pytest.raises(ToolArgumentError):
+            mcp_handlers.handle_batch_delete_by_ids(
+                models.BatchDeleteByIdsArgs(
+                    workspace_id=test_workspace,
+                    item_type="progress_entry",
+                    ids=[1]
+                )
+            )